@@ -7,3 +7,9 @@ import os
 # which rely on this directory path expect said directory to contain a data subdirectory and a config 
 # subdirectory at the very least. 
 ROOT_DIR = os.path.realpath(os.path.join(os.path.dirname(__file__), '..', '..', '..'))
+
+# Matching features of the chatbot's UI (see prog4fuzzy.MatchOptions), rebuilt whenever the known queries change. They only
+# narrow down which known queries are scored (scoring every one of them when they can't), which speeds matching up on large
+# sets of known queries; set them to False to always score every known query.
+MATCH_WITH_TRIE_INDEX = True    # Only score the known queries within a few character edits of a question, if there are any
+MATCH_WITH_HIERARCHY = True     # Score the known queries of the closest categories first, then the others only if none was close
@@ -10,36 +10,314 @@
 More specific container types are included for use in the District chatbot which have their
 own unique keyword dictionaries."""
 # ---------------------------------------------------------------------------
-import collections
+import collections.abc
 import re
+import time
 # ---------------------------------------------------------------------------
 
+UNRETRIEVED = "UNRETRIEVED"     # The value of a field extraction ran out of time for (or of an unknown search term)
+
+# The fields of a representative's profile: (field, section of the page it's found in, pattern, most matches kept or None for all).
+# The patterns run over the structured text of the page (see pagetext), in which every block of text is a line of its own: a line
+# starting with '- ' is a list item. Every pattern runs in linear time, even on pages laid out differently than expected: a run of
+# characters is only ever followed by a character which can't be part of it (so backing off the run fails at once), and the patterns
+# which would otherwise rescan a whole run from each of its positions only start at the beginning of a line
+_PROFILE_FIELDS = [
+    ('street', 'contact', r'^\d{1,3}[\w!\ ]{1,3}?\ [\w\ ]*', 2),                      # Address streets
+    ('cityzip', 'contact', r'^[a-zA-Z-.\ ]+\ [0-9]{5}', 2),                               # Address cities and zip codes
+    ('name', 'contact', r'Representative\ [\w]+\ [\w].?\ [\w]+', 1),                      # Name
+    ('phone', 'contact', r'\([0-9]{3}\)\ [0-9]{3}-[0-9]{4}', 1),                           # Phone
+    ('education', 'personal', r'(?<=^-\ )[\w\ ]+,\ [\w.]+,\ [0-9]{4}', None),          # University, degree, year
+    ('birthday', 'personal', r'Born\ [\w]+\ [0-9]{1,2}', 1),                               # Birthday
+    ('parents', 'personal', r'(?:Son|Daughter)\ [\w .,-]+', 1),                           # Parents
+    ('children', 'personal', r'[0-9]{0,2}\ child[\w]*,\ [\w.,\ -]*', 1),                  # Children
+    ('former', 'personal', r'Former[\w\ ,]*', 1),                                        # Former jobs/roles
+    ('religion', 'personal', r'(?<=^-\ )[\w\ .,-]*?Church[\w\ .,-]*', 1),                  # Religion
+    ('service', 'service', r'(?<=^-\ )[\w\ .,\'\"-]+', None),                             # Service in public office
+    ('district', 'district', r'District\ [0-9]+', 1),                                    # District number/name
+    ('region', 'district', r'(?<=\ -\ )[^\n-]*?Count[\w]{1,3}', 1),                        # Region
+]
+PROFILE_FIELD_NAMES = tuple(field for field, _, _, _ in _PROFILE_FIELDS)     # Every field, in the order extract_fields gives them
+_FIELD_LIMITS = {field: limit for field, _, _, limit in _PROFILE_FIELDS}
+_SECTION_FIELDS = {section: [field for field, field_section, _, _ in _PROFILE_FIELDS if field_section == section]
+                   for _, section, _, _ in _PROFILE_FIELDS}
+
+# Combined scanners of sets of fields, compiled on first use (see _get_scanner)
+_scanners = {}
+
+
+def _get_scanner(fields):
+    """Returns a scanner combining the patterns of the given (frozen) set
+    of fields. The scanner only stops at positions where at least one of
+    the fields matches (its first lookahead), and there captures the match
+    of every field starting at that position (its optional named
+    lookaheads)."""
+    scanner = _scanners.get(fields)
+    if scanner is None:
+        patterns = [(field, pattern) for field, _, pattern, _ in _PROFILE_FIELDS if field in fields]
+        scanner = _scanners[fields] = re.compile(
+            '(?=' + '|'.join(f'(?:{pattern})' for _, pattern in patterns) + ')' +
+            ''.join(f'(?=(?P<{field}>{pattern})?)' for field, pattern in patterns), re.MULTILINE)
+    return scanner
+
+
+def extract_fields(data, sections=None, time_budget=None, fields=None):
+    """Extracts every profile field from data in a single left-to-right
+    pass, returning a dictionary of each field to the list of its matches
+    (the same ones re.findall would give, up to the field's limit).
+
+    sections optionally maps section names ('contact', 'personal',
+    'service', 'district') to (start, end) spans of data; each field is then
+    only taken from within its own section's span (a match running past
+    the span's end doesn't count), and the fields of sections not given
+    aren't extracted at all. By default every field is taken from the whole
+    of data. fields optionally names the only fields to extract (and to
+    give in the dictionary); by default every field is. Each stretch of data between the sections' boundaries is
+    scanned once, with a single scanner combining the fields of the
+    sections covering it; stretches no section covers are skipped.
+
+    An optional time_budget (in seconds) bounds the whole extraction. The
+    fields which aren't complete once it runs out are given as None rather
+    than as a list (and containers show them as UNRETRIEVED). The budget is
+    checked between the stretches and the places the scanner stops at."""
+    deadline = None if time_budget is None else time.perf_counter() + time_budget
+    if sections is None:
+        sections = {section: (0, len(data)) for _, section, _, _ in _PROFILE_FIELDS}
+    found = {field: [] for field in PROFILE_FIELD_NAMES if fields is None or field in fields}
+    spans = {field: sections[section] for field, section, _, _ in _PROFILE_FIELDS     # Empty spans have nothing to scan
+             if field in found and section in sections and sections[section][0] < sections[section][1]}
+    resume = dict.fromkeys(spans, 0)    # As with findall, a field's matches don't overlap
+    boundaries = sorted({offset for span in spans.values() for offset in span})
+
+    out_of_time = False
+    for stretch_start, stretch_end in zip(boundaries, boundaries[1:]):
+        if deadline is not None and time.perf_counter() >= deadline:
+            break
+        active = [field for field, (start, end) in spans.items() if start <= stretch_start and stretch_end <= end]
+        # Matches may run past the stretch, but not past the span of the field they're for
+        scan_end = max((spans[field][1] for field in active), default=stretch_end)
+        for match in _get_scanner(frozenset(active)).finditer(data, stretch_start, scan_end) if active else ():
+            position = match.start()
+            if position >= stretch_end:
+                break
+            for field in list(active):
+                match_end = match.end(field)
+                if match_end == -1 or position < resume[field] or match_end > spans[field][1]:
+                    continue
+                found[field].append(match.group(field))
+                resume[field] = max(match_end, position + 1)
+                if len(found[field]) == _FIELD_LIMITS[field]:   # Nothing more is needed of this field
+                    active.remove(field)
+                    del spans[field]
+            if not active:  # Every field of this stretch is complete; no need to scan the rest of it
+                break
+            if deadline is not None and time.perf_counter() >= deadline:
+                out_of_time = True
+                break
+        if out_of_time:
+            break
+        for field in [field for field, (_, end) in spans.items() if end <= stretch_end]:
+            del spans[field]    # The field's whole span has been scanned
+
+    for field in spans:     # Only fields extraction ran out of time for are left
+        found[field] = None
+    return found
+
+
+def _first(fields, field):
+    """Returns the first match of the field, None if there is none, or
+    UNRETRIEVED if extraction ran out of time before finding it."""
+    matches = fields[field]
+    if matches is None:
+        return UNRETRIEVED
+    return matches[0] if matches else None
+
+
+class _Record():
+    """ An immutable record: its values are set once, when it's created, and
+    held in slots rather than in a per-instance dictionary, keeping records
+    small and safe to share between threads. Records pickle by value, so they
+    can also be sent to other processes."""
+    __slots__ = ()
+
+    def __init__(self, *values):
+        for slot, value in zip(self.__slots__, values):
+            object.__setattr__(self, slot, value)
+
+    def __setattr__(self, name, value):
+        raise AttributeError(f"{type(self).__name__} is immutable")
+
+    def __delattr__(self, name):
+        raise AttributeError(f"{type(self).__name__} is immutable")
+
+    def __reduce__(self):
+        return type(self), tuple(getattr(self, slot) for slot in self.__slots__)
+
+    def __eq__(self, other):
+        if type(other) is not type(self):
+            return NotImplemented
+        return all(getattr(self, slot) == getattr(other, slot) for slot in self.__slots__)
+
+    def __hash__(self):
+        return hash(tuple(getattr(self, slot) for slot in self.__slots__))
+
+    def __repr__(self):
+        values = ", ".join(f"{slot}={getattr(self, slot)!r}" for slot in self.__slots__)
+        return f"{type(self).__name__}({values})"
+
+
+class _SectionRecord(_Record, collections.abc.Mapping):
+    """ An immutable record of the fields of a section, which reads as the
+    (read-only) keyword dictionary of its InfoContainer: each of its labels
+    maps to the value of the slot at the same position."""
+    __slots__ = ()
+    _labels = ()
+
+    def __getitem__(self, label):
+        try:
+            return getattr(self, self.__slots__[self._labels.index(label)])
+        except ValueError:
+            raise KeyError(label) from None
+
+    def __iter__(self):
+        return iter(self._labels)
+
+    def __len__(self):
+        return len(self._labels)
+
+    __eq__ = _Record.__eq__     # Compare as records, not as mappings
+    __hash__ = _Record.__hash__
+
+
+class _LazyField():
+    """ A field of a specialized InfoContainer, declared by decorating the
+    method computing it. The field is only computed when first read, and is
+    then memoized in the container's slot of the same name prefixed with an
+    underscore, so reading it again is free. A field extraction ran out of
+    time for (UNRETRIEVED) isn't memoized, so it's tried again when next
+    read."""
+
+    def __init__(self, compute):
+        self._compute = compute
+        self.__doc__ = compute.__doc__
+
+    def __set_name__(self, owner, name):
+        self._slot = '_' + name
+
+    def __get__(self, container, owner=None):
+        if container is None:
+            return self
+        try:
+            return getattr(container, self._slot)
+        except AttributeError:  # Not computed yet
+            value = self._compute(container)
+            if value != UNRETRIEVED:
+                setattr(container, self._slot, value)
+            return value
+
+
+class _FieldView(collections.abc.Mapping):
+    """ The keyword dictionary of a specialized InfoContainer: a read-only
+    view of the container's fields, labelled as in its record type, each
+    computed only when it's looked up."""
+    __slots__ = ('_container',)
+
+    def __init__(self, container):
+        self._container = container
+
+    def __getitem__(self, label):
+        record_type = self._container._record_type
+        try:
+            slot = record_type.__slots__[record_type._labels.index(label)]
+        except ValueError:
+            raise KeyError(label) from None
+        return getattr(self._container, slot)
+
+    def __iter__(self):
+        return iter(self._container._record_type._labels)
+
+    def __len__(self):
+        return len(self._container._record_type._labels)
+
 
 class InfoContainer():
     """ A container for storing string data and searching it based on its keyword
-    dictionary.
+    dictionary. The container may be given a span of a larger string, in which
+    case it keeps a reference to that string and the span's offsets rather than
+    a copy of the span.
     """
-    _data = None
-    _keyword_dict = None
-
-    def __init__(self, data, keyword_dict={}):
-        """Creates a new InfoContainer with the given data.
-        Non-string data results in error. Providing a keyword
-        dictionary is optional; specialized InfoContainers provide
-        their own dictionaries."""
-        self.set_data(data)
-        self.set_dict(keyword_dict)
+    __slots__ = ('_data', '_start', '_end', '_dict', '_fields', '_time_budget')
+    _section = None     # The section of the page whose fields specialized containers hold
+    _record_type = None     # The record of those fields, whose slots name the container's lazy fields
+
+    def __init__(self, data, keyword_dict=None, start=0, end=None, fields=None, time_budget=None):
+        """Creates a new InfoContainer with the given data, or with
+        the span data[start:end] of it. Non-string data results in
+        error. Providing a keyword dictionary is optional; specialized
+        InfoContainers provide their own dictionaries, whose values are
+        only extracted from the data when first looked up. fields
+        optionally gives fields already extracted from the data (by
+        extract_fields), and time_budget bounds each extraction of the
+        others."""
+        self.set_data(data, start, end)
+        if fields is not None:
+            self._fields = fields
+        self._time_budget = time_budget
+        if keyword_dict is None and self._record_type is not None:
+            self._dict = None   # The container's fields are its dictionary (see get_dict)
+        else:
+            self.set_dict({} if keyword_dict is None else keyword_dict)
 
     def get_raw_data(self):
-        return self._data
-
-    def set_data(self, data):
+        """Returns the container's data (a copy of its span, if it
+        was given one)."""
+        if self._start == 0 and self._end == len(self._data):
+            return self._data
+        return self._data[self._start:self._end]
+
+    def get_span(self):
+        """Returns the (start, end) offsets of the container's data
+        within the string it was given."""
+        return self._start, self._end
+
+    def set_data(self, data, start=0, end=None):
         if isinstance(data, str):
             self._data = data
+            self._start = start
+            self._end = len(data) if end is None else end
         else:
             raise TypeError("Data in InfoContainer must be a string")
 
+        # Forget whatever was extracted from the previous data
+        self._fields = {}
+        for slot in self._record_type.__slots__ if self._record_type is not None else ():
+            try:
+                delattr(self, '_' + slot)
+            except AttributeError:
+                pass
+
+    def _get_fields(self, *names):
+        """Returns the dictionary of the fields extracted so far (as by
+        extract_fields), first extracting those of the given fields which
+        aren't yet (or which extraction ran out of time for, unless the
+        container has no data to extract them from), in a single pass over
+        the container's section."""
+        fields = self._fields
+        missing = [name for name in names if name not in fields or (fields[name] is None and self._start < self._end)]
+        if missing:
+            # A new dictionary rather than an update, as the previous one may be shared with other containers
+            fields = {**fields, **extract_fields(self._data, {self._section: self.get_span()}, self._time_budget, missing)}
+            self._fields = fields
+        return fields
+
+    def _first_match(self, field):
+        """Returns the first match of the field (see _first), extracting
+        it if it isn't yet."""
+        return _first(self._get_fields(field), field)
+
     def get_dict(self):
+        if self._dict is None:
+            return _FieldView(self)
         return self._dict
 
     def set_dict(self, keyword_dict):
@@ -47,24 +325,31 @@ class InfoContainer():
         Passing non-dictionary types results in error."""
 
         # If dict is a dictionary type, carry on
-        if isinstance(keyword_dict, collections.Mapping):
+        if isinstance(keyword_dict, collections.abc.Mapping):
             self._dict = keyword_dict
         else:
             raise TypeError("Dictionary in InfoContainer must be a valid dictionary type")
 
+    def get_record(self):
+        """Returns the immutable record of every field of a specialized
+        container (extracting those which aren't yet)."""
+        self._get_fields(*_SECTION_FIELDS[self._section])
+        return self._record_type(*(getattr(self, slot) for slot in self._record_type.__slots__))
+
     def search(self, term):
         """Searches the container's data for the relevant
         search term. If the term is in the InfoContainer's
-        keyword dictionary, the relevant data will be provided."""
+        keyword dictionary, the relevant data will be provided.
+        Only the field searched for is extracted."""
 
         if isinstance(term, str):
              # Check to see if dictionary value is a string or object with EAFP principle (if the key exists)
             try:
-                return self._dict[term.lower()].center(0)
+                return self.get_dict()[term.lower()].center(0)
             except AttributeError:  # If the key exists but the value can't handle .center(), it's not a string
-                return self._dict[term.lower()].__str__()   # Return the object's summary string
+                return self.get_dict()[term.lower()].__str__()   # Return the object's summary string
             except KeyError:
-                return "UNRETRIEVED"
+                return UNRETRIEVED
         else:
             raise TypeError("Term must be a string")
 
@@ -72,6 +357,8 @@ class InfoContainer():
         """Returns a formatted string of all the information 
         found in the container's dictionary."""
 
+        if self._section is not None:   # Extract the fields not extracted yet in a single pass, rather than one by one
+            self._get_fields(*_SECTION_FIELDS[self._section])
         output = ""
         for entry in self.get_dict():
             output += f"{entry.title()}: {self.get_dict()[entry]}\n"
@@ -79,9 +366,8 @@ class InfoContainer():
 
 # Classes for Contact Info
 
-class _Address():
-    street = None
-    cityzip = None
+class _Address(_Record):
+    __slots__ = ('street', 'cityzip')
 
     # Prints a string representation of the Address
     def __str__(self):
@@ -91,182 +377,154 @@ class _Address():
         return output
 
 
+class _ContactInfo(_SectionRecord):
+    __slots__ = ('name', 'home_address', 'columbia_address', 'phone')
+    _labels = ("name", "home address", "columbia address", "phone")
+
+
 class ContactInfoContainer(InfoContainer):
     """ Specialized Info Container for Contact Info."""
 
-    _home_address = _Address()
-    _columbia_address = _Address()
-    _contact_info_dict = {
-        "name": None,
-        "home address": None,
-        "columbia address": None,
-        "phone": None
-    }
+    __slots__ = ('_name', '_home_address', '_columbia_address', '_phone')
+    _section = "contact"
+    _record_type = _ContactInfo
 
-    def __init__(self, data):
-        super().__init__(data)              # Store the data
-        self._build_contact_dictionary()    # Build relevant contact info dictionary values from supplied data
+    def __init__(self, data, start=0, end=None, fields=None, time_budget=None):
+        super().__init__(data, start=start, end=end, fields=fields, time_budget=time_budget)    # Store the data
 
-    def _build_contact_dictionary(self):
-        try:
-            # Since the Columbia address appears first in the html, it's possible
-            # to determine which of the two results belongs to which address
-            m = re.compile('(?<=\>)\d{1,3}[\w!\ ]{1,3}?\ [\w\ ]*')
-            address_streets = m.findall(self.get_raw_data())
-            m = re.compile('(?<=\>)[a-zA-Z-.\ ]+\ [0-9]{5}')
-            address_cityzips = m.findall(self.get_raw_data())
-
-            # Set address data
-            self._columbia_address.street = address_streets[0]
-            self._columbia_address.cityzip = address_cityzips[0]
-            self._home_address.street = address_streets[1]
-            self._home_address.cityzip = address_cityzips[1]
-        except IndexError:  # If no results were found, just keep the entries as None
-            pass
+    @_LazyField
+    def name(self):
+        return self._first_match('name')
 
-        # Update dictionary values
-        try:
-            m = re.compile('Representative\ [\w]+\ [\w].?\ [\w]+')                  # Name
-            self._contact_info_dict['name'] = m.findall(self.get_raw_data())[0]
-        except IndexError:  # If no results were found, keep entry as None
-            pass
-        
-        self._contact_info_dict['home address'] = self._home_address            # Addresses
-        self._contact_info_dict['columbia address'] = self._columbia_address
+    @_LazyField
+    def home_address(self):
+        return self._address(1)
 
+    @_LazyField
+    def columbia_address(self):
+        return self._address(0)
+
+    @_LazyField
+    def phone(self):
+        return self._first_match('phone')
+
+    def _address(self, index):
+        fields = self._get_fields('street', 'cityzip')
+        address_streets = fields['street']
+        address_cityzips = fields['cityzip']
+        if address_streets is None or address_cityzips is None:     # If extraction ran out of time, the addresses are unretrieved
+            return UNRETRIEVED
+
+        # Since the Columbia address appears first in the html, it's possible
+        # to determine which of the two results belongs to which address.
+        # Parts which weren't found are kept as None
+        parts = [None] * 4
         try:
-            m = re.compile('(?<=>\ )\([0-9]{3}\)\ [0-9]{3}-[0-9]{4}')               # Phone
-            self._contact_info_dict['phone'] = m.findall(self.get_raw_data())[0]
-        except IndexError:  # If no results were found, keep entry as None
+            parts[0] = address_streets[0]
+            parts[1] = address_cityzips[0]
+            parts[2] = address_streets[1]
+            parts[3] = address_cityzips[1]
+        except IndexError:
             pass
-        
-        # Lastly, set this special dictionary to be the current dictionary
-        self.set_dict(self._contact_info_dict)
+        return _Address(parts[2 * index], parts[2 * index + 1])
 
 
 # Classes for Personal Information
 
-class _Education():
-    _college_list = []
+class _Education(_Record):
+    __slots__ = ('colleges',)
 
     # Prints a string representation of the Education
     def __str__(self):
-        return "; ".join(self._college_list)
+        return "; ".join(self.colleges)
+
+
+class _PersonalInfo(_SectionRecord):
+    __slots__ = ('birthday', 'parents', 'education', 'children', 'former', 'religion')
+    _labels = ("birthday", "parents", "education", "children", "former", "religion")
 
 
 class PersonalInfoContainer(InfoContainer):
     """ Specialized Info Container for Personal Info."""
 
-    _edu = _Education()
-    _personal_info_dict = {
-        "birthday": None,
-        "parents": None,
-        "education": None,
-        "children": None,
-        "former": None,
-        "religion": None,
-    }
-
-    def __init__(self, data):
-        super().__init__(data)              # Store the data
-        self._build_personal_dictionary()    # Build relevant contact info dictionary values from supplied data
-
-    def _build_personal_dictionary(self):
-        # Find Education information, if available
-        try:
-            m = re.compile('[\w\ ]+,\ [\w.]+,\ [0-9]{4}')   # University, degree, year
-            self._edu._college_list = []    # Clear college list to prevent repeated data on future calls
-            for match in m.findall(self.get_raw_data()):
-                self._edu._college_list.append(match)
-        except IndexError:  # If no results were found, just keep the entries as None
-            pass
+    __slots__ = ('_birthday', '_parents', '_education', '_children', '_former', '_religion')
+    _section = "personal"
+    _record_type = _PersonalInfo
 
-        # Update dictionary values
-        try:
-            m = re.compile('Born\ [\w]+\ [0-9]{1,2}')                                     # Birthday
-            self._personal_info_dict['birthday'] = m.findall(self.get_raw_data())[0]
-        except IndexError:  # If no results were found, keep entry as None
-            pass
-        
-        try:
-            m = re.compile('(?:Son|Daughter)\ [\w .,-]+')                               # Parents
-            self._personal_info_dict['parents'] = m.findall(self.get_raw_data())[0] 
-        except IndexError:  # If no results were found, keep entry as None
-            pass
-        
-        self._personal_info_dict['education'] = self._edu                            # Education
+    def __init__(self, data, start=0, end=None, fields=None, time_budget=None):
+        super().__init__(data, start=start, end=end, fields=fields, time_budget=time_budget)    # Store the data
 
-        try:
-            m = re.compile('[0-9]{0,2}\ child[\w]*,\ [\w.,\ -]*')                   # Children
-            self._personal_info_dict['children'] = m.findall(self.get_raw_data())[0]
-        except IndexError:  # If no results were found, keep entry as None
-            pass
+    @_LazyField
+    def birthday(self):
+        return self._first_match('birthday')
 
-        try:
-            m = re.compile('Former[\w\ ,]*')                                        # Former jobs/roles
-            self._personal_info_dict['former'] = m.findall(self.get_raw_data())[0]
-        except IndexError:  # If no results were found, keep entry as None
-            pass
+    @_LazyField
+    def parents(self):
+        return self._first_match('parents')
 
-        try:
-            m = re.compile('[\w\ .,-]*Church[\w\ .,-]*')                                        # Religion
-            self._personal_info_dict['religion'] = m.findall(self.get_raw_data())[0]
-        except IndexError:  # If no results were found, keep entry as None
-            pass
-        
-        # Lastly, set this special dictionary to be the current dictionary
-        self.set_dict(self._personal_info_dict)
+    @_LazyField
+    def education(self):
+        colleges = self._get_fields('education')['education']
+        return _Education(tuple(colleges)) if colleges is not None else UNRETRIEVED
+
+    @_LazyField
+    def children(self):
+        return self._first_match('children')
+
+    @_LazyField
+    def former(self):
+        return self._first_match('former')
+
+    @_LazyField
+    def religion(self):
+        return self._first_match('religion')
+
+
+class _ServiceInfo(_SectionRecord):
+    __slots__ = ('service',)
+    _labels = ("service",)
 
 
 class ServiceInfoContainer(InfoContainer):
     """ Specialized Info Container for Service Info."""
 
-    _service_info_dict = {
-        "service":None
-    }
+    __slots__ = ('_service',)
+    _section = "service"
+    _record_type = _ServiceInfo
 
-    def __init__(self, data):
-        super().__init__(data)              # Store the data
-        self._build_service_dictionary()    # Build relevant contact info dictionary values from supplied data
+    def __init__(self, data, start=0, end=None, fields=None, time_budget=None):
+        super().__init__(data, start=start, end=end, fields=fields, time_budget=time_budget)    # Store the data
+
+    @_LazyField
+    def service(self):
+        service = self._get_fields('service')['service']
+        if service is None:     # If extraction ran out of time, the service is unretrieved
+            return UNRETRIEVED
+        return '\n'.join(service)
 
-    def _build_service_dictionary(self):
-        # Find service info
-        try:
-            m = re.compile('(?<=list-style-type:square;\" >)[\w\ .,\'\"-]+')   # Service in public office
-            self._service_info_dict['service'] = '\n'.join(m.findall(self.get_raw_data()))
-        except:  # If an error occurs, just keep the entries as None
-            pass
 
-        # Lastly, set this special dictionary to be the current dictionary
-        self.set_dict(self._service_info_dict)
+class _DistrictInfo(_SectionRecord):
+    __slots__ = ('district_name', 'region')
+    _labels = ("district name", "region")
 
 
 class DistrictInfoContainer(InfoContainer):
     """ Specialized Info Container for District Info."""
 
-    _district_info_dict = {
-        "district name":None,
-        "region":None
-    }
+    __slots__ = ('_district_name', '_region')
+    _section = "district"
+    _record_type = _DistrictInfo
 
-    def __init__(self, data):
-        super().__init__(data)              # Store the data
-        self._build_district_dictionary()    # Build relevant contact info dictionary values from supplied data
+    def __init__(self, data, start=0, end=None, fields=None, time_budget=None):
+        super().__init__(data, start=start, end=end, fields=fields, time_budget=time_budget)    # Store the data
 
-    def _build_district_dictionary(self):
-        # Find district info
-        try:
-            m = re.compile('District\ [0-9]+')                           # Number/Name
-            self._district_info_dict['district name'] = m.findall(self.get_raw_data())[0]
-        except IndexError:  # If no results were found, keep entry as None
-            pass
-
-        try:
-            m = re.compile('(?<=x;">)(.*)Count[\w]{1,3}')                           # Region
-            # Since &amp; is used for '&', replace it
-            self._district_info_dict['region'] = m.findall(self.get_raw_data())[0].replace('&amp;','&') 
-        except IndexError:  # If no results were found, keep entry as None
-            pass
+    @_LazyField
+    def district_name(self):
+        return self._first_match('district')
 
-        # Lastly, set this special dictionary to be the current dictionary
-        self.set_dict(self._district_info_dict)
+    @_LazyField
+    def region(self):
+        region = self._first_match('region')
+        if region is not None and region != UNRETRIEVED:
+            region = region[:region.rfind('Count')]     # Keep what's before the "Counties" ending the match
+        return region
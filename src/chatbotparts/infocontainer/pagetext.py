@@ -0,0 +1,92 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+#----------------------------------------------------------------------------
+# Created By  : Zt572
+# Created Date: Oct 2026
+# version ='1.0'
+# Copyright Oct 2026
+# ---------------------------------------------------------------------------
+""" Converts a representative's page from html to the structured plain text the profile fields are extracted from.
+Markup, inline styles and scripts are dropped and entities are decoded (as by html.unescape), leaving one line per
+block of text with its structure marked at the start of the line:
+
+    # Representative Russell L. Ott        the page's title (its bar header)
+    ## Personal Information                a section heading
+    - Born March 26                        a list item
+    Columbia 29201                         any other block of text (or line of one broken by <br>)
+
+Whitespace within a line is collapsed, and blank lines are left out."""
+# ---------------------------------------------------------------------------
+import re
+from html.parser import HTMLParser
+# ---------------------------------------------------------------------------
+
+# Tags starting (and ending) a line of text
+_BLOCK_TAGS = {'address', 'blockquote', 'br', 'dd', 'div', 'dl', 'dt', 'form', 'h1', 'h2', 'h3', 'h4', 'h5', 'h6', 'hr',
+               'li', 'ol', 'p', 'table', 'td', 'th', 'tr', 'ul'}
+_HEADING_TAGS = {'h1', 'h2', 'h3', 'h4', 'h5', 'h6'}
+# Tags whose contents aren't shown as text on the page
+_HIDDEN_TAGS = {'script', 'style', 'select', 'noscript', 'title'}
+# A tag or comment of html, which the structured text never has (its markup is dropped)
+_MARKUP = re.compile(r'</?[a-zA-Z][^<>]*>|<!--')
+
+
+class PageTextParser(HTMLParser):
+    """ Turns the html fed to it (all at once or in pieces) into lines of
+    structured text, handing each one to handle_line as soon as it ends. By
+    default the lines are collected in lines."""
+
+    def __init__(self):
+        super().__init__(convert_charrefs=True)     # Entities are decoded before reaching handle_data
+        self.lines = []
+        self._pieces = []
+        self._marker = ''
+        self._hidden = 0
+
+    def handle_line(self, line):
+        self.lines.append(line)
+
+    def _end_line(self):
+        text = ' '.join(''.join(self._pieces).split())  # Also turns &nbsp; into plain spaces
+        if text:
+            self.handle_line(self._marker + text)
+        self._pieces = []
+        self._marker = ''
+
+    def handle_starttag(self, tag, attrs):
+        if tag in _HIDDEN_TAGS:
+            self._hidden += 1
+        elif tag in _BLOCK_TAGS:
+            self._end_line()
+            if tag in _HEADING_TAGS:
+                self._marker = '# ' if 'barheader' in (dict(attrs).get('class') or '').split() else '## '
+            elif tag == 'li':
+                self._marker = '- '
+
+    def handle_endtag(self, tag):
+        if tag in _HIDDEN_TAGS:
+            self._hidden = max(self._hidden - 1, 0)
+        elif tag in _BLOCK_TAGS:
+            self._end_line()
+
+    def handle_data(self, data):
+        if not self._hidden:
+            self._pieces.append(data)
+
+    def close(self):
+        super().close()
+        self._end_line()
+
+
+def page_text(html):
+    """Returns the structured plain text of the page's html."""
+    parser = PageTextParser()
+    parser.feed(html)
+    parser.close()
+    return '\n'.join(parser.lines)
+
+
+def is_html(text):
+    """Returns whether the text is html rather than structured text: whether
+    any tag or comment is found in it."""
+    return _MARKUP.search(text) is not None
@@ -0,0 +1,332 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+#----------------------------------------------------------------------------
+# Created By  : Zt572
+# Created Date: Oct 2026
+# version ='1.0'
+# Copyright Oct 2026
+# ---------------------------------------------------------------------------
+""" A read-only store of the parsed profiles (see prog2.ProfileSnapshot) of many representatives in a single
+binary file, opened with mmap so that a process only reads the parts of it it uses, and so that any number of
+processes share one copy of it through the page cache. Answering for one district decodes nothing of the others.
+
+The file is laid out as (all integers little-endian, all strings UTF-8 in the string table):
+    header          magic, layout version, snapshot version, number of profiles, number of answer keys, and the
+                    offsets of the sections below
+    answer keys     (string) for each info type answered, e.g. "contact info:phone"
+    profiles        fixed-size records: district number, source hash, (string) of the source, of the text, and of
+                    the answer to every answer key
+    district index  (district number, profile) pairs, sorted by district number
+    name index      (string) of the normalized name (see name_key), profile, sorted by normalized name
+    string table    every distinct string, referenced above by its (offset, length) within the table
+
+Run as a standalone script to build a store from local copies of representatives' pages, or to query one."""
+# ---------------------------------------------------------------------------
+import argparse
+import collections.abc
+import mmap
+import os
+import re
+import struct
+# ---------------------------------------------------------------------------
+from chatbotparts import prog2
+from chatbotparts.infocontainer import infocontainer as ic
+# ---------------------------------------------------------------------------
+
+STORE_VERSION = 1
+
+_MAGIC = b'MRPS'
+# Header: magic, layout version, snapshot version, profile count, answer key count, and the offsets of the answer
+# keys, the profiles, the district index, the name index and the string table
+_HEADER = struct.Struct('<4sHHIIIIIII')
+_STRING = struct.Struct('<II')                  # (offset, length) within the string table
+_PROFILE = struct.Struct('<I32sIIII')           # District, source hash, source string, text string (answers follow)
+_DISTRICT_ENTRY = struct.Struct('<II')          # District, profile
+_NAME_ENTRY = struct.Struct('<III')             # Normalized name string, profile
+_NO_STRING = 0xFFFFFFFF                         # Offset of a missing string (None)
+_DISTRICT_NUMBER = re.compile('[0-9]+')
+
+
+def name_key(name):
+    """Returns the normalized form of a representative's name the name
+    index is sorted by: lowercased, whitespace collapsed, and without the
+    leading "Representative"."""
+    name = ' '.join(name.lower().split())
+    if name.startswith('representative '):
+        name = name[len('representative '):]
+    return name
+
+
+def _profile_keys(snapshot):
+    """Returns the district number (0 if unknown) and the name (None if
+    unknown) of the snapshot's representative."""
+    fields = snapshot.fields
+    if fields is None:
+        fields = ic.extract_fields(snapshot.text, prog2.split_sections(snapshot.text), fields=['name', 'district'])
+    districts, names = fields['district'], fields['name']   # None if extraction ran out of time
+    district = _DISTRICT_NUMBER.search(districts[0]) if districts else None
+    return int(district.group()) if district else 0, names[0] if names else None
+
+
+def write_store(path, snapshots):
+    """Writes the given profile snapshots into a store at path, replacing
+    it once the whole store is written. Returns the number of profiles
+    written.
+
+    Raises:
+        ValueError: If the snapshots aren't all of the current snapshot
+            version.
+    """
+    strings = {}    # String -> its (offset, length) in the table
+    table = []
+    table_size = 0
+
+    def intern(string):
+        nonlocal table_size
+        if string is None:
+            return _NO_STRING, 0
+        if string not in strings:
+            data = string.encode('utf-8')
+            strings[string] = (table_size, len(data))
+            table.append(data)
+            table_size += len(data)
+        return strings[string]
+
+    snapshots = list(snapshots)
+    keys = []
+    for snapshot in snapshots:
+        if snapshot.version != prog2.SNAPSHOT_VERSION:
+            raise ValueError(f"Profile snapshots must be of version {prog2.SNAPSHOT_VERSION} to be stored")
+        keys.extend(key for key in snapshot.answers if key not in keys)
+    answers = struct.Struct('<' + 'II' * len(keys))
+
+    key_section = b''.join(_STRING.pack(*intern(key)) for key in keys)
+    profile_section = []
+    district_entries = []
+    name_entries = []
+    for position, snapshot in enumerate(snapshots):
+        district, name = _profile_keys(snapshot)
+        profile_section.append(_PROFILE.pack(district, bytes.fromhex(snapshot.source_hash),
+                                             *intern(snapshot.source), *intern(snapshot.text)))
+        profile_section.append(answers.pack(*(part for key in keys for part in intern(snapshot.answers.get(key)))))
+        district_entries.append((district, position))
+        if name is not None:
+            name_entries.append((name_key(name), position))
+    district_section = b''.join(_DISTRICT_ENTRY.pack(*entry) for entry in sorted(district_entries))
+    name_section = b''.join(_NAME_ENTRY.pack(*intern(key), position) for key, position in sorted(name_entries))
+    profile_section = b''.join(profile_section)
+
+    keys_offset = _HEADER.size
+    profiles_offset = keys_offset + len(key_section)
+    districts_offset = profiles_offset + len(profile_section)
+    names_offset = districts_offset + len(district_section)
+    strings_offset = names_offset + len(name_section)
+    header = _HEADER.pack(_MAGIC, STORE_VERSION, prog2.SNAPSHOT_VERSION, len(snapshots), len(keys), keys_offset,
+                          profiles_offset, districts_offset, names_offset, strings_offset)
+
+    temp_path = path + '.tmp'
+    with open(temp_path, 'wb') as f:    # Write then rename so a reader never sees a partially written store
+        for section in (header, key_section, profile_section, district_section, name_section, *table):
+            f.write(section)
+    os.replace(temp_path, path)
+    return len(snapshots)
+
+
+class _StoredAnswers(collections.abc.Mapping):
+    """ The answers of a stored profile (info type -> answer), each only
+    decoded from the store when it's looked up."""
+    __slots__ = ('_store', '_profile')
+
+    def __init__(self, store, profile):
+        self._store = store
+        self._profile = profile
+
+    def __getitem__(self, key):
+        return self._store._answer(self._profile, self._store._key_positions[key])
+
+    def __contains__(self, key):
+        return key in self._store._key_positions
+
+    def __iter__(self):
+        return iter(self._store._key_positions)
+
+    def __len__(self):
+        return len(self._store._key_positions)
+
+
+class ProfileStore():
+    """ A profile store file opened with mmap. Profiles are looked up by
+    district number or by name with binary searches of the store's indexes,
+    and only the strings of what's asked for are decoded. Reading a store is
+    safe from any number of threads; close it (or use it as a context
+    manager) once done.
+    """
+
+    def __init__(self, path):
+        """Opens the store at path.
+
+        Raises:
+            ValueError: If the file isn't a profile store of the current
+                layout and snapshot versions.
+        """
+        with open(path, 'rb') as f:
+            try:
+                self._map = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            except ValueError:  # An empty file can't be mapped
+                raise ValueError(f"{path} is not a profile store") from None
+        try:
+            (magic, version, snapshot_version, self._count, key_count, keys_offset, self._profiles_offset,
+             self._districts_offset, self._names_offset, self._strings_offset) = _HEADER.unpack_from(self._map)
+        except struct.error:
+            magic = version = snapshot_version = None
+        if magic != _MAGIC or version != STORE_VERSION or snapshot_version != prog2.SNAPSHOT_VERSION:
+            self._map.close()
+            raise ValueError(f"{path} is not a profile store of version {STORE_VERSION} "
+                             f"(of snapshots of version {prog2.SNAPSHOT_VERSION})")
+        self._answers = struct.Struct('<' + 'II' * key_count)
+        self._profile_size = _PROFILE.size + self._answers.size
+        self._key_positions = {self._string(*_STRING.unpack_from(self._map, keys_offset + i * _STRING.size)): i
+                               for i in range(key_count)}
+
+    def close(self):
+        self._map.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def __len__(self):
+        return self._count
+
+    def _string(self, offset, length):
+        if offset == _NO_STRING:
+            return None
+        start = self._strings_offset + offset
+        return str(self._map[start:start + length], 'utf-8')
+
+    def _answer(self, profile, key_position):
+        answer_offset = self._profiles_offset + profile * self._profile_size + _PROFILE.size + key_position * _STRING.size
+        return self._string(*_STRING.unpack_from(self._map, answer_offset))
+
+    def find_district(self, district):
+        """Returns the position of the (first) profile of the given district
+        number, or -1 if there's none."""
+        low, high = 0, self._count
+        while low < high:
+            mid = (low + high) // 2
+            if _DISTRICT_ENTRY.unpack_from(self._map, self._districts_offset + mid * _DISTRICT_ENTRY.size)[0] < district:
+                low = mid + 1
+            else:
+                high = mid
+        if low < self._count:
+            entry_district, profile = _DISTRICT_ENTRY.unpack_from(self._map, self._districts_offset + low * _DISTRICT_ENTRY.size)
+            if entry_district == district:
+                return profile
+        return -1
+
+    def find_name(self, name):
+        """Returns the position of the (first) profile of the representative
+        of the given name (compared by name_key), or -1 if there's none."""
+        key = name_key(name)
+        names = (self._strings_offset - self._names_offset) // _NAME_ENTRY.size
+        low, high = 0, names
+        while low < high:
+            mid = (low + high) // 2
+            offset, length, _ = _NAME_ENTRY.unpack_from(self._map, self._names_offset + mid * _NAME_ENTRY.size)
+            if self._string(offset, length) < key:
+                low = mid + 1
+            else:
+                high = mid
+        if low < names:
+            offset, length, profile = _NAME_ENTRY.unpack_from(self._map, self._names_offset + low * _NAME_ENTRY.size)
+            if self._string(offset, length) == key:
+                return profile
+        return -1
+
+    def get_districts(self):
+        """Returns the district numbers of the stored profiles, in order."""
+        return [_DISTRICT_ENTRY.unpack_from(self._map, self._districts_offset + i * _DISTRICT_ENTRY.size)[0]
+                for i in range(self._count)]
+
+    def get_profile(self, profile):
+        """Returns the profile at the given position as a ProfileSnapshot,
+        which prog2.parse_info answers from like any other. Its answers are
+        only decoded when looked up, and its fields are extracted from its
+        text (if it was kept) when needed (they aren't stored)."""
+        if not 0 <= profile < self._count:
+            raise IndexError("ProfileStore index out of range")
+        offset = self._profiles_offset + profile * self._profile_size
+        _, hash_bytes, source_offset, source_length, text_offset, text_length = _PROFILE.unpack_from(self._map, offset)
+        return prog2.ProfileSnapshot(prog2.SNAPSHOT_VERSION, self._string(source_offset, source_length), hash_bytes.hex(),
+                                     self._string(text_offset, text_length), None, _StoredAnswers(self, profile))
+
+    def get_district(self, district):
+        """Returns the profile of the given district number, or None."""
+        profile = self.find_district(district)
+        return self.get_profile(profile) if profile >= 0 else None
+
+    def get_representative(self, name):
+        """Returns the profile of the representative of the given name, or None."""
+        profile = self.find_name(name)
+        return self.get_profile(profile) if profile >= 0 else None
+
+    def __repr__(self):
+        return f"{type(self).__name__}({self._count} profiles, {len(self._key_positions)} answers each)"
+
+
+def _load_snapshot(path):
+    """Returns the profile snapshot of a local copy of a representative's
+    page (html), or of a pickled snapshot (.pkl)."""
+    if path.endswith('.pkl'):
+        snapshot = prog2.read_snapshot(path)
+        if snapshot is None:
+            raise ValueError(f"{path} is not a profile snapshot of version {prog2.SNAPSHOT_VERSION}")
+        return snapshot
+    from chatbotparts import prog1     # Imported here, as prog1 fetches pages rather than storing them
+    return prog1.snapshot_local_copy(path, os.path.basename(path))
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Builds or queries a store of the profiles of many representatives', add_help=True,
+        formatter_class=argparse.ArgumentDefaultsHelpFormatter)
+    parser.add_argument('store', type=str,
+        help="the profile store file")
+    parser.add_argument('-b', '--build', nargs='+', metavar='PAGE',
+        help="build the store from these local copies of representatives' pages (html) or profile snapshots (.pkl)")
+    group = parser.add_mutually_exclusive_group()
+    group.add_argument('-d', '--district', type=int,
+        help="the district number of the representative to answer for")
+    group.add_argument('-n', '--name', type=str,
+        help="the name of the representative to answer for")
+    parser.add_argument('-t', '--type', type=str, default='all',
+        help="the type of information to retrieve (e.g. 'Contact Info:phone')")
+    args = parser.parse_args()
+
+    if args.build:
+        try:
+            count = write_store(args.store, (_load_snapshot(path) for path in args.build))
+        except (OSError, ValueError) as e:
+            print(f"~~Error: could not build the profile store: {e}~~")
+            exit(1)
+        print(f"Stored {count} profiles in {args.store}")
+
+    try:
+        store = ProfileStore(args.store)
+    except (OSError, ValueError) as e:
+        print(f"~~Error: could not open the profile store: {e}~~")
+        exit(1)
+    with store:
+        if args.district is None and args.name is None:
+            print(store)
+            return
+        profile = store.get_district(args.district) if args.district is not None else store.get_representative(args.name)
+        if profile is None:
+            print("No representative of that district or name is stored.")
+            return
+        print(prog2.parse_info(profile, args.type))
+
+# Driver for main
+if __name__ == "__main__":
+    main()
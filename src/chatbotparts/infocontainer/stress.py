@@ -0,0 +1,135 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+#----------------------------------------------------------------------------
+# Created By  : Zt572
+# Created Date: Oct 2026
+# version ='1.0'
+# Copyright Oct 2026
+# ---------------------------------------------------------------------------
+""" Stress harness for the profile field extraction of infocontainer. Times extract_fields on adversarial pages
+of growing size (long runs of text the field patterns could backtrack over, very long lines and list items) to
+check that extraction stays linear in the size of the page, and fuzzes it with randomly mutated copies of the
+stored page to check that it never fails nor overruns its time budget.
+
+Run it from the src directory with: python -m chatbotparts.infocontainer.stress"""
+# ---------------------------------------------------------------------------
+import argparse
+import random
+import time
+# ---------------------------------------------------------------------------
+from chatbotparts import prog2
+from chatbotparts.infocontainer import infocontainer as ic
+# ---------------------------------------------------------------------------
+
+# Headings of every section, laid out as in the structured text of the House's pages (see pagetext). The filler below
+# goes after each one, so that it's scanned for every field
+_HEADINGS = ['# Representative A B C\nDistrict 1\n', '## Personal Information\n', '## Committee Assignments\n',
+             '## Service In Public Office\n']
+
+# Filler repeated to the size of the page, each one built to make some field patterns backtrack
+_FILLERS = {
+    "word runs": "word ",                                   # One run of words without the comma or "Church" ending a match
+    "comma runs": "word, ",                                 # Education almost matching everywhere
+    "digit runs": "\n1 1 ",                                 # Streets and cities almost matching on every line
+    "unclosed regions": " - Calhoun ",                      # Regions without a "Counties"
+    "list items": "- item, item ",                          # One list item with education almost matching throughout
+    "short items": "\n- item",                              # Many list items, each one a service entry
+    "church runs": "Church ",                               # Religion matching from every position of a run
+}
+
+
+'''Returns an adversarial page of about the given number of characters, filled with the given filler.'''
+def adversarial_page(filler, size):
+    section = filler * max(size // len(_HEADINGS) // len(filler), 1)
+    return ''.join(heading + section for heading in _HEADINGS)
+
+'''Returns a copy of the page with some random mutations: chunks of it dropped, duplicated or moved, or random
+characters inserted.'''
+def mutate_page(page, rng, mutations=10):
+    alphabet = '<>";:, .-&#x0123456789abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ\n\n\n- ##'
+    for _ in range(mutations):
+        start = rng.randrange(len(page) + 1)
+        end = min(start + rng.randrange(200), len(page))
+        action = rng.randrange(4)
+        if action == 0:     # Drop a chunk
+            page = page[:start] + page[end:]
+        elif action == 1:   # Duplicate a chunk
+            page = page[:end] + page[start:end] + page[end:]
+        elif action == 2:   # Move a chunk elsewhere
+            chunk, page = page[start:end], page[:start] + page[end:]
+            position = rng.randrange(len(page) + 1)
+            page = page[:position] + chunk + page[position:]
+        else:               # Insert random characters
+            page = page[:start] + ''.join(rng.choice(alphabet) for _ in range(rng.randrange(1, 20))) + page[start:]
+    return page
+
+'''Returns the seconds spent extracting every field of the page (as parse_info does) and the number of fields left
+unretrieved.'''
+def time_extraction(page, time_budget=None):
+    start = time.perf_counter()
+    fields = ic.extract_fields(page, prog2.split_sections(page), time_budget)
+    seconds = time.perf_counter() - start
+    return seconds, sum(1 for matches in fields.values() if matches is None)
+
+'''Times extraction on every adversarial page, doubling its size from min_size up to max_size characters, and prints
+the seconds taken, the throughput and how much longer each size took than the previous one (about 2 when linear).
+Returns the worst of those growth ratios.'''
+def run_benchmark(min_size, max_size, time_budget=None):
+    worst_growth = 0
+    for name, filler in _FILLERS.items():
+        print(f"{name}:")
+        previous = None
+        size = min_size
+        while size <= max_size:
+            seconds, unretrieved = time_extraction(adversarial_page(filler, size), time_budget)
+            growth = '' if previous is None else f"x{seconds / previous:.1f}"
+            if previous is not None:
+                worst_growth = max(worst_growth, seconds / previous)
+            print(f"\t{size / 1e6:7.3f} MB  {seconds * 1000:9.1f} ms  {size / 1e6 / seconds:7.1f} MB/s  {growth:>6}" +
+                  (f"  ({unretrieved} fields unretrieved)" if unretrieved else ''))
+            previous = seconds
+            size *= 2
+    return worst_growth
+
+'''Extracts the fields of the given number of random mutations of the page, checking that every extraction succeeds
+within the time budget (with some slack). Returns the number of failures.'''
+def run_fuzz(page, iterations, time_budget, seed=0):
+    rng = random.Random(seed)
+    failures = 0
+    slowest = 0
+    for _ in range(iterations):
+        mutated = mutate_page(page, rng)
+        try:
+            seconds, _ = time_extraction(mutated, time_budget)
+        except Exception as e:
+            print("~~Error: extraction failed on a mutated page: " + str(e) + "~~")
+            failures += 1
+            continue
+        slowest = max(slowest, seconds)
+        if seconds > time_budget * 2:
+            print(f"~~Error: extraction took {seconds:.3f} s on a mutated page, over its {time_budget} s budget~~")
+            failures += 1
+    print(f"Fuzzed {iterations} mutated pages: {failures} failures, slowest extraction {slowest * 1000:.1f} ms")
+    return failures
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Stress tests the profile field extraction', add_help=True,
+                                     formatter_class=argparse.ArgumentDefaultsHelpFormatter)
+    parser.add_argument('-m', '--max-size', type=float, default=4,
+        help="size (in MB) of the largest adversarial page")
+    parser.add_argument('-b', '--budget', type=float, default=prog2.EXTRACTION_TIME_BUDGET,
+        help="time budget (in seconds) of every extraction")
+    parser.add_argument('-f', '--fuzz', type=int, default=500,
+        help="number of mutated copies of the stored page to extract")
+    parser.add_argument('-p', '--page', type=str, default=prog2.RAW_PAGE,
+        help="the local copy of the page in 'data' to mutate")
+    args = parser.parse_args()
+
+    worst_growth = run_benchmark(125000, int(args.max_size * 1e6), args.budget)
+    print(f"Worst growth when doubling the page size: x{worst_growth:.1f}\n")
+    run_fuzz(prog2.load_data(args.page, from_pickle=False), args.fuzz, args.budget)
+
+# Driver for main
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,496 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+#----------------------------------------------------------------------------
+# Created By  : Zt572
+# Created Date: Oct 2026
+# version ='1.0'
+# Copyright Oct 2026
+# ---------------------------------------------------------------------------
+""" Compiles config.json (plus the synonym table) into a versioned binary intent-index artifact stored next
+to it, so that starting the chatbot does no intent preprocessing at all. The artifact holds the known queries
+in an IntentStore along with their normalized and synonym-canonical forms (laid out the same way, in contiguous
+strings), the token ids used by the token-level prescorer and the length buckets. It holds only data: strings,
+JSON lists and flat arrays of integers, so loading it can't run any code. It is loaded with a single read and
+is rebuilt automatically whenever the source file's mtime and hash or the synonym table no longer match the
+ones it was compiled from.
+
+Run as a standalone script to (re)compile the artifact for the default config.json."""
+# ---------------------------------------------------------------------------
+import argparse
+import collections.abc
+import copy
+import hashlib
+import itertools
+import json
+import os
+import struct
+import sys
+from array import array
+# ---------------------------------------------------------------------------
+from chatbotparts.config.definitions import ROOT_DIR
+from chatbotparts.intentstore.intentstore import IntentStore
+from chatbotparts.thefuzz import process, utils
+from chatbotparts.thefuzz.token_edit import TokenEditScorer, TokenVocabulary
+# ---------------------------------------------------------------------------
+
+CONFIG_PATH = os.path.join(ROOT_DIR, 'src', 'chatbotparts', 'config', 'config.json')
+ARTIFACT_EXTENSION = '.idx'     # The artifact of config.json is config.json.idx
+ARTIFACT_VERSION = 5
+
+# Header: magic, version, source mtime (ns), source size, source sha256, synonym table sha256
+_MAGIC = b'MRIX'
+_HEADER = struct.Struct('<4sHqQ32s32s')
+# The header is followed by the sections listed in _dump_index, each one prefixed with its size in bytes
+_SECTION_SIZE = struct.Struct('<Q')
+
+
+def _synonyms_digest(synonym_dict):
+    """Hashes a synonym table in a stable way (the order of its entries doesn't matter)."""
+    entries = sorted(repr((synonyms, word)) for synonyms, word in synonym_dict.items())
+    return hashlib.sha256("\n".join(entries).encode('utf-8')).digest()
+
+
+def _posting(table, key, copied):
+    """Returns the array of query ids stored under key in the table, copying it first (once) so that arrays
+    shared with other versions of the index are never modified."""
+    if key not in copied:
+        table[key] = array('I', table.get(key, ()))
+        copied.add(key)
+    return table[key]
+
+
+def _array_bytes(values):
+    """Returns the bytes of an array, little-endian whatever the platform."""
+    if sys.byteorder == 'big':
+        values = array(values.typecode, values)
+        values.byteswap()
+    return values.tobytes()
+
+
+def _bytes_array(typecode, data):
+    """Returns the array of the given type stored in data by _array_bytes."""
+    values = array(typecode)
+    values.frombytes(data)
+    if sys.byteorder == 'big':
+        values.byteswap()
+    return values
+
+
+class _DerivedForms(collections.abc.Mapping):
+    """ Read-only {known query: form} view of a CompiledIntentIndex, where the form of each known query is
+    form_of(query id, query). Iterating over its items walks the query ids, without looking any query up."""
+
+    def __init__(self, index, form_of):
+        self._index = index
+        self._form_of = form_of
+
+    def __getitem__(self, query):
+        query_id = self._index._id_of(query)
+        if query_id < 0:
+            raise KeyError(query)
+        return self._form_of(query_id, query)
+
+    def __iter__(self):
+        return iter(self._index)
+
+    def __len__(self):
+        return len(self._index)
+
+    def items(self):
+        return _DerivedItems(self)
+
+
+class _DerivedItems(collections.abc.ItemsView):
+    def __iter__(self):
+        form_of = self._mapping._form_of
+        for query_id, query in self._mapping._index._id_items():
+            yield query, form_of(query_id, query)
+
+
+class _PreparedForms(process.PreparedChoices):
+    """ The normalized forms of a CompiledIntentIndex as a thefuzz PreparedChoices keyed by known query. The length
+    buckets are the index's own, read in place, so they take no memory of their own and every version of the index
+    shares the buckets its changes didn't touch."""
+
+    def __init__(self, index):
+        super().__init__({}, processor=None)
+        self._index = index
+
+    def __len__(self):
+        return len(self._index)
+
+    def _lengths(self):
+        return [length for length, query_ids in self._index._length_buckets.items() if query_ids]
+
+    def _bucket(self, length):
+        index = self._index
+        for query_id in index._length_buckets[length]:  # Query ids follow the order of iteration over the index
+            normalized = index._normalized_of(query_id)
+            yield query_id, normalized, index._query_of(query_id), normalized
+
+
+class CompiledIntentIndex(collections.abc.Mapping):
+    """ The known queries of a config file along with everything precomputed from them. Behaves as the
+    known_queries dictionary (query -> info type), so it can be passed directly to map_intent, which uses
+    its normalized forms instead of processing every known query on every call, and to extract_info_type.
+
+    An index is never modified once built: with_changes returns a new index which shares every unchanged
+    structure with this one, so a reader holding this index keeps seeing a consistent version. Known queries
+    added or retyped since the IntentStore was built are kept in a small overlay on top of it.
+    """
+
+    def __init__(self, known_queries, synonym_dict):
+        """Preprocesses the given dictionary of known queries. Prefer load_intent_index, which only does this
+        when the artifact on disk is missing or stale."""
+        self._synonym_dict = synonym_dict
+        self._store = IntentStore(known_queries)
+        self._overlay = {}              # Known queries added or given another info type since the store was built
+        self._removed = frozenset()     # Known queries of the store removed since it was built
+        self._extra_ids = {}            # Added known query -> its id (ids of the store's queries are their position)
+        self._extra_queries = {}        # Id -> added known query
+        self._next_id = len(self._store)
+
+        # Normalized form of the store's query i is _normalized_text[_normalized_offsets[i]:_normalized_offsets[i+1]],
+        # and its canonical form and token ids are laid out the same way
+        self._normalized_offsets = array('I', [0])
+        self._canonical_offsets = array('I', [0])
+        self._token_offsets = array('I', [0])
+        self._token_ids = array('i')
+        self._tokens = []               # The prescorer's interned tokens, in id order
+        self._extra_normalized = {}     # Id -> normalized form of an added known query
+        self._extra_canonical = {}      # Id -> canonical form of an added known query
+        self._vocabulary = None         # TokenVocabulary of the prescorer, built from the token ids on first use
+        self._length_buckets = {}
+        copied_buckets = set()
+        normalized_forms, canonical_forms, token_table = [], [], {}
+        for query_id, query in enumerate(self._store):
+            normalized, canonical = self._add_derived(query_id, query, copied_buckets)
+            normalized_forms.append(normalized)
+            canonical_forms.append(canonical)
+            self._normalized_offsets.append(self._normalized_offsets[-1] + len(normalized))
+            self._canonical_offsets.append(self._canonical_offsets[-1] + len(canonical))
+            for token in normalized.split():    # Interned the way TokenVocabulary.add does, normalized being its processed form
+                if token not in token_table:
+                    token_table[token] = len(self._tokens)
+                    self._tokens.append(token)
+                self._token_ids.append(token_table[token])
+            self._token_offsets.append(len(self._token_ids))
+        self._normalized_text = "".join(normalized_forms)
+        self._canonical_text = "".join(canonical_forms)
+
+    def _add_derived(self, query_id, query, copied_buckets):
+        """Computes everything derived from a known query's text and adds it to this index, except for the
+        normalized and canonical forms, which are returned for the caller to store."""
+        # Exactly what process.extractOne compares against for the default WRatio scorer
+        normalized = utils.full_process(query, force_ascii=True)
+        if self._vocabulary is not None:
+            self._vocabulary.add(query)
+        _posting(self._length_buckets, len(normalized), copied_buckets).append(query_id)
+        return normalized, self._canonicalize(query)
+
+    def _remove_derived(self, query_id, query, copied_buckets):
+        """Removes everything derived from a known query's text from this index. Interned tokens are kept."""
+        normalized = self._normalized_of(query_id)
+        self._extra_normalized.pop(query_id, None)
+        self._extra_canonical.pop(query_id, None)
+        _posting(self._length_buckets, len(normalized), copied_buckets).remove(query_id)
+
+    def with_changes(self, changed, removed):
+        """Returns a new index with the known queries of the changed dictionary added (or given their new
+        info type) and the removed known queries dropped. Only the changed known queries are preprocessed,
+        and only the structures they touch are copied; this index is left as it was."""
+        new = copy.copy(self)
+        new._overlay = dict(self._overlay)
+        new._extra_ids = dict(self._extra_ids)
+        new._extra_queries = dict(self._extra_queries)
+        new._extra_normalized = dict(self._extra_normalized)
+        new._extra_canonical = dict(self._extra_canonical)
+        new._length_buckets = dict(self._length_buckets)
+        if self._vocabulary is not None:    # Interning the new queries' tokens must not change this index's vocabulary
+            new._vocabulary = self._vocabulary.copy()
+        removed_from_store = set(self._removed)
+        copied_buckets = set()
+
+        for query in removed:
+            if query not in new:
+                continue
+            new._overlay.pop(query, None)
+            if query in new._extra_ids:
+                query_id = new._extra_ids.pop(query)
+                del new._extra_queries[query_id]
+            else:
+                query_id = self._store.index_of(query)
+                removed_from_store.add(query)
+            new._remove_derived(query_id, query, copied_buckets)
+
+        for query, info_type in changed.items():
+            if query not in new:    # A new known query; retyped ones keep everything derived from their text
+                if query in removed_from_store:
+                    query_id = self._store.index_of(query)
+                    removed_from_store.discard(query)
+                else:
+                    query_id = new._next_id
+                    new._next_id += 1
+                    new._extra_ids[query] = query_id
+                    new._extra_queries[query_id] = query
+                normalized, canonical = new._add_derived(query_id, query, copied_buckets)
+                if query_id >= len(self._store):     # The store's own queries keep their forms in place
+                    new._extra_normalized[query_id] = normalized
+                    new._extra_canonical[query_id] = canonical
+            new._overlay[query] = info_type
+
+        new._removed = frozenset(removed_from_store)
+        return new
+
+    def get_overlay_size(self):
+        """Returns how many known queries differ from the underlying IntentStore."""
+        return len(self._overlay) + len(self._removed)
+
+    def _query_of(self, query_id):
+        if query_id < len(self._store):
+            return self._store.get_query(query_id)
+        return self._extra_queries[query_id]
+
+    def _normalized_of(self, query_id, query=None):
+        if query_id < len(self._store):
+            return self._normalized_text[self._normalized_offsets[query_id]:self._normalized_offsets[query_id + 1]]
+        return self._extra_normalized[query_id]
+
+    def _canonical_of(self, query_id, query=None):
+        if query_id < len(self._store):
+            return self._canonical_text[self._canonical_offsets[query_id]:self._canonical_offsets[query_id + 1]]
+        return self._extra_canonical[query_id]
+
+    def _canonicalize(self, query):
+        from chatbotparts.prog4fuzzy import replace_with_similar   # Imported here as prog4fuzzy consumes this index
+        return replace_with_similar(query.lower(), self._synonym_dict).strip()
+
+    def _token_encodings(self):
+        """Yields the (known query, normalized form, token ids) of the store's known queries still in this index."""
+        for query_id, query in self._id_items():
+            if query_id >= len(self._store):
+                break
+            start, end = self._token_offsets[query_id], self._token_offsets[query_id + 1]
+            yield query, self._normalized_of(query_id), self._token_ids[start:end]
+
+    def _id_of(self, query):
+        """Returns the id of the given known query, or -1 if it isn't one."""
+        try:
+            query_id = self._extra_ids.get(query)
+        except TypeError:   # Unhashable
+            return -1
+        if query_id is not None:
+            return query_id
+        if query in self._removed:
+            return -1
+        return self._store.index_of(query)
+
+    def _id_items(self):
+        """Yields the (query id, known query) pairs of this index, in iteration order."""
+        for query_id, query in enumerate(self._store):
+            if query not in self._removed:
+                yield query_id, query
+        for query, query_id in self._extra_ids.items():
+            yield query_id, query
+
+    def __getitem__(self, query):
+        try:
+            return self._overlay[query]
+        except (KeyError, TypeError):
+            pass
+        if query in self._removed:
+            raise KeyError(query)
+        return self._store[query]
+
+    def __iter__(self):
+        for query in self._store:
+            if query not in self._removed:
+                yield query
+        yield from self._extra_ids
+
+    def __len__(self):
+        return len(self._store) - len(self._removed) + len(self._extra_ids)
+
+    def __contains__(self, query):
+        try:
+            if query in self._overlay:
+                return True
+        except TypeError:   # Unhashable
+            return False
+        return query not in self._removed and query in self._store
+
+    def get_store(self):
+        return self._store
+
+    def get_normalized_choices(self):
+        """Returns the read-only {known query: normalized form} mapping used by map_intent."""
+        return _DerivedForms(self, self._normalized_of)
+
+    def get_prepared_choices(self):
+        """Returns the normalized forms as a thefuzz PreparedChoices (keyed by known query), which process.extractOne
+        and extractOneWithin score one length bucket at a time with WRatio. It reads this index's length buckets in
+        place, so it costs nothing to build."""
+        return _PreparedForms(self)
+
+    def get_canonical_forms(self):
+        """Returns the read-only {known query: synonym-canonical form} mapping."""
+        return _DerivedForms(self, self._canonical_of)
+
+    def get_prescorer(self):
+        """Returns a token-level prescorer (see map_intent). Its vocabulary is built from the compiled token ids on first
+        use, so only the known queries added since the store was built are tokenized."""
+        if self._vocabulary is None:
+            vocabulary = TokenVocabulary.from_encodings(self._tokens, self._token_encodings())
+            for query in self._extra_ids:
+                vocabulary.add(query)
+            self._vocabulary = vocabulary
+        return TokenEditScorer(self._vocabulary)
+
+    def get_length_buckets(self):
+        """Returns the {normalized length: array of query ids} dictionary."""
+        return self._length_buckets
+
+    def lookup_normalized(self, normalized):
+        """Returns the known queries whose normalized form is exactly the given (already normalized) string,
+        looking only at the known queries of the same length."""
+        return [self._query_of(query_id) for query_id in self._length_buckets.get(len(normalized), ())
+                if self._normalized_of(query_id) == normalized]
+
+
+def _dump_index(index):
+    """Returns the sections of an index fresh from its constructor, as bytes."""
+    lengths = sorted(index._length_buckets)
+    bucket_ends = array('I', itertools.accumulate(len(index._length_buckets[length]) for length in lengths))
+    bucket_ids = array('I', itertools.chain.from_iterable(index._length_buckets[length] for length in lengths))
+    text, offsets, type_indexes, info_types, order = index.get_store().to_parts()
+    return [
+        text.encode('utf-8'), _array_bytes(offsets), _array_bytes(type_indexes), json.dumps(info_types).encode('utf-8'),
+        _array_bytes(order),
+        index._normalized_text.encode('utf-8'), _array_bytes(index._normalized_offsets),
+        index._canonical_text.encode('utf-8'), _array_bytes(index._canonical_offsets),
+        json.dumps(index._tokens).encode('utf-8'), _array_bytes(index._token_ids), _array_bytes(index._token_offsets),
+        _array_bytes(array('I', lengths)), _array_bytes(bucket_ends), _array_bytes(bucket_ids),
+    ]
+
+
+def _load_index(sections, synonym_dict):
+    """Returns the index whose sections _dump_index returned. Raises ValueError if they don't describe one."""
+    (text, offsets, type_indexes, info_types, order, normalized_text, normalized_offsets, canonical_text,
+     canonical_offsets, tokens, token_ids, token_offsets, lengths, bucket_ends, bucket_ids) = sections
+    store = IntentStore.from_parts(str(text, 'utf-8'), _bytes_array('I', offsets), _bytes_array('H', type_indexes),
+                                   json.loads(str(info_types, 'utf-8')), _bytes_array('I', order))
+    index = CompiledIntentIndex.__new__(CompiledIntentIndex)
+    index._synonym_dict = synonym_dict
+    index._store = store
+    index._overlay, index._removed, index._extra_ids, index._extra_queries = {}, frozenset(), {}, {}
+    index._next_id = len(store)
+    index._normalized_text = str(normalized_text, 'utf-8')
+    index._normalized_offsets = _bytes_array('I', normalized_offsets)
+    index._canonical_text = str(canonical_text, 'utf-8')
+    index._canonical_offsets = _bytes_array('I', canonical_offsets)
+    index._tokens = json.loads(str(tokens, 'utf-8'))
+    index._token_ids = _bytes_array('i', token_ids)
+    index._token_offsets = _bytes_array('I', token_offsets)
+    index._extra_normalized, index._extra_canonical, index._vocabulary = {}, {}, None
+    bucket_ids = _bytes_array('I', bucket_ids)
+    starts = itertools.chain((0,), _bytes_array('I', bucket_ends))
+    index._length_buckets = {length: bucket_ids[start:end] for length, start, end
+                             in zip(_bytes_array('I', lengths), starts, _bytes_array('I', bucket_ends))}
+    if not (len(store) + 1 == len(index._normalized_offsets) == len(index._canonical_offsets) == len(index._token_offsets)
+            and index._normalized_offsets[-1] == len(index._normalized_text)
+            and index._canonical_offsets[-1] == len(index._canonical_text)
+            and index._token_offsets[-1] == len(index._token_ids) and len(bucket_ids) == len(store)):
+        raise ValueError("The intent index sections don't fit together")
+    return index
+
+
+def compile_intent_index(config_path=CONFIG_PATH, synonym_dict=None, artifact_path=None):
+    """Compiles the config file at config_path into an artifact (by default, next to it) and returns the
+    CompiledIntentIndex. If no synonym table is given, prog4fuzzy's default one is used."""
+    from chatbotparts.prog4fuzzy import DEFAULT_SYNONYMS
+    if synonym_dict is None:
+        synonym_dict = DEFAULT_SYNONYMS
+    if artifact_path is None:
+        artifact_path = config_path + ARTIFACT_EXTENSION
+
+    with open(config_path, 'rb') as f:
+        source = f.read()
+        source_stat = os.fstat(f.fileno())
+    index = CompiledIntentIndex(json.loads(source), synonym_dict)
+
+    header = _HEADER.pack(_MAGIC, ARTIFACT_VERSION, source_stat.st_mtime_ns, source_stat.st_size,
+                          hashlib.sha256(source).digest(), _synonyms_digest(synonym_dict))
+    temp_path = artifact_path + '.tmp'
+    try:
+        with open(temp_path, 'wb') as f:    # Write then rename so a reader never sees a partially written artifact
+            f.write(header)
+            for section in _dump_index(index):
+                f.write(_SECTION_SIZE.pack(len(section)))
+                f.write(section)
+        os.replace(temp_path, artifact_path)
+    except OSError as oe:   # The index is still usable even if it can't be cached (e.g. a read-only install)
+        print(f"~~Warning: could not write the intent index artifact {artifact_path}: {oe}~~")
+    return index
+
+
+def load_intent_index(config_path=CONFIG_PATH, synonym_dict=None, artifact_path=None):
+    """Loads the compiled intent index of the config file at config_path, compiling it first if the artifact
+    is missing, was written by another version, or no longer matches the config file or the synonym table.
+    The config file is only hashed when its mtime or size changed since the artifact was compiled. If the config
+    file can't be read, an up-to-date artifact is used as is."""
+    from chatbotparts.prog4fuzzy import DEFAULT_SYNONYMS
+    if synonym_dict is None:
+        synonym_dict = DEFAULT_SYNONYMS
+    if artifact_path is None:
+        artifact_path = config_path + ARTIFACT_EXTENSION
+
+    try:
+        with open(artifact_path, 'rb') as f:
+            data = f.read()     # The whole artifact in a single read
+        magic, version, mtime_ns, size, source_digest, synonyms_digest = _HEADER.unpack_from(data)
+    except (FileNotFoundError, struct.error):
+        return compile_intent_index(config_path, synonym_dict, artifact_path)
+
+    if magic != _MAGIC or version != ARTIFACT_VERSION or synonyms_digest != _synonyms_digest(synonym_dict):
+        return compile_intent_index(config_path, synonym_dict, artifact_path)
+    try:
+        source_stat = os.stat(config_path)
+        if (source_stat.st_mtime_ns, source_stat.st_size) != (mtime_ns, size):
+            # The file was touched or rewritten; only rebuild if its contents actually changed
+            with open(config_path, 'rb') as f:
+                if hashlib.sha256(f.read()).digest() != source_digest:
+                    return compile_intent_index(config_path, synonym_dict, artifact_path)
+            try:
+                with open(artifact_path, 'r+b') as f:    # Otherwise record the new mtime so the file isn't hashed again next time
+                    f.write(_HEADER.pack(magic, version, source_stat.st_mtime_ns, source_stat.st_size, source_digest, synonyms_digest))
+            except OSError:     # A read-only install just hashes the file again next time
+                pass
+    except OSError as oe:   # The artifact is still usable when its source can't be read (e.g. left out of an install)
+        print(f"~~Warning: could not read the known queries config {config_path} ({oe}); using its compiled intent index as is.~~")
+
+    try:
+        sections, offset, data = [], _HEADER.size, memoryview(data)
+        while offset < len(data):
+            (size,) = _SECTION_SIZE.unpack_from(data, offset)
+            offset += _SECTION_SIZE.size + size
+            if offset > len(data):
+                raise ValueError("The intent index artifact is truncated")
+            sections.append(data[offset - size:offset])
+        return _load_index(sections, synonym_dict)
+    except (ValueError, struct.error):   # A corrupted artifact is simply rebuilt
+        return compile_intent_index(config_path, synonym_dict, artifact_path)
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Compiles the known queries config into an intent-index artifact', add_help=True,
+        formatter_class=argparse.ArgumentDefaultsHelpFormatter)
+    parser.add_argument('-c', '--config', action='store', type=str, default=CONFIG_PATH,
+        help="the config json file of known queries to compile")
+    args = parser.parse_args()
+
+    index = compile_intent_index(args.config)
+    print(f"Compiled {len(index)} known queries into {args.config + ARTIFACT_EXTENSION}")
+
+# Driver for main
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,118 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+#----------------------------------------------------------------------------
+# Created By  : Zt572
+# Created Date: Oct 2026
+# version ='1.0'
+# Copyright Oct 2026
+# ---------------------------------------------------------------------------
+""" Compact, read-only storage for very large sets of known queries. All query texts are kept in one
+contiguous string with an array of offsets, and the info types they map to are interned in a small table
+referenced by index, so each known query costs a few bytes beyond its own text rather than two full string
+objects and a dictionary slot."""
+# ---------------------------------------------------------------------------
+import collections.abc
+from array import array
+# ---------------------------------------------------------------------------
+
+
+class IntentStore(collections.abc.Mapping):
+    """ A read-only mapping of known query -> info type (the same shape as the known_queries dictionary
+    loaded from config.json) which can be passed anywhere that dictionary is expected, e.g. map_intent and
+    extract_info_type. Iteration follows the order the known queries were given in.
+    """
+
+    def __init__(self, known_queries=()):
+        """Creates a new IntentStore from a dictionary of known queries or an iterable of
+        (query, info type) pairs. If a query appears more than once, the last info type wins."""
+        if isinstance(known_queries, collections.abc.Mapping):
+            known_queries = known_queries.items()
+        else:
+            known_queries = dict(known_queries).items()     # Drop duplicate queries like a dictionary would
+
+        texts = []
+        self._offsets = array('I', [0])     # Query i is _text[_offsets[i]:_offsets[i+1]]
+        self._type_indexes = array('H')     # Query i maps to _info_types[_type_indexes[i]]
+        self._info_types = []
+        type_table = {}
+        end = 0
+        for query, info_type in known_queries:
+            if not isinstance(query, str) or not isinstance(info_type, str):
+                raise TypeError("Known queries and their info types must be strings")
+            texts.append(query)
+            end += len(query)
+            self._offsets.append(end)
+            if info_type not in type_table:
+                type_table[info_type] = len(self._info_types)
+                self._info_types.append(info_type)
+            self._type_indexes.append(type_table[info_type])
+        self._text = "".join(texts)
+
+        # Permutation of the query indexes in sorted query order, used to binary search for a query
+        self._order = array('I', sorted(range(len(texts)), key=texts.__getitem__))
+
+    @classmethod
+    def from_parts(cls, text, offsets, type_indexes, info_types, order):
+        """Creates an IntentStore directly from the parts to_parts returned, e.g. read back from a compiled artifact."""
+        store = cls.__new__(cls)
+        if not len(offsets) == len(type_indexes) + 1 == len(order) + 1 or offsets[-1] != len(text):
+            raise ValueError("The parts of an IntentStore don't fit together")
+        store._text, store._offsets, store._type_indexes = text, offsets, type_indexes
+        store._info_types, store._order = info_types, order
+        return store
+
+    def to_parts(self):
+        """Returns the (text, offsets, type indexes, info types, order) the store is made of: a string, a list of strings
+        and arrays of integers, which from_parts turns back into the same IntentStore."""
+        return self._text, self._offsets, self._type_indexes, self._info_types, self._order
+
+    def _query(self, i):
+        return self._text[self._offsets[i]:self._offsets[i + 1]]
+
+    def _find(self, query):
+        """Returns the index of the given query, or -1 if it isn't stored."""
+        if not isinstance(query, str):
+            return -1
+        low, high = 0, len(self._order)
+        while low < high:
+            mid = (low + high) // 2
+            if self._query(self._order[mid]) < query:
+                low = mid + 1
+            else:
+                high = mid
+        if low < len(self._order) and self._query(self._order[low]) == query:
+            return self._order[low]
+        return -1
+
+    def __getitem__(self, query):
+        i = self._find(query)
+        if i < 0:
+            raise KeyError(query)
+        return self._info_types[self._type_indexes[i]]
+
+    def __contains__(self, query):
+        return self._find(query) >= 0
+
+    def __iter__(self):
+        for i in range(len(self._type_indexes)):
+            yield self._query(i)
+
+    def __len__(self):
+        return len(self._type_indexes)
+
+    def index_of(self, query):
+        """Returns the position of the given known query, or -1 if it isn't stored."""
+        return self._find(query)
+
+    def get_query(self, i):
+        """Returns the i-th known query (in the order they were given)."""
+        if not 0 <= i < len(self):
+            raise IndexError("IntentStore index out of range")
+        return self._query(i)
+
+    def get_info_types(self):
+        """Returns the distinct info types, in the order they were first seen."""
+        return list(self._info_types)
+
+    def __repr__(self):
+        return f"{type(self).__name__}({len(self)} known queries, {len(self._info_types)} info types)"
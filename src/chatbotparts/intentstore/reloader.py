@@ -0,0 +1,112 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+#----------------------------------------------------------------------------
+# Created By  : Zt572
+# Created Date: Oct 2026
+# version ='1.0'
+# Copyright Oct 2026
+# ---------------------------------------------------------------------------
+""" Hot reloading of config.json. An IntentIndexReloader watches the config file and, when it changes, diffs
+the old and new known queries and applies only the added, removed and retyped ones to a new version of the
+compiled intent index. New versions are published by swapping a single reference, so a map_intent call that
+grabbed the index before a reload keeps using the old version from start to finish."""
+# ---------------------------------------------------------------------------
+import json
+import os
+import threading
+# ---------------------------------------------------------------------------
+from chatbotparts.intentstore.compiled import CONFIG_PATH, CompiledIntentIndex, load_intent_index
+# ---------------------------------------------------------------------------
+
+
+class IntentIndexReloader():
+    """ Keeps the compiled intent index of a config file up to date with that file. Call get_index() once per
+    request and use the returned index for the whole request; call check() (e.g. before every request) or
+    start() (to poll from a background thread) to pick up edits to the config file.
+
+    Once the known queries changed since the index was compiled exceed compaction_ratio of all the known
+    queries, the next reload rebuilds the index from scratch instead of adding to its overlay.
+    """
+
+    def __init__(self, config_path=CONFIG_PATH, synonym_dict=None, compaction_ratio=0.25):
+        """Creates a new IntentIndexReloader, loading (or compiling) the config file's intent index."""
+        self._config_path = config_path
+        self._synonym_dict = synonym_dict
+        self._compaction_ratio = compaction_ratio
+        self._reload_lock = threading.Lock()    # Only serializes reloads; readers never wait
+        self._stop_event = threading.Event()
+        self._thread = None
+
+        self._file_stat = self._stat_config()
+        self._index = load_intent_index(config_path, synonym_dict)
+        self._known_queries = dict(self._index)     # Last loaded known queries, for diffing against the next ones
+
+    def _stat_config(self):
+        try:
+            stat = os.stat(self._config_path)
+            return stat.st_mtime_ns, stat.st_size
+        except FileNotFoundError:
+            return None
+
+    def get_index(self):
+        """Returns the current version of the intent index."""
+        return self._index
+
+    def check(self):
+        """Reloads the config file if it changed since it was last loaded. Returns True if a new version
+        of the index was published."""
+        if self._stat_config() == self._file_stat:
+            return False
+        return self.reload()
+
+    def reload(self):
+        """Reloads the config file, publishing a new version of the index if any known queries changed.
+        If the file can't be read or isn't valid JSON (e.g. it is still being edited), the current version
+        is kept. Returns True if a new version was published."""
+        with self._reload_lock:
+            self._file_stat = self._stat_config()   # Recorded first so a broken file is only reported once per edit
+            try:
+                with open(self._config_path, "r") as f:
+                    known_queries = json.load(f)
+
+                # Diff the old and new known queries (as sets, so the comparison itself runs in C)
+                removed = self._known_queries.keys() - known_queries.keys()
+                changed = dict(known_queries.items() - self._known_queries.items())
+                if not removed and not changed:
+                    return False
+
+                index = self._index
+                if index.get_overlay_size() + len(removed) + len(changed) > self._compaction_ratio * max(len(known_queries), 1):
+                    synonym_dict = self._synonym_dict
+                    if synonym_dict is None:
+                        from chatbotparts.prog4fuzzy import DEFAULT_SYNONYMS
+                        synonym_dict = DEFAULT_SYNONYMS
+                    index = CompiledIntentIndex(known_queries, synonym_dict)
+                else:
+                    index = index.with_changes(changed, removed)
+            except (OSError, ValueError, TypeError, AttributeError) as e:  # Unreadable file, invalid JSON or not a dictionary of strings
+                print(f"~~Warning: could not reload {self._config_path} ({e}); keeping the current known queries.~~")
+                return False
+
+            self._known_queries = known_queries
+            self._index = index     # Publish the new version in one step
+            return True
+
+    def start(self, interval=1.0):
+        """Starts checking the config file for changes every interval seconds from a daemon thread."""
+        if self._thread is not None:
+            return
+        self._stop_event.clear()
+        self._thread = threading.Thread(target=self._watch, args=(interval,), daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        """Stops the thread started by start(), if any."""
+        if self._thread is not None:
+            self._stop_event.set()
+            self._thread.join()
+            self._thread = None
+
+    def _watch(self, interval):
+        while not self._stop_event.wait(interval):
+            self.check()
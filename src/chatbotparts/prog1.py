@@ -5,16 +5,174 @@
 # Copyright Apr 2022
 # ---------------------------------------------------------------------------
 """ Extracts data from the SC State House website and stores it locally, either as a text file
-or a pickled file. Supports dynamic choice of output path."""
+or a pickled file. Supports dynamic choice of output path. Pages are read and parsed as a stream
+of chunks, so only the representative's profile (rather than the whole page) is ever held at once."""
 # ---------------------------------------------------------------------------
+import codecs
+import functools
+import hashlib
+import io
 import os
 import urllib.request as urlreq
+from collections import namedtuple
 # ---------------------------------------------------------------------------
 from .config.definitions import ROOT_DIR
-from pickle import dump
+from chatbotparts import prog2
+from chatbotparts.infocontainer import infocontainer as ic
+from chatbotparts.infocontainer import pagetext
 from urllib.error import URLError
 # ---------------------------------------------------------------------------
 
+CHUNK_SIZE = 8192   # Characters (or bytes, from the website) of a page read at a time
+PANEL_START = '<div class="mainwidepanel">'     # Where the relevant info of a page begins
+PANEL_END = '<!-- mainwidepanel -->'            # and where it ends
+# Most seconds spent extracting the fields of each section of a page read; far more than prog2's budget, as the fields
+# of a page are only extracted once, when it's read, and any left unretrieved stay so in its snapshot
+INGESTION_TIME_BUDGET = 10.0
+
+# A field of a representative's profile, emitted as soon as the section it's in has been read
+ProfileField = namedtuple('ProfileField', ['section', 'field', 'value'])
+
+
+class ProfileStreamParser(pagetext.PageTextParser):
+    """ Parses the structured text of a representative's profile as its html is
+    fed in, extracting the fields of each section (as split by prog2's section
+    markers) as soon as the section ends. Only the text of the sections still
+    open is held; the extracted fields are queued as ProfileFields until taken
+    with take_events. Unlike prog2.split_sections, a section whose heading never
+    comes isn't extracted at all, since the rest of the page is no longer held."""
+
+    def __init__(self, time_budget=prog2.EXTRACTION_TIME_BUDGET):
+        super().__init__()
+        self._time_budget = time_budget
+        self._text = ''         # The text since the start of the earliest section still open
+        self._open = {}         # Section -> its start within _text
+        self._seen = set()      # The markers found so far (only the first occurrence of each counts)
+        self._events = []
+
+    def handle_line(self, line):
+        line_start = len(self._text)
+        self._text += line + '\n'
+        for marker in prog2.SECTION_MARKERS.finditer(line):
+            name = marker.lastgroup
+            if name in self._seen:
+                continue
+            self._seen.add(name)
+            self._close_sections([section for section in self._open if prog2.SECTION_ENDS[section] == name],
+                                 line_start + marker.start())
+            if name in prog2.SECTION_ENDS:
+                self._open[name] = line_start + marker.start()
+
+        # Drop the text before every section still open
+        first = min(self._open.values(), default=len(self._text))
+        if first:
+            self._text = self._text[first:]
+            self._open = {section: start - first for section, start in self._open.items()}
+
+    def _close_sections(self, sections, end):
+        for section in sections:
+            text = self._text[self._open.pop(section):end]
+            for field, matches in ic.extract_fields(text, {section: (0, len(text))}, self._time_budget).items():
+                for value in [ic.UNRETRIEVED] if matches is None else matches:
+                    self._events.append(ProfileField(section, field, value))
+
+    def close(self):
+        super().close()
+        self._close_sections(list(self._open), len(self._text))     # What's left runs to the end of the page
+
+    def take_events(self):
+        """Returns the ProfileFields extracted since last taken."""
+        events, self._events = self._events, []
+        return events
+
+
+'''Yields the pieces of the page's mainwidepanel region (from its opening div up to the comment closing it) out of the
+chunks of the page's html, holding no more than a chunk of the page at a time.'''
+def panel_chunks(chunks):
+    pending = ''
+    inside = False
+    for chunk in chunks:
+        pending += chunk
+        if not inside:
+            start = pending.find(PANEL_START)
+            if start == -1:     # Keep what could be the beginning of the marker
+                pending = pending[len(pending) - len(PANEL_START) + 1:] if len(pending) >= len(PANEL_START) else pending
+                continue
+            inside = True
+            pending = pending[start:]
+        end = pending.find(PANEL_END)
+        if end != -1:
+            yield pending[:end]
+            return
+        keep = len(PANEL_END) - 1   # Likewise for the end marker
+        if len(pending) > keep:
+            yield pending[:-keep]
+            pending = pending[-keep:]
+    if inside and pending:
+        yield pending
+
+'''Yields every field of the profile on the page given as chunks of html, as ProfileFields, each section's as soon as it's
+been read. Only the page's mainwidepanel region is parsed, writing its html to the given file as well.'''
+def stream_profile(chunks, time_budget=prog2.EXTRACTION_TIME_BUDGET, copy_panel_to=None):
+    parser = ProfileStreamParser(time_budget=time_budget)
+    for piece in panel_chunks(chunks):
+        if copy_panel_to is not None:
+            copy_panel_to.write(piece)
+        parser.feed(piece)
+        yield from parser.take_events()
+    parser.close()
+    yield from parser.take_events()
+
+'''Yields the text of the HTTP response in chunks, decoded as UTF-8, writing each one to the given file as well.'''
+def response_chunks(response, copy_to=None):
+    decoder = codecs.getincrementaldecoder('utf-8')()
+    while True:
+        data = response.read(CHUNK_SIZE)
+        text = decoder.decode(data, final=not data)
+        if text:
+            if copy_to is not None:
+                copy_to.write(text)
+            yield text
+        if not data:
+            return
+
+'''Yields the text of the open file in chunks.'''
+def file_chunks(f):
+    return iter(functools.partial(f.read, CHUNK_SIZE), '')
+
+'''Reads the page given as chunks of html, returning every field of its profile (as by infocontainer.extract_fields, with
+the fields of each section extraction ran out of its time budget for given as None), the hash of the whole page (see
+prog2.source_hash) and, only if verbose, the html of its mainwidepanel region (None otherwise). Every chunk of the page is read,
+even past the region (so that copies of it are complete), but no more than a section of the profile is held at a time.'''
+def read_panel(chunks, verbose=False, time_budget=INGESTION_TIME_BUDGET):
+    def hashed(chunks):
+        for chunk in chunks:
+            digest.update(chunk.encode('utf-8'))
+            yield chunk
+
+    digest = hashlib.sha256()
+    chunks = hashed(chunks)
+    panel = io.StringIO() if verbose else None
+    fields = {field: [] for field in ic.PROFILE_FIELD_NAMES}   # Every field, with no matches yet
+    for event in stream_profile(chunks, time_budget, panel):
+        if verbose:
+            print(f"\t{event.section}: {event.field} = {event.value}")
+        if event.value == ic.UNRETRIEVED:
+            fields[event.field] = None
+        else:
+            fields[event.field].append(event.value)
+    for _ in chunks:    # Read the rest of the page
+        pass
+    return fields, digest.hexdigest(), None if panel is None else panel.getvalue()
+
+'''Reads the local copy of a page at the given path in chunks, returning the snapshot of its profile (see prog2.ProfileSnapshot),
+whose source is the name of the local copy in 'data'.'''
+def snapshot_local_copy(path, source, verbose=False):
+    with open(path, 'r', newline='') as f:     # Newlines as they are, so that the page hashes as it's stored
+        stamp = prog2.source_stamp(path)
+        fields, page_hash, _ = read_panel(file_chunks(f), verbose)
+    return prog2.take_snapshot(fields, source, page_hash, stamp=stamp)
+
 def extract_info_93(district_name, update_info=True, pickle_info=True, outpath=None, verbose=False):
     # Build default output path from config file when the parameter isn't specified
     if outpath is None:
@@ -28,13 +186,17 @@ def extract_info_93(district_name, update_info=True, pickle_info=True, outpath=N
 
     # Otherwise, continue on with the extracting 
     webpage = None
+    panel = None
+    local_path = outpath + '/district_93_local.txt'
     if update_info:    # Try to request from the website to update the local data if possible
         url = "https://www.scstatehouse.gov/member.php?code=1433096420"
         try:
             webpage = urlreq.urlopen(url)  # Grab HTTP Response object
-            html = webpage.read().decode("utf-8")   # Read bytes of HTML from the webpage and decode them (UTF-8 encoding scheme)
-            with open(outpath + '/district_93_local.txt', 'w') as f:   # Write webpage HTML information to the local data text file
-                f.write(html.strip())
+            # Stream the webpage's HTML into the local data text file while parsing it, only replacing the file once
+            # the whole page has been read
+            with open(local_path + '.part', 'w', newline='') as f:
+                panel = read_panel(response_chunks(webpage, copy_to=f), verbose)
+            os.replace(local_path + '.part', local_path)
         except URLError:    # If a client or server error code is returned, a URLError is thrown
             if webpage is None: # Print out relevant message depending on if an HTTP error code was received
                 print("HTTP Request was unsuccessful. Defaulting to current local copy of webpage data.")
@@ -42,21 +204,17 @@ def extract_info_93(district_name, update_info=True, pickle_info=True, outpath=N
                 print(f"HTTP Request was unsuccessful (error code: {webpage.status}). Defaulting to current local copy of webpage data.")
         except: # Catch other unexpected errors
             print("Request to the webpage was unsuccessful. Defaulting to current local copy of webpage data.")
+        if panel is None and os.path.exists(local_path + '.part'):
+            os.remove(local_path + '.part')     # Discard what was read of the page
     else:
         print("Skipping url request...")
     
-    # Read in the data from the local copy
-    # Note: read() is used instead of readline() since having all the file's contents as a single string allows for
-    # broader searches to be done more easily. The downside is having to buffer the entire file in memory at once,
-    # but the data is small enough in size for that not to cause unwanted behavior.
-    local_text = ''
-    with open(outpath + '/district_93_local.txt', 'r') as f:
-        local_text = f.read().rstrip()   
-
-    # Whittle down the file data to where the relevant information is (cleaning data)
-    rel_info_start = local_text.find('<div class="mainwidepanel">')    # Index of when the relevant info begins
-    rel_info_end = local_text.find('<!-- mainwidepanel -->')           # Index of when the relevant info ends
-    local_text = local_text[rel_info_start:rel_info_end]
+    # Otherwise read in the data from the local copy. Either way, only the region of the page where the relevant
+    # information is (the mainwidepanel) is kept, and the page is read in chunks rather than buffered in memory at once
+    if panel is None:
+        with open(local_path, 'r', newline='') as f:
+            panel = read_panel(file_chunks(f), verbose)
+    fields, page_hash, local_text = panel
 
     if verbose:    # If specified, print out the modified webpage data to console as well as stats
         print("Trimmed Data: ")
@@ -69,12 +227,14 @@ def extract_info_93(district_name, update_info=True, pickle_info=True, outpath=N
         # Generic completion message
         print("Done! Output written to district93_local.txt.")
 
-    # If pickling, dump the data into a pickle file before exit
+    # If pickling, persist the parsed profile before exit: a snapshot of every field and of the answer to every type
+    # of information, which the chatbot loads instead of parsing the page again (the local copy of the page is kept
+    # as a fallback to rebuild it from)
     if pickle_info:
-        with open(outpath + '/district93_local.pkl', 'wb') as f:
-            dump(local_text, f)
+        snapshot = prog2.take_snapshot(fields, 'district_93_local.txt', page_hash, stamp=prog2.source_stamp(local_path))
+        prog2.save_snapshot(snapshot, outpath + '/district93_local.pkl')
         if verbose:
-            print("Data has also been pickled to district93_local.pkl")
+            print("The parsed profile has also been pickled to district93_local.pkl")
     print()
 
 def main():
@@ -84,6 +244,3 @@ def main():
 # Driver for main
 if __name__ == "__main__":
     main()
-
-
-
@@ -7,26 +7,149 @@
 """ Processes extracted html from prog1 and returns relevant info based on console input."""
 # ---------------------------------------------------------------------------
 import argparse
-from distutils.log import info
+import functools
+import hashlib
+import os
 import re
+from collections import namedtuple
 # ---------------------------------------------------------------------------
 from .config.definitions import ROOT_DIR
 from chatbotparts.infocontainer import infocontainer as ic
-from pickle import load
+from chatbotparts.infocontainer import pagetext
+from pickle import dump, load
 # ---------------------------------------------------------------------------
 
+EXTRACTION_TIME_BUDGET = 1.0   # Most seconds spent on each extraction of fields from a page; fields left are shown as UNRETRIEVED
+
+# Headings marking where each section of a representative's page (as structured text) begins, found together in a single pass
+# over the page. The contact section begins with the page's title
+SECTION_MARKERS = re.compile("(?P<contact>^# )|(?P<personal>^## Personal Information$)|(?P<committees>^## Committee Assignments$)|"
+                             "(?P<service>^## Service In Public Office$)|(?P<district>District [0-9]+)", re.MULTILINE)
+# The heading each section runs up to (None meaning the end of the page). The district heading sits within the contact section
+SECTION_ENDS = {
+    "contact" : "personal",
+    "personal" : "committees",
+    "service" : None,
+    "district" : "personal"
+}
+
+# Establish available categories (and subcategories) of information
+CATEGORIES = {
+    "contact info" : ['name','home address','columbia address','phone'],
+    "personal info" : ['birthday', 'parents', 'education', 'children', 'former', 'religion'],
+    "service" : ['service'],
+    "district" : ['district name', 'region']
+}
+
+SNAPSHOT_VERSION = 2    # Version of the layout of profile snapshots; snapshots of any other version are rebuilt
+RAW_PAGE = 'district_93_local.txt'  # The local copy of the page (in 'data') snapshots are taken from by default
+PROFILE_STORE = 'profiles.store'    # The store of many representatives' profiles in 'data' (see infocontainer.profilestore), if any
+
+# The parsed profile of a representative, as persisted by prog1 in place of the page's html: the structured text of the page
+# (see pagetext; None if it wasn't kept), every field extracted from it (as by infocontainer.extract_fields, or None to extract
+# them from the text when needed) and the answer to every known info type. source names the local copy of the page in 'data'
+# it was taken from, source_hash is that copy's hash (see source_hash) and source_stamp its stamp (see source_stamp; None if
+# unknown)
+ProfileSnapshot = namedtuple('ProfileSnapshot', ['version', 'source', 'source_hash', 'text', 'fields', 'answers', 'source_stamp'],
+                             defaults=[None])
+
 
 def load_pickle(pickle_name):
     with open(ROOT_DIR + f"/data/{pickle_name}", 'rb') as f:
         return load(f)
 
+'''Returns the hash identifying the content of a page's html, as read from its local copy.'''
+def source_hash(html):
+    return hashlib.sha256(html.encode('utf-8')).hexdigest()
+
+'''Returns the stamp of the local copy of a page at the given path: its size and modification time, which change whenever the
+copy is rewritten, so that the copy only needs hashing again when its stamp does.'''
+def source_stamp(path):
+    stat = os.stat(path)
+    return stat.st_size, stat.st_mtime_ns
+
+'''Takes the snapshot of a profile out of every field of it (as extracted by prog1.read_panel), keeping the structured text of
+its page only if given. The local copy of the page is the given source, of the given stamp if known.'''
+def take_snapshot(fields, source, page_hash, text=None, stamp=None):
+    ic_dict = make_containers('' if text is None else text, fields)
+    answers = {"all" : render_answer(ic_dict, "all", None)}
+    for category, subcategories in CATEGORIES.items():
+        answers[category] = render_answer(ic_dict, category, None)
+        for subcategory in subcategories:
+            answers[f"{category}:{subcategory}"] = render_answer(ic_dict, category, subcategory)
+    return ProfileSnapshot(SNAPSHOT_VERSION, source, page_hash, text, fields, answers, stamp)
+
+def save_snapshot(snapshot, path):
+    with open(path, 'wb') as f:
+        dump(snapshot._asdict(), f)     # As a plain dictionary, so that any version of it can be read back
+
+'''Returns the snapshot stored at the path, or None if what's stored there isn't a snapshot of the current version.'''
+def read_snapshot(path):
+    with open(path, 'rb') as f:
+        stored = load(f)
+    if not isinstance(stored, dict) or stored.get('version') != SNAPSHOT_VERSION:
+        return None
+    return ProfileSnapshot(**stored)
+
+'''Stores the snapshot at the path if possible; it can still be used without storing it.'''
+def _try_save_snapshot(snapshot, path):
+    try:
+        save_snapshot(snapshot, path)
+    except OSError:
+        pass
+
+'''Returns the profile snapshot of the given name in 'data'. If it's missing, of another version, or stale (taken from a different
+version of the local copy of its page), it's rebuilt from the local copy of its page (source, unless the snapshot says otherwise)
+and stored again. The local copy is only hashed when its stamp differs from the snapshot's. Without a local copy of the page,
+the snapshot is used as it is; a ValueError is raised if there's a stored file but it isn't a snapshot of the current version.'''
+def load_snapshot(snapshot_name, source=RAW_PAGE):
+    snapshot_path = ROOT_DIR + f"/data/{snapshot_name}"
+    try:
+        snapshot = read_snapshot(snapshot_path)
+        stored = True
+    except FileNotFoundError:
+        snapshot = None
+        stored = False
+    if snapshot is not None:
+        source = snapshot.source
+
+    source_path = ROOT_DIR + f"/data/{source}"
+    try:
+        stamp = source_stamp(source_path)
+    except FileNotFoundError:
+        if snapshot is not None:
+            return snapshot
+        if stored:
+            raise ValueError(f"{snapshot_name} in 'data' is a stale snapshot of an older format (rather than version {SNAPSHOT_VERSION}), "
+                             f"and the local copy of its page it's rebuilt from, {source}, could not be found.") from None
+        raise
+    if snapshot is not None:
+        if snapshot.source_stamp == stamp:   # The local copy hasn't been rewritten since the snapshot was taken
+            return snapshot
+        with open(source_path, 'r', newline='') as f:
+            current_hash = source_hash(f.read())
+        if snapshot.source_hash == current_hash:    # Rewritten with the same page; only the stamp needs updating
+            snapshot = snapshot._replace(source_stamp=stamp)
+            _try_save_snapshot(snapshot, snapshot_path)
+            return snapshot
+
+    from chatbotparts import prog1     # Imported here, as prog1 builds on this module
+    snapshot = prog1.snapshot_local_copy(source_path, source)
+    _try_save_snapshot(snapshot, snapshot_path)
+    return snapshot
+
+'''Returns the page stored in 'data': either the snapshot of its parsed profile (see load_snapshot), or the structured text
+of its html read from a text file.'''
 def load_data(file_name, from_pickle = True):
     if from_pickle:
         try:
-            return load_pickle(file_name)
+            return load_snapshot(file_name)
         except FileNotFoundError:
             print(f"{file_name} could not be found in 'data'. Place the pickled file in 'data' and try again.")
             exit(1)
+        except ValueError as e:
+            print(f"{e} Run prog1 to take a new snapshot and try again.")
+            exit(1)
         except:
             print("distict93_local.pkl is inaccessible. Try again.")
             exit(1)
@@ -36,7 +159,7 @@ def load_data(file_name, from_pickle = True):
             with open(ROOT_DIR + f"/data/{file_name}", 'r') as f: 
                 local_data = f.readlines()
             local_data = "".join(local_data)  # convert list to one large string
-            return local_data
+            return pagetext.page_text(local_data)
         except FileNotFoundError:
             print(f"{file_name} could not be found in 'data'. Place the text file in 'data' and try again.")
             exit(1)
@@ -44,47 +167,92 @@ def load_data(file_name, from_pickle = True):
             print("distict93_local.txt is inaccessible. Try again.")
             exit(1)
 
-def parse_info(local_data, info_type):
-    # Once the data is retrieved, set up InformationContainers with the appropriate sections of data
-    contactInfoContainer = None
-    personalInfoContainer = None
-
-    # Obtain start and end point of contact information. If an exception occurs, just pass all of the data to
-    # the container's constructor as a failsafe
-    try:
-        info_start = re.search("barheader", local_data).start() 
-        info_end = re.search("Personal Information", local_data).start()
-        contactInfoContainer = ic.ContactInfoContainer(local_data[info_start,info_end])
-    except:
-        contactInfoContainer = ic.ContactInfoContainer(local_data)
-    
-    # Obtain start and end point of personal information. If an exception occurs, just pass all of the data to
-    # the container's constructor as a failsafe
+'''Returns the profile snapshot of the named district (e.g. 'District 12' or '12') from the profile store of the given name in
+'data', or None if there's no such store or the district isn't in it. The store is kept open for as long as the profile is used.'''
+def load_district(district_name, store_name=PROFILE_STORE):
+    district = re.search('[0-9]+', district_name)
+    if district is None:
+        return None
+    from chatbotparts.infocontainer import profilestore     # Imported here, as the store builds on this module
     try:
-        info_start = re.search("Personal Information", local_data).start() 
-        info_end = re.search("Committee Assignments", local_data).start()
-        personalInfoContainer = ic.PersonalInfoContainer(local_data[info_start,info_end])
-    except:
-        personalInfoContainer = ic.PersonalInfoContainer(local_data)
+        store = profilestore.ProfileStore(ROOT_DIR + f"/data/{store_name}")
+    except FileNotFoundError:
+        return None
+    except (OSError, ValueError) as e:
+        print(f"~~Warning: could not open the profile store: {e}~~")
+        return None
+    profile = store.get_district(int(district.group()))
+    if profile is None:
+        store.close()
+    return profile
 
-    # Obtain start of service in public office information. If an exception occurs, just pass all of the data to
-    # the container's constructor as a failsafe
-    try:
-        info_start = re.search("Service In Public Office", local_data).start() 
-        serviceInfoContainer = ic.ServiceInfoContainer(local_data[info_start:])
-    except:
-        serviceInfoContainer = ic.ServiceInfoContainer(local_data)
+'''Finds the sections of the page in a single pass over it, returning a dictionary of each section's name (as in SECTION_ENDS) to its
+(start, end) offsets within the page. As a failsafe, a section whose heading can't be found spans the whole page, and one whose
+end can't be found runs to the end of the page.'''
+def split_sections(local_data):
+    # Only the first occurrence of each heading counts
+    starts = {}
+    for marker in SECTION_MARKERS.finditer(local_data):
+        starts.setdefault(marker.lastgroup, marker.start())
+        if len(starts) == len(SECTION_MARKERS.groupindex):
+            break   # Every heading has been found; no need to scan the rest of the page
 
-    # Lastly, set up a service container containing the district information
-    try:
-        info_start = re.search("District\ [0-9]+", local_data).start() 
-        districtInfoContainer = ic.DistrictInfoContainer(local_data[info_start:])
-    except:
-        districtInfoContainer = ic.DistrictInfoContainer(local_data)
+    sections = {}
+    for name, end_name in SECTION_ENDS.items():
+        if name not in starts:
+            sections[name] = (0, len(local_data))
+            continue
+        start = starts[name]
+        end = starts.get(end_name, len(local_data))
+        if end < start:     # The page is laid out differently than expected; keep everything after the heading
+            end = len(local_data)
+        sections[name] = (start, end)
+    return sections
+
+'''Sets up the InformationContainers of a page, each only given its own section's offsets within the (shared, uncopied) page.
+No field is extracted until it's looked up, unless the page's fields were already extracted. The page is its structured text
+(see pagetext); raw html, as stored by older versions of prog1, is converted to it first.'''
+def make_containers(local_data, fields=None):
+    if pagetext.is_html(local_data):
+        local_data = pagetext.page_text(local_data)
+    sections = split_sections(local_data)
+    return {
+        "contact info" : ic.ContactInfoContainer(local_data, *sections["contact"], fields=fields, time_budget=EXTRACTION_TIME_BUDGET),
+        "personal info" : ic.PersonalInfoContainer(local_data, *sections["personal"], fields=fields, time_budget=EXTRACTION_TIME_BUDGET),
+        "service" : ic.ServiceInfoContainer(local_data, *sections["service"], fields=fields, time_budget=EXTRACTION_TIME_BUDGET),
+        "district" : ic.DistrictInfoContainer(local_data, *sections["district"], fields=fields, time_budget=EXTRACTION_TIME_BUDGET)
+    }
 
+'''Returns the InformationContainers of a page (see make_containers). The containers of the most recent pages are kept, so
+repeated queries about a page reuse whatever was already extracted from it.'''
+@functools.lru_cache(maxsize=32)
+def get_containers(local_data):
+    return make_containers(local_data)
 
-    # After the containers are set up, parse the type of information provided by the user; if it's something
-    # expected, then provide the relevant information. Otherwise return a lack of info message
+'''Returns the information of the category (and subcategory, if any) held by the InformationContainers, or None if there's
+no such category.'''
+def render_answer(ic_dict, category, subcategory):
+    info_output = ''   
+
+    if category=='all':     # If all information is requested, print out info from every InfoContainer
+        current_categories = CATEGORIES.keys()
+        for key in current_categories:
+            info_output += ic_dict[key].format_dict_info()
+    elif category in CATEGORIES: # If the category is specified and its one of the known ones 
+        if subcategory is None: # if there is not subcategory, print all the category's info
+            info_output = ic_dict[category].format_dict_info()
+        elif subcategory in CATEGORIES[category]:     # If there's a valid subcategory, print out its info
+            info_output = ic_dict[category].search(subcategory)
+        else:   # Else, the subcategory does not exist; return None
+            info_output = None
+    else:   # Else, the category does not exist; return None
+        info_output = None
+
+    return info_output
+
+def parse_info(local_data, info_type):
+    # Parse the type of information provided by the user; if it's something expected, then provide the relevant
+    # information. Otherwise return a lack of info message
     try:
         user_request = info_type.lower()
         category = None
@@ -109,39 +277,17 @@ def parse_info(local_data, info_type):
         print("Error occurred in parsing the provided type. Make sure it's in a valid string format.")
         exit(1)
 
-    # Establish available categories (and subcategories) of information
-    category_dict = {
-        "contact info" : ['name','home address','columbia address','phone'],
-        "personal info" : ['birthday', 'parents', 'education', 'children', 'former', 'religion'],
-        "service" : ['service'],
-        "district" : ['district name', 'region']
-    }
-    # Likewise, set up matching dictionary for InfoContainers
-    ic_dict = {
-        "contact info" : contactInfoContainer,
-        "personal info" : personalInfoContainer,
-        "service" : serviceInfoContainer,
-        "district" : districtInfoContainer
-    }
+    # Answers to every known type of information are part of a profile snapshot. Others are answered from the
+    # snapshot's text and fields, as from a page's text
+    if isinstance(local_data, ProfileSnapshot):
+        if user_request in local_data.answers:
+            return local_data.answers[user_request]
+        ic_dict = make_containers('' if local_data.text is None else local_data.text, local_data.fields)
+    else:
+        ic_dict = get_containers(local_data)
 
     # Comprehend the provided category to see if the value is available
-    info_output = ''   
-
-    if category=='all':     # If all information is requested, print out info from every InfoContainer
-        current_categories = category_dict.keys()
-        for key in current_categories:
-            info_output += ic_dict[key].format_dict_info()
-    elif category in category_dict: # If the category is specified and its one of the known ones 
-        if subcategory is None: # if there is not subcategory, print all the category's info
-            info_output = ic_dict[category].format_dict_info()
-        elif subcategory in category_dict[category]:     # If there's a valid subcategory, print out its info
-            info_output = ic_dict[category].search(subcategory)
-        else:   # Else, the subcategory does not exist; return None
-            info_output = None
-    else:   # Else, the category does not exist; return None
-        info_output = None
-
-    return info_output
+    return render_answer(ic_dict, category, subcategory)
 
 
 def main():
@@ -150,7 +296,7 @@ def main():
     parser.add_argument('-t', '--type', required=True,
         help="REQUIRED: the type of information to retrieve (e.g. 'Contact Information' or 'Personal Information:education')")
     parser.add_argument('-p', '--pickle', action=argparse.BooleanOptionalAction, default=True,
-        help="retrieve html information from a pickle file in 'data' folder; if false, attempts to read \
+        help="retrieve the parsed profile from a snapshot pickled in 'data' folder; if false, attempts to read \
                 from a text file in 'data' called 'district93_local'")
     parser.add_argument('-f', '--file', action='store', type=str, default='district93_local.pkl',
         help="the file to input the data from; district93_local.pkl by default")
@@ -7,40 +7,71 @@
 """ Provides an interactable console-based UI for the chatbot. The PyDictionary
 module included in this project was created by Pradipta Bora 2020--all rights reserved."""
 # ---------------------------------------------------------------------------
+import os
 import chatbotparts.prog2 as prog2
-import json
 # ---------------------------------------------------------------------------
-from .config.definitions import ROOT_DIR
-from chatbotparts.prog4fuzzy import map_intent
+from .config.definitions import MATCH_WITH_HIERARCHY, MATCH_WITH_TRIE_INDEX, ROOT_DIR
+from chatbotparts.intentstore.reloader import IntentIndexReloader
+from chatbotparts.prog4fuzzy import IntentHierarchy, MatchOptions, MatchingLoadPolicy, map_intent, normalize_response
+from chatbotparts.thefuzz import backends
+from chatbotparts.thefuzz.trie import TrieIndex
+from chatbotparts.thefuzz.utils import NormalizedQuery
 from chatbotparts.prog5logger import ChatSessionLogger
 # ---------------------------------------------------------------------------
 
+MATCH_TIME_BUDGET = 0.25    # Most seconds spent matching a single question to a known query (see map_intent)
+LOAD_POLICY = MatchingLoadPolicy()  # Shared by every session, so matching degrades to cheaper tiers when many are active
+CALIBRATE_ENV_VAR = "MYREP_CALIBRATE_BACKENDS"  # Set to 1 to calibrate the scoring backends when the UI starts
+
 '''Extracts the info_type from the provided response. Handles stripping punctuation from the beginning and 
 end of the response and utilizes prog4fuzzy's map_intent function to try and choose the closest known query from
 the user's response. The known_queries dictionary and is provided in the config.json file within the data subdirectory.
 Returns the extracted info type and a boolean representing whether or not the returned info type is a confident match rather than
-a close suggestion. Returns None and False if no good match was found.'''
-def extract_info_type(response, known_queries):
-    # Check if response is a valid string
-    try:
-        response = response.lower() 
-    except:
-        print(f"~~Error: {response} was not a valid string!~~\n")
-        return None, False, None
+a close suggestion, along with the closest known query and the matching tier used. Returns None and False if no good match was found.
+The response may be given as a string or already normalized by prog4fuzzy's normalize_response. The matching options (see
+build_match_options) are passed on to map_intent, which is run through the given load_policy (a prog4fuzzy.MatchingLoadPolicy) if any.'''
+def extract_info_type(response, known_queries, options=MatchOptions(), load_policy=None):
+    # Check if response is a valid string, normalizing it (once, for every later stage) if it isn't already
+    if not isinstance(response, NormalizedQuery):
+        try:
+            response = normalize_response(response)
+        except:
+            print(f"~~Error: {response} was not a valid string!~~\n")
+            return None, False, None, None
 
     # Find closest matching known query, if any
-    response, is_confident = map_intent(response, known_queries, required_confidence=90)     
+    if load_policy is not None:
+        match = load_policy.map_intent(response, known_queries, required_confidence=90, options=options)
+    else:
+        match = map_intent(response, known_queries, required_confidence=90, options=options)
+    response, is_confident = match
 
     try:    
         # Try to return the information associated with that known query. Also return the closest match in case we want to notify the user
-        return known_queries[response], is_confident, response
+        return known_queries[response], is_confident, response, match.tier
     except KeyError:    # If the query isn't one of the known queries in the dictionary, there's no info
-        return None, False, None
+        return None, False, None, match.tier
     except TypeError:   # A TypeError here will occur if known_queries isn't a dictionary
         print(f"~~Error: The provided known_queries is not a valid dictionary!~~")
         exit(1)
 
 
+'''Builds the matching options of the given known queries for extract_info_type: the matching features enabled in the config
+(see config/definitions.py) and the time budget (in seconds) of each match.'''
+def build_match_options(known_queries, time_budget=None):
+    index = TrieIndex(known_queries) if MATCH_WITH_TRIE_INDEX else None
+    hierarchy = IntentHierarchy(known_queries) if MATCH_WITH_HIERARCHY else None
+    return MatchOptions(index=index, hierarchy=hierarchy, time_budget=time_budget)
+
+'''Times every available scoring backend of thefuzz on typical questions (see thefuzz.backends.calibrate), switches the fuzzy
+matching to the fastest one that scores like difflib, and reports the backend in use.'''
+def calibrate_backends():
+    try:
+        backends.calibrate()
+    except Exception as e:  # The default backend keeps working either way
+        print("~~Warning: could not calibrate the scoring backends: " + str(e) + "~~")
+    print(f"Fuzzy matching is using the {backends.describe_backend()} backend.\n")
+
 '''Apply a tab escape character before every line for prettier printing to console.'''
 def tab_format(string):
     string = '\t' + string  # tab for first line
@@ -61,11 +92,16 @@ def get_yes_no(user_input):
 
 '''Runs the UI for the program, handling user input with regards to the info within local_data.'''
 def run_ui(local_data):
+    # If asked to, pick the fastest scoring backend before any matching is done
+    if os.environ.get(CALIBRATE_ENV_VAR, "").lower() in ("1", "true", "yes"):
+        calibrate_backends()
+
     # Initialize known queries from config.json early to avoid repeated loading later
+    reloader = None
     try:
         config_path = ROOT_DIR + "/src/chatbotparts/config/config.json"
-        with open(config_path, "r") as f:
-            known_queries = json.load(f)    # Load dictionary of dictionaries from json. 
+        reloader = IntentIndexReloader(config_path)     # Load the compiled known queries and keep them up to date with config.json
+        known_queries = reloader.get_index()
     except FileNotFoundError:
         print(f"~~Error: Config JSON file not found in {config_path}; unable to load known queries. Default queries will be provided.~~\n")
         known_queries = {
@@ -98,12 +134,19 @@ def run_ui(local_data):
 
     # Create ChatSessionLogger
     logger = ChatSessionLogger()    # Defaults to the data/chat_statistics.csv path, but a different csv can be specified
+    options = build_match_options(known_queries, MATCH_TIME_BUDGET)
 
     while(response not in ('quit', 'Quit', 'q', 'Q')):
         found_relevant_answer = None  # Keep track of whether or not the chatbot found relevant info
 
+        # Pick up any edits made to config.json since the last question, along with the matching options of the new queries
+        if reloader is not None and reloader.check():
+            known_queries = reloader.get_index()
+            options = build_match_options(known_queries, MATCH_TIME_BUDGET)
+
         # Extract the info type requested (if one can be found) from the response
-        info_type, is_confident, closest_query = extract_info_type(response.lower(), known_queries)
+        info_type, is_confident, closest_query, match_tier = extract_info_type(normalize_response(response), known_queries,
+                                                                               options, LOAD_POLICY)
 
         # Using the parse_info method from prog2, retrieve the data associated with the info type from the local data
         output = prog2.parse_info(local_data, info_type)
@@ -125,7 +168,7 @@ def run_ui(local_data):
 
         # Log that question and answer if the user hasn't quit
         if response not in ('quit', 'Quit', 'q', 'Q'):
-            logger.log_q_a((response, chat_output), is_helpful_answer=found_relevant_answer)
+            logger.log_q_a((response, chat_output), is_helpful_answer=found_relevant_answer, match_tier=match_tier)
 
         response = input("What's your next question? ")
 
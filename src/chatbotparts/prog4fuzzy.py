@@ -11,33 +11,52 @@ The additional dependency it requires, difflib.py, is included here, within the
 Updated to provide possible suggestion to user if the confidence for a match is just short of the
 required_confidence, allowing for more forgiving use."""
 # ---------------------------------------------------------------------------
+import heapq
 import json
+import threading
+import time
+from collections import deque, namedtuple
+from functools import partial
 from math import floor
 # ---------------------------------------------------------------------------
-from chatbotparts.thefuzz import process
+from chatbotparts.thefuzz import fuzz, process, utils
+from chatbotparts.thefuzz.token_edit import TokenEditScorer, TokenVocabulary
 from string import punctuation
 # ---------------------------------------------------------------------------
 
+# Default dictionary of synonyms used by replace_with_similar, in the form of {tuple of synonym strings : intended word}
+DEFAULT_SYNONYMS = {("congressman","congresswoman","rep"):"representative",
+                    ("congressman's","congresswoman's","rep's"):"representative's",
+                    ("kid", "kids") : "children",
+                    ("office", "workplace") : "work",
+                    ("job", "position") : "role",
+                    ("reach", "talk", "speak", "call") : "contact",
+                    ("telephone","cellphone") : "phone",
+                    ("date of birth", "dob") : "birthday",
+                    ("degree","degrees","college","colleges","university","universities") : "education",
+                    ("past", "prior") : "former",
+                    ("government","govt") : "public office",
+                    ("all information", "all info") : "everything",
+                    ("my") : "the", # Assume that phrases such as "my representative" mean "the representative"
+                    ("they", "he", "she") : "the representative",   # Assume vague pronouns refer to the representative
+                    ("their","his","hers") : "the representative's"} # Assume that any vague absolute pronoun refer to the representative
+
+# Matching tiers, from the most accurate (and slowest) to the fastest; see map_intent and MatchingLoadPolicy
+FULL_TIER = "wratio"
+TOKEN_SORT_TIER = "token_sort"
+QRATIO_TIER = "qratio"
+INDEX_ONLY_TIER = "index_only"
+MATCH_TIERS = (FULL_TIER, TOKEN_SORT_TIER, QRATIO_TIER, INDEX_ONLY_TIER)
+_TIER_SCORERS = {FULL_TIER: fuzz.WRatio, TOKEN_SORT_TIER: fuzz.token_sort_ratio, QRATIO_TIER: fuzz.QRatio}
+# The known queries (as a frozenset) of the last dictionary looked up by INDEX_ONLY_TIER, and their {normalized form: known query}
+_normalized_lookup_cache = (frozenset(), {})
+
 '''Replaces certain words within the given response with the similar word used in the known queries; for example, 
 the word "congressman" in the user response would be replaced with "representative" as that's the term used within
 the known queries. '''
 def replace_with_similar(response, synonym_dict):
     if synonym_dict is None:    # If no dictionary of synonyms is specified, use default.
-        synonym_dict = {("congressman","congresswoman","rep"):"representative",
-                        ("congressman's","congresswoman's","rep's"):"representative's",
-                        ("kid", "kids") : "children",
-                        ("office", "workplace") : "work",
-                        ("job", "position") : "role",
-                        ("reach", "talk", "speak", "call") : "contact",
-                        ("telephone","cellphone") : "phone",
-                        ("date of birth", "dob") : "birthday",
-                        ("degree","degrees","college","colleges","university","universities") : "education",
-                        ("past", "prior") : "former",
-                        ("government","govt") : "public office",
-                        ("all information", "all info") : "everything",
-                        ("my") : "the", # Assume that phrases such as "my representative" mean "the representative"
-                        ("they", "he", "she") : "the representative",   # Assume vague pronouns refer to the representative
-                        ("their","his","hers") : "the representative's"} # Assume that any vague absolute pronoun refer to the representative
+        synonym_dict = DEFAULT_SYNONYMS
     try:
         every_synonym_list = synonym_dict.keys()
         edited_response = response.strip(punctuation) + " "   # Strip punctuation marks from beginning and end and prepare to scan through response to replace similar words
@@ -57,6 +76,49 @@ def replace_with_similar(response, synonym_dict):
                 edited_response = edited_response.replace(" " + synonym + " ", " " + relevant_word + " ")   # Replace any synonyms found with the relevant word       
     return edited_response
 
+'''Normalizes the user's response once for the whole request: the returned NormalizedQuery carries the lowered,
+punctuation-stripped, synonym-canonical (see replace_with_similar), fully processed and tokenized forms of the response,
+which map_intent and the thefuzz scorers then use instead of recomputing them.'''
+def normalize_response(response, synonym_dict=None):
+    return utils.NormalizedQuery(response, canonicalize=partial(replace_with_similar, synonym_dict=synonym_dict))
+
+'''Builds a token-level pre-scorer for the given known queries, interning every token of every known query into an
+integer id once. The returned scorer can be passed to map_intent as its prescorer (and reused across calls).'''
+def build_prescorer(known_queries):
+    return TokenEditScorer(TokenVocabulary(known_queries))
+
+
+class IntentMatch(namedtuple('IntentMatch', ['query', 'is_confident'])):
+    """ The result of map_intent: the matched known query (or None) and whether the match was confident. Unpacks like the
+    (query, is_confident) tuple map_intent has always returned, and additionally tells whether the match is partial, i.e.
+    whether map_intent's time budget ran out before every possible known query was scored, and which tier produced it.
+    The trace attribute is the thefuzz.trace.ScoreTrace given to map_intent, if any.
+    """
+
+    def __new__(cls, query, is_confident, partial=False, tier=None, trace=None):
+        match = super().__new__(cls, query, is_confident)
+        match.partial = partial
+        match.tier = tier
+        match.trace = trace
+        return match
+
+
+# The optional matching features of map_intent, each left off by default:
+#   prescorer, prescore_limit   a token-level prescorer (see build_prescorer) shortlisting the prescore_limit closest known queries,
+#                               only those then being scored with the (slower) scorer of the tier
+#   index, max_edits            a thefuzz.trie.TrieIndex of the known queries; if any are within max_edits character edits of the
+#                               response, only those are scored
+#   hierarchy, top_categories   an IntentHierarchy; only the known queries of the top_categories closest categories are scored,
+#                               unless the hierarchy can't tell the categories apart or none of them reaches the required confidence
+#   time_budget                 most seconds the match may take; the known queries are scored best-first until it runs out, and
+#                               the best match found so far is returned as partial
+#   tier                        one of MATCH_TIERS, trading accuracy for speed (see MatchingLoadPolicy). INDEX_ONLY_TIER does no
+#                               fuzzy scoring, only taking the closest hit of the index or an exact match of the normalized response
+#   trace                       a thefuzz.trace.ScoreTrace recording the sub-scores of every known query scored with WRatio
+MatchOptions = namedtuple('MatchOptions', ['prescorer', 'prescore_limit', 'index', 'max_edits', 'hierarchy', 'top_categories',
+                                           'time_budget', 'tier', 'trace'],
+                          defaults=(None, 5, None, 2, None, 2, None, FULL_TIER, None))
+
 '''Matches the user's response to the closest known query string and returns the cloest match along with a boolean
 denoting whether or not the match was exact, assuming a match was found (True if the confidence met the required confidence, False if it was within
 3% of the required confidence). In short, this method relies on the "TheFuzz" package for calculating the Levenshtein Distance 
@@ -66,10 +128,45 @@ None will be returned.
 An optional confidence_ratio can be provided which specifies how strictly the user response must match a known query 
 in order to return a proper match. Additionally, one can provide a dictionary of synonyms to use instead of the default
 (potentially useful if the known queries config is edited with new queries); dictionary entries should be in the form
-of {tuple of synonym strings : intended word}'''
-def map_intent(response, known_queries, required_confidence = 90, specified_synonyms = None):
+of {tuple of synonym strings : intended word}. The response can also be given already normalized (see normalize_response).
+Any other matching feature is set with options (see MatchOptions). Returns an IntentMatch.'''
+def map_intent(response, known_queries, required_confidence = 90, specified_synonyms = None, options = MatchOptions()):
+    steps = _map_intent_steps(response, known_queries, required_confidence, specified_synonyms, options)
+    result = None
+    while True:
+        try:
+            scan, args, scan_kwargs = steps.send(result)
+        except StopIteration as done:
+            return done.value
+        result = scan(*args, **scan_kwargs)
+
+'''Asynchronous version of map_intent for use within an asyncio event loop, returning the same IntentMatch. The scans over the known
+queries let the event loop run other tasks after every yield_every known queries scored (and can be cancelled between them); if an
+executor is given, scans over at least offload_threshold known queries are run in it instead. See process.extractAsync.'''
+async def map_intent_async(response, known_queries, required_confidence = 90, specified_synonyms = None, options = MatchOptions(),
+                           yield_every = 100, executor = None, offload_threshold = 5000):
+    async_scans = {process.extract: process.extractAsync, process.extractOne: process.extractOneAsync,
+                   process.extractOneWithin: process.extractOneWithinAsync}
+    steps = _map_intent_steps(response, known_queries, required_confidence, specified_synonyms, options)
+    result = None
+    while True:
+        try:
+            scan, args, scan_kwargs = steps.send(result)
+        except StopIteration as done:
+            return done.value
+        result = await async_scans[scan](*args, yield_every=yield_every, executor=executor, offload_threshold=offload_threshold,
+                                         **scan_kwargs)
+
+'''The body of map_intent and map_intent_async. Rather than scanning the known queries itself, it yields each scan as a
+(scan, args, kwargs) tuple, the scan being process.extract, extractOne or extractOneWithin, and is sent back its result, so that
+each caller can run the scans its own way. Returns the IntentMatch.'''
+def _map_intent_steps(response, known_queries, required_confidence, specified_synonyms, options):
+    prescorer, prescore_limit, index, max_edits, hierarchy, top_categories, time_budget, tier, trace = options
+    if time_budget is not None:
+        deadline = time.perf_counter() + time_budget
     try:
-        possible_queries = known_queries.keys()  # Grab all possible known queries
+        all_queries = known_queries.keys()  # Grab all possible known queries
+        possible_queries = all_queries
         
         # Ensure required_confidence is within expected bounds, notifying the user and correcting the value if it isn't
         if required_confidence < 0: 
@@ -88,17 +185,310 @@ def map_intent(response, known_queries, required_confidence = 90, specified_syno
         print(ve)
 
     # Find synonyms for words in the known queries and replace them with closer matching words to make the intent mapping more robust
-    response = replace_with_similar(response, specified_synonyms)   
-    # Calculate distance similarity ratio of response and each known query, then grab the 
-    # best match and its ratio (100 being a perfect match)
-    best_match = process.extractOne(response, possible_queries) 
+    if not isinstance(response, utils.NormalizedQuery):
+        response = normalize_response(response, specified_synonyms)
+    # If an index was given, only consider the known queries within the edit budget (if there are any)
+    index_hits = []
+    if index is not None:
+        index_hits = index.search(response, max_edits)
+        nearby_queries = [hit[0] for hit in index_hits]
+        if nearby_queries:
+            possible_queries = nearby_queries
+            hierarchy = None    # The nearby queries are already a small enough set to score
+
+    is_partial = False
+    if tier == INDEX_ONLY_TIER:     # No fuzzy scoring at all, only what the index (or an exact lookup) finds
+        best_match = _lookup_intent(response, known_queries, index_hits)
+    else:
+        score_queries = partial(_score_queries, response, known_queries, all_queries, prescorer, prescore_limit, tier,
+                                None if time_budget is None else deadline, trace)
+        # If a hierarchy was given, first only consider the known queries within the closest categories
+        candidates = None if hierarchy is None else hierarchy.candidates(response, top_categories)
+        if candidates is not None:
+            best_match, is_partial = yield from score_queries(candidates)
+        if candidates is None or (best_match[1] < required_confidence and not is_partial):
+            # Otherwise (or if none of them was close enough), score every possible known query
+            flat_match, is_partial = yield from score_queries(possible_queries)
+            if candidates is None or flat_match[1] >= best_match[1]:
+                best_match = flat_match
     if(best_match[1] < required_confidence):    # if less than the required confidence, see if it's relatively close
         if(best_match[1] >= floor(required_confidence-(required_confidence*0.03))):   # If the best match is within 5%, give the suggestion
-            return best_match[0], False
+            return IntentMatch(best_match[0], False, is_partial, tier, trace)
         # Otherwise there's not a good match
-        return None, False  
+        return IntentMatch(None, False, is_partial, tier, trace)
     else:   # It's a confident match
-        return best_match[0], True
+        return IntentMatch(best_match[0], True, is_partial, tier, trace)
+
+'''Scores the given possible known queries for _map_intent_steps with the tier's scorer, yielding the scans the same way. If a
+prescorer was given, only the closest few by token-level edit distance are scored. Only the time left until the deadline (if any)
+goes to scoring. Returns the best match as a (known query, score) tuple along with whether the deadline cut the scoring short.'''
+def _score_queries(response, known_queries, all_queries, prescorer, prescore_limit, tier, deadline, trace, possible_queries):
+    # If a prescorer was given, narrow the possible queries down to the closest few by token-level edit distance
+    if prescorer is not None:
+        shortlist = yield process.extract, (response, possible_queries), dict(scorer=prescorer, limit=prescore_limit)
+        possible_queries = [candidate[0] for candidate in shortlist]
+    # Calculate distance similarity ratio of response and each known query with the tier's scorer, then grab the
+    # best match and its ratio (100 being a perfect match). Whatever is left of the time budget goes to scoring
+    scorer = _TIER_SCORERS[tier]
+    is_partial = False
+    if deadline is None:
+        extract_one, budget = process.extractOne, ()
+    else:
+        extract_one, budget = process.extractOneWithin, (max(deadline - time.perf_counter(), 0),)
+    normalized_choices = getattr(known_queries, "get_normalized_choices", None)
+    if normalized_choices is None:
+        best_match = yield extract_one, (response, possible_queries, *budget), dict(scorer=scorer, trace=trace)
+        if deadline is not None:
+            best_match, is_partial = best_match
+    elif possible_queries is all_queries and tier == FULL_TIER:
+        # Score the known queries' normalized forms one length bucket at a time, skipping the buckets that can't win
+        best_match = yield extract_one, (response, known_queries.get_prepared_choices(), *budget), dict(trace=trace)
+        if deadline is not None:
+            best_match, is_partial = best_match
+        best_match = (best_match[2], best_match[1])  # (known query, score) like the unprocessed case
+    else:   # The known queries are already normalized as well, so nothing needs processing
+        normalized_choices = normalized_choices()
+        if possible_queries is not all_queries:   # Only score the narrowed down queries
+            normalized_choices = {query: normalized_choices[query] for query in possible_queries}
+        best_match = yield extract_one, (response, normalized_choices, *budget), dict(processor=None, trace=trace,
+                                                                                      scorer=partial(scorer, full_process=False))
+        if deadline is not None:
+            best_match, is_partial = best_match
+        best_match = (best_match[2], best_match[1])  # (known query, score) like the unprocessed case
+    return best_match, is_partial
+
+'''Finds the known query matching the (normalized) response without any fuzzy scoring, for map_intent's INDEX_ONLY_TIER. The closest
+of the given index hits is scored by its edit distance relative to the response's length; without hits, a known query whose normalized
+form (as compared by the scorers, so ignoring case and punctuation) is exactly the response's scores 100. Returns a (known query, score) tuple, or (None, 0) if nothing was found.'''
+def _lookup_intent(response, known_queries, index_hits):
+    if index_hits:
+        query, distance = index_hits[0]     # Hits are sorted closest first
+        return query, utils.intr(100 * (1 - distance / max(len(response), 1)))
+
+    lookup_normalized = getattr(known_queries, "lookup_normalized", None)
+    if lookup_normalized is not None:   # A compiled intent index can look up normalized forms directly
+        matches = lookup_normalized(response.processed)
+    else:   # Try the response's own forms as keys first, then the known queries' normalized forms like the index does
+        matches = [query for query in (response.canonical.strip(), response.processed) if query in known_queries]
+        if not matches:
+            query = _normalized_lookup(known_queries).get(response.processed)
+            matches = [query] if query is not None else []
+    return (matches[0], 100) if matches else (None, 0)
+
+'''Returns the {normalized form: known query} dictionary of the given known queries (the first known query wins when several share a
+form), for _lookup_intent. It is only rebuilt when the known queries differ from the last ones it was built for.'''
+def _normalized_lookup(known_queries):
+    global _normalized_lookup_cache
+    cached_queries, lookup = _normalized_lookup_cache
+    if cached_queries != known_queries.keys():
+        lookup = {}
+        for query in known_queries:
+            lookup.setdefault(utils.full_process(query, force_ascii=True), query)
+        _normalized_lookup_cache = (frozenset(known_queries), lookup)   # Replaced in one step, so other threads see either version
+    return lookup
+
+
+class MatchingLoadPolicy():
+    """ Degrades map_intent to cheaper matching tiers while the chatbot is under load, and restores it once the load drops.
+    Load is measured as the average latency of the last window matches and the number of matches currently in progress;
+    the policy moves one tier down (see MATCH_TIERS) for each of latency_thresholds or concurrency_thresholds exceeded.
+    Moving back up requires the load to fall below the thresholds scaled by recovery_ratio, so the tier doesn't flap
+    when the load hovers around a threshold.
+
+    A single policy is meant to be shared by every session; run matches through its map_intent method.
+    """
+
+    def __init__(self, latency_thresholds=(0.05, 0.1, 0.2), concurrency_thresholds=(4, 8, 16), recovery_ratio=0.5, window=20):
+        """ Creates a new policy starting at the full tier. Thresholds are given for leaving each tier but the last, in
+        seconds for latency_thresholds and in concurrent matches for concurrency_thresholds."""
+        self._latency_thresholds = latency_thresholds
+        self._concurrency_thresholds = concurrency_thresholds
+        self._recovery_ratio = recovery_ratio
+        self._latencies = deque(maxlen=window)
+        self._active = 0
+        self._level = 0     # Index of the current tier in MATCH_TIERS
+        self._lock = threading.Lock()
+
+    def _load_level(self, latency, active, scale):
+        """ Returns the tier level the given load calls for, with every threshold multiplied by scale."""
+        level = 0
+        while level < len(MATCH_TIERS) - 1 and (latency > self._latency_thresholds[level] * scale
+                                                  or active > self._concurrency_thresholds[level] * scale):
+            level += 1
+        return level
+
+    def get_tier(self):
+        """ Returns the tier the next match would use."""
+        return MATCH_TIERS[self._level]
+
+    def acquire(self):
+        """ Registers the start of a match and returns the tier it should use. Every acquire() must be followed by a
+        release() once the match is done."""
+        with self._lock:
+            self._active += 1
+            latency = sum(self._latencies) / len(self._latencies) if self._latencies else 0
+            level = self._load_level(latency, self._active, 1)
+            if level < self._level:     # Only step back up once the load has clearly dropped
+                level = min(self._level, self._load_level(latency, self._active, self._recovery_ratio))
+            self._level = level
+            return MATCH_TIERS[level]
+
+    def release(self, latency):
+        """ Registers the end of a match which took latency seconds."""
+        with self._lock:
+            self._active -= 1
+            self._latencies.append(latency)
+
+    def map_intent(self, response, known_queries, options=MatchOptions(), **kwargs):
+        """ Runs map_intent (with any of its other arguments) with the given options, at the tier the current load calls for."""
+        tier = self.acquire()
+        start = time.perf_counter()
+        try:
+            return map_intent(response, known_queries, options=options._replace(tier=tier), **kwargs)
+        finally:
+            self.release(time.perf_counter() - start)
+
+    async def map_intent_async(self, response, known_queries, options=MatchOptions(), **kwargs):
+        """ Runs map_intent_async (with any of its other arguments) with the given options, at the tier the current load calls for."""
+        tier = self.acquire()
+        start = time.perf_counter()
+        try:
+            return await map_intent_async(response, known_queries, options=options._replace(tier=tier), **kwargs)
+        finally:
+            self.release(time.perf_counter() - start)
+
+
+class IntentHierarchy():
+    """ Groups the known queries by the category of the info type they map to (the part before the ':', e.g. "Contact Info")
+    and keeps a small set of prototype queries for each category. Used by map_intent's hierarchical mode to score a response
+    against the prototypes first, then only against the known queries of the closest categories.
+
+    The prototypes of a category are its own name, the names of its subcategories, and up to prototypes_per_category of its
+    queries, chosen greedily so that together they cover as many of the category's distinct words as possible.
+
+    When the last category kept scores within margin of the first one left out, the response is too close to call between
+    them, and the hierarchy gives no candidates at all (map_intent then scores every known query).
+    """
+
+    def __init__(self, known_queries, prototypes_per_category=3, margin=5):
+        """ Creates a new IntentHierarchy from a dictionary of known queries (as used by map_intent)."""
+        self._margin = margin
+        self._category_queries = {}
+        self._prototype_categories = {}     # Prototype -> its category
+        for query, info_type in known_queries.items():
+            category = info_type.split(':')[0]
+            self._category_queries.setdefault(category, []).append(query)
+            self._prototype_categories[info_type.lower().replace(':', ' ')] = category   # Category and subcategory names
+
+        for category, queries in self._category_queries.items():
+            for prototype in self._choose_prototypes(queries, prototypes_per_category):
+                self._prototype_categories[prototype] = category
+
+    @staticmethod
+    def _choose_prototypes(queries, count):
+        """ Greedily picks up to count queries which together cover the most distinct words of the given queries."""
+        if len(queries) <= count:
+            return list(queries)
+        remaining = {query: set(query.lower().split()) for query in queries}
+        covered = set()
+        prototypes = []
+        while remaining and len(prototypes) < count:
+            best = max(remaining, key=lambda query: len(remaining[query] - covered))
+            covered |= remaining.pop(best)
+            prototypes.append(best)
+        return prototypes
+
+    def get_categories(self):
+        return list(self._category_queries.keys())
+
+    def candidates(self, response, top_categories=2):
+        """ Returns the known queries of the top_categories categories whose prototypes best match the response, or None
+        if the next best category scores within margin of the last of them."""
+        category_scores = {}
+        for prototype, score in process.extractWithoutOrder(response, self._prototype_categories.keys()):
+            category = self._prototype_categories[prototype]
+            category_scores[category] = max(score, category_scores.get(category, 0))
+
+        closest = heapq.nlargest(top_categories + 1, category_scores, key=category_scores.get)
+        if len(closest) > top_categories:
+            left_out = closest.pop()
+            if category_scores[closest[-1]] - category_scores[left_out] <= self._margin:
+                return None
+        return [query for category in closest for query in self._category_queries[category]]
+
+
+class IntentSuggestionSession():
+    """ Suggests known queries while the user is still typing. The session keeps, for every known query still in contention,
+    the row of the edit distance table between the text typed so far and that query's prefixes; appending a character only
+    computes one new row per query in contention, and deleting characters simply restores the rows kept for the shorter text.
+
+    A known query drops out of contention once no prefix of it is within max_edits of the typed text. Since the smallest
+    value of a row can never decrease as more characters are typed, a dropped query cannot come back until characters are
+    deleted, so the cost of each keystroke is proportional to the number of queries still in contention.
+
+    Sessions are meant for front ends which see every keystroke; the console UI (prog3ui) reads whole lines, so it doesn't use one.
+    """
+
+    def __init__(self, known_queries, max_edits=3, limit=5):
+        """ Creates a new session with no text typed. The known_queries dictionary is the same one given to map_intent;
+        limit is the number of suggestions returned after each keystroke."""
+        self._known_queries = known_queries
+        self._max_edits = max_edits
+        self._limit = limit
+        self._text = ""
+        # One frame per typed character (plus one for the empty text); each frame lists the queries still in contention
+        # as (query, lowered query, current row, smallest value of the row) tuples
+        self._frames = [[(query, query.lower(), list(range(len(query) + 1)), 0) for query in known_queries.keys()]]
+
+    def get_text(self):
+        return self._text
+
+    def append(self, chars):
+        """ Appends the given characters to the typed text and returns the updated suggestions."""
+        max_edits = self._max_edits
+        for char in chars.lower():
+            next_frame = []
+            for query, lowered, previous, _ in self._frames[-1]:
+                current = [previous[0] + 1]
+                for i, query_char in enumerate(lowered, 1):
+                    current.append(min(current[i - 1] + 1, previous[i] + 1, previous[i - 1] + (query_char != char)))
+                best = min(current)
+                if best <= max_edits:   # Otherwise, the query is out of contention for any longer text
+                    next_frame.append((query, lowered, current, best))
+            self._frames.append(next_frame)
+        self._text += chars
+        return self.suggestions()
+
+    def delete(self, count=1):
+        """ Deletes the given number of characters from the end of the typed text and returns the updated suggestions."""
+        count = min(count, len(self._text))
+        if count > 0:
+            del self._frames[-count:]
+            self._text = self._text[:-count]
+        return self.suggestions()
+
+    def set_text(self, text):
+        """ Replaces the typed text, only recomputing the rows after the prefix shared with the current text."""
+        shared = 0
+        for old_char, new_char in zip(self._text.lower(), text.lower()):
+            if old_char != new_char:
+                break
+            shared += 1
+        self.delete(len(self._text) - shared)
+        return self.append(text[shared:])
+
+    def suggestions(self):
+        """ Returns up to limit (known query, edit distance) tuples for the text typed so far, closest first. The distance
+        is the number of edits between the typed text and the closest prefix of the known query."""
+        if not self._text:
+            return []
+        closest = heapq.nsmallest(self._limit, self._frames[-1], key=lambda entry: (entry[3], entry[2][-1]))
+        return [(entry[0], entry[3]) for entry in closest]
+
+    def submit(self, required_confidence=90, specified_synonyms=None):
+        """ Maps the completed text to a known query with map_intent, exactly as if it had been entered all at once."""
+        return map_intent(self._text.lower(), self._known_queries, required_confidence, specified_synonyms)
+
 
 # Primarily used for testing. This module is moreso meant to be imported for use in another script, e.g. prog3ui.py,
 # where the map_intent is called directly
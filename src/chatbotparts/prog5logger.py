@@ -26,19 +26,24 @@ class ChatSessionLogger():
     Use the log_q_a method to record queries and answers between the user and the chatbot, then use the finalize_session() method to 
     write the statistics to the local text file and update the specified csv with that log's info.
 
+    The matching tier of each answer (see prog4fuzzy's MatchingLoadPolicy) can also be logged, in which case the number of answers
+    per tier is written to a separate tiers csv, keeping the chat text file and the statistics csv in their usual format.
+
     Once the finalize_session() method is called, no further chat information and can logged (or written to the csv).
     """
     _start_time = None
     _chat_file_name = None
     _csv_path = None
+    _tiers_csv_path = None
     _chat_sessions_path = None
+    _tier_counts = None     # Number of answers per matching tier
     _user_utterance_count = 0
     _system_utterance_count = 0
     _duration = None
     _finalized = False  # Tracks whether this logger's data has already been written to the provided .csv
 
 
-    def __init__(self, csv_path='../data/chat_statistics.csv', text_path='../data/chat_sessions'):
+    def __init__(self, csv_path='../data/chat_statistics.csv', text_path='../data/chat_sessions', tiers_csv_path='../data/chat_match_tiers.csv'):
         """ Creates a ChatSessionLogger for a given chat, initializing relevant variables. If no csv path is provided, the
         ChatSessionLogger will write the current session's information to a default location within the data subdirectory."""
 
@@ -47,6 +52,8 @@ class ChatSessionLogger():
         self._chat_file_name = str(self._start_time)[:-7].replace(" ","_")  # Exclude the decimal places for seconds and replacing space character with underline
         self._chat_file_name = self._chat_file_name.replace(":","-") + ".txt"   # Replace colons as they're invalid file name characters, and add extension
         self._csv_path = csv_path                                    # Set the csv path
+        self._tiers_csv_path = tiers_csv_path                        # Set the matching tiers csv path
+        self._tier_counts = {}
         self._chat_sessions_path = text_path + "/" + self._chat_file_name  # Set the chat sessions folder path
 
 
@@ -64,14 +71,15 @@ class ChatSessionLogger():
 
 
     @_not_finalized
-    def log_q_a(self, question_answer: Union[tuple, list], is_helpful_answer=True, add_newline=False):
+    def log_q_a(self, question_answer: Union[tuple, list], is_helpful_answer=True, add_newline=False, match_tier=None):
         """ Creates a chat_session text file with the provided file name if it does not already exist and logs the user's questions and 
         the chatbot's answers. Also increments the utterance counts. question_answer must be a tuple or list with the first entry 
         being the user's question and the second entry being the chatbot's response. 
         
         This method assumes that all chatbot utterances were helpful by default. To signify that the chatbot found no relevant information for the question,
         set helpful_answer to False. Non-helpful answers will not contribute to the overall chatbot utterance count.
-        Lastly, if add_newline is True, a newline character is added at the end of the question and answer."""
+        If add_newline is True, a newline character is added at the end of the question and answer. Lastly, match_tier records the
+        matching tier which produced the answer, if known."""
 
         # Create chat file if it does not exist already and write the provided question and answer to it
         try:
@@ -86,6 +94,8 @@ class ChatSessionLogger():
                 self._user_utterance_count += 1
                 if is_helpful_answer:  # Only increment system response count if it had a helpful response (provides more meaningful stats)
                     self._system_utterance_count += 1
+                if match_tier is not None:
+                    self._tier_counts[match_tier] = self._tier_counts.get(match_tier, 0) + 1
         except TypeError as te:
             print("The question_answer parameter must be a tuple or list: " + str(te))
             exit(1)
@@ -131,7 +141,8 @@ class ChatSessionLogger():
 
     def _to_csv(self):
         """ Writes the current chat text file's info and statistics to the .csv file specified in the constructor. 
-        The information is written in the following order: session number, chat file name, number of user utterances, number of chat bot utterances, and duration in seconds."""
+        The information is written in the following order: session number, chat file name, number of user utterances, number of chat bot utterances, and duration in seconds.
+        The number of answers per matching tier, if any were logged, is written to the tiers csv as one row per tier."""
 
         # First, calculate and combine all relevant info into a single structure
         session_number = 1 
@@ -143,11 +154,15 @@ class ChatSessionLogger():
         
         # Capture all necessary chat info   
         chat_info = [(session_number, self._chat_file_name, self._user_utterance_count, self._system_utterance_count, round(self._duration, 2))]  
+        tier_info = [(session_number, self._chat_file_name, tier, count) for tier, count in self._tier_counts.items()]
 
         # Then, using pandas DataFrames, we can effectively store and then write the individual log to the csv
         try:
             log_df = pd.DataFrame(chat_info, columns=["Session No.", "Chat File", "User Utt.", "Chatbot Utt.", "Duration"], )
             log_df.to_csv(self._csv_path, mode='a', header=not os.path.exists(self._csv_path), index=False)  # Only write header if the csv hasn't been made already
+            if tier_info:   # One row per matching tier used during the session
+                tier_df = pd.DataFrame(tier_info, columns=["Session No.", "Chat File", "Match Tier", "Answers"])
+                tier_df.to_csv(self._tiers_csv_path, mode='a', header=not os.path.exists(self._tiers_csv_path), index=False)
         except Exception as e:  # if question_answer isn't a tuple or list
             print("Error occurred when writing data to csv: " + str(e))
             exit(1)
@@ -0,0 +1,235 @@
+#!/usr/bin/env python
+# encoding: utf-8
+"""Registry of the SequenceMatcher implementations the scorers can run on.
+
+fuzz.ratio() and fuzz.partial_ratio() only need a SequenceMatcher-like
+class (ratio() and get_matching_blocks()), and several are available
+depending on what is installed. Each is registered here under a name, in
+order of preference, and the first one that can be imported is used by
+default, with a warning when that is a pure python one although compiled
+ones are registered (i.e. none of them is installed). use_backend()
+switches to another one and calibrate() times every available backend on
+typical inputs, switching to the fastest one whose scores agree with the
+reference implementation.
+"""
+from __future__ import unicode_literals
+import argparse
+import logging
+import time
+
+logger = logging.getLogger(__name__)
+
+
+def _load_levenshtein():
+    from .StringMatcher import StringMatcher
+    return StringMatcher
+
+
+def _load_rapidfuzz():
+    from rapidfuzz.distance import Indel
+
+    class RapidfuzzMatcher(object):
+        """A SequenceMatcher-like class built on top of rapidfuzz"""
+
+        def __init__(self, isjunk=None, seq1='', seq2=''):
+            self._str1, self._str2 = seq1, seq2
+
+        def set_seqs(self, seq1, seq2):
+            self._str1, self._str2 = seq1, seq2
+
+        def ratio(self):
+            return Indel.normalized_similarity(self._str1, self._str2)
+
+        def get_matching_blocks(self):
+            blocks = Indel.opcodes(self._str1, self._str2).as_matching_blocks()
+            return [(block.a, block.b, block.size) for block in blocks]
+
+    return RapidfuzzMatcher
+
+
+def _load_stdlib_difflib():
+    from difflib import SequenceMatcher
+    return SequenceMatcher
+
+
+def _load_vendored_difflib():
+    from .difflib import SequenceMatcher
+    return SequenceMatcher
+
+
+# Name -> (loader returning the class or raising ImportError, pure python?)
+_backends = {}
+_active = None
+
+
+def register_backend(name, loader, pure_python=False):
+    """Register a SequenceMatcher implementation.
+
+    Backends registered later are preferred less by default.
+
+    Args:
+        name: The name the backend is selected by.
+        loader: Function returning the SequenceMatcher-like class, raising
+            ImportError if its dependencies aren't installed.
+        pure_python: Whether the backend runs in pure python (and is
+            therefore much slower than a C extension).
+    """
+    _backends[name] = (loader, pure_python)
+
+
+register_backend('python-Levenshtein', _load_levenshtein)
+register_backend('rapidfuzz', _load_rapidfuzz)
+register_backend('vendored-difflib', _load_vendored_difflib, pure_python=True)
+register_backend('difflib', _load_stdlib_difflib, pure_python=True)
+
+
+def get_backend(name):
+    """Return the SequenceMatcher class of a registered backend.
+
+    Raises:
+        KeyError: If no backend is registered under that name.
+        ImportError: If the backend's dependencies aren't installed.
+    """
+    loader, _ = _backends[name]
+    return loader()
+
+
+def available_backends():
+    """Return the names of the backends which can be imported, in order of
+    preference."""
+    names = []
+    for name in _backends:
+        try:
+            get_backend(name)
+        except ImportError:
+            continue
+        names.append(name)
+    return names
+
+
+def default_backend():
+    """Return the name of the most preferred backend which can be imported."""
+    return available_backends()[0]
+
+
+def use_default_backend():
+    """Make fuzz's scorers run on the default backend, logging a warning if
+    it is pure python while compiled backends are registered. Returns its
+    name."""
+    name = default_backend()
+    use_backend(name)
+    if is_pure_python(name) and not all(pure_python for _, pure_python in _backends.values()):
+        compiled = [other for other, (_, pure_python) in _backends.items() if not pure_python]
+        logger.warning("No compiled scoring backend is installed (%s); thefuzz scorers are falling back to the much "
+                       "slower %s", " or ".join(compiled), describe_backend(name))
+    return name
+
+
+def use_backend(name):
+    """Make fuzz's scorers run on the given backend."""
+    global _active
+    from . import fuzz
+    fuzz.SequenceMatcher = get_backend(name)
+    _active = name
+    logger.info("thefuzz scorers are using the %s backend", describe_backend(name))
+
+
+def get_active_backend():
+    """Return the name of the backend fuzz's scorers are running on."""
+    return _active
+
+
+def is_pure_python(name=None):
+    """Whether the given (by default, the active) backend is pure python."""
+    return _backends[name or _active][1]
+
+
+def describe_backend(name=None):
+    """Return a short description of the given (by default, the active)
+    backend, e.g. "difflib (pure python)"."""
+    name = name or _active
+    return "{0} ({1})".format(name, "pure python" if is_pure_python(name) else "compiled")
+
+
+# Pairs of the kind compared by the chatbot: a typed question against known queries
+_CALIBRATION_PAIRS = [
+    ("where does the representative live", "where does the representative work"),
+    ("what is the representatives phone numbr", "what is the representative's phone number"),
+    ("phone", "what is the representative's phone number"),
+    ("tell me everything about the representative", "tell me everything"),
+    ("committees", "what committees is the representative on"),
+    ("how do i contact the representative", "contact the representative"),
+    ("education", "what is the representative's education"),
+    ("who is the representative", "tell me about the representative"),
+    ("service in public office", "what is the representative's service in public office"),
+    ("xyz", "what is the representative's home address"),
+]
+
+
+def calibrate(pairs=None, repeat=20, tolerance=5, reference='difflib', apply=True):
+    """Time every available backend and switch to the fastest one that
+    agrees with the reference backend.
+
+    A backend agrees with the reference if fuzz.ratio() and
+    fuzz.partial_ratio() computed with it are within tolerance of the
+    reference's for every pair. (Backends based on Levenshtein distance
+    and on difflib's matching blocks legitimately differ by a few points.)
+
+    Args:
+        pairs: Optional list of (s1, s2) pairs of processed strings to time
+            and compare. Defaults to typical chatbot inputs.
+        repeat: Number of times every pair is scored when timing.
+        tolerance: Largest accepted score difference with the reference.
+        reference: Name of the backend whose scores are taken as correct.
+        apply: Whether to switch to the chosen backend.
+
+    Returns:
+        List of (name, seconds, agrees) tuples, fastest first.
+    """
+    from . import fuzz
+    pairs = pairs or _CALIBRATION_PAIRS
+    previous = _active
+
+    def scores():
+        return [(fuzz.ratio(s1, s2), fuzz.partial_ratio(s1, s2)) for s1, s2 in pairs]
+
+    results = []
+    try:
+        fuzz.SequenceMatcher = get_backend(reference)
+        expected = scores()
+        for name in available_backends():
+            fuzz.SequenceMatcher = get_backend(name)
+            agrees = all(abs(a - b) <= tolerance
+                         for got, want in zip(scores(), expected) for a, b in zip(got, want))
+            start = time.perf_counter()
+            for _ in range(repeat):
+                scores()
+            results.append((name, time.perf_counter() - start, agrees))
+    finally:
+        fuzz.SequenceMatcher = get_backend(previous)
+
+    results.sort(key=lambda result: result[1])
+    chosen = next((name for name, _, agrees in results if agrees), previous)
+    if apply:
+        use_backend(chosen)
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Reports and calibrates the scoring backends of thefuzz', add_help=True)
+    parser.add_argument('-c', '--calibrate', action='store_true',
+                        help="time every available backend and report the fastest one agreeing with difflib")
+    args = parser.parse_args()
+
+    # When run as a script this module is __main__; the registry fuzz uses is the imported one
+    from . import backends, fuzz  # noqa: F401 (importing fuzz selects the default backend)
+    print("Active backend: " + backends.describe_backend())
+    print("Available backends: " + ", ".join(backends.available_backends()))
+    if args.calibrate:
+        for name, seconds, agrees in backends.calibrate(apply=False):
+            print("  {0:<20} {1:8.2f} ms  {2}".format(name, seconds * 1000,
+                                                       "agrees" if agrees else "disagrees"))
+
+
+if __name__ == "__main__":
+    main()
@@ -1,19 +1,16 @@
 #!/usr/bin/env python
 # encoding: utf-8
 from __future__ import unicode_literals
-import platform
-import warnings
-
-try:
-    from .StringMatcher import StringMatcher as SequenceMatcher
-except ImportError:
-    if platform.python_implementation() != "PyPy":
-        # Zt572: This line is commented out as the faster package isn't required (and the slower one is used for user convenience)
-        #warnings.warn('Using slow pure-python SequenceMatcher. Install python-Levenshtein to remove this warning')
-        pass
-    from difflib import SequenceMatcher
+import functools
 
+from . import backends
 from . import utils
+from .token_edit import token_distance_ratio
+
+# The most preferred installed backend is used. The faster packages aren't required, for user convenience, but falling
+# back to a pure-python one logs a warning; see backends.describe_backend() to check which one is active
+SequenceMatcher = None
+backends.use_default_backend()
 
 
 ###########################
@@ -76,6 +73,8 @@ def partial_ratio(s1, s2):
 
 def _process_and_sort(s, force_ascii, full_process=True):
     """Return a cleaned string with token sorted."""
+    if isinstance(s, utils.NormalizedQuery) and (not full_process or force_ascii == s.force_ascii):
+        return s.sorted_tokens
     # pull tokens
     ts = utils.full_process(s, force_ascii=force_ascii) if full_process else s
     tokens = ts.split()
@@ -135,8 +134,8 @@ def _token_set(s1, s2, partial=True, force_ascii=True, full_process=True):
         return 0
 
     # pull tokens
-    tokens1 = set(p1.split())
-    tokens2 = set(p2.split())
+    tokens1 = p1.token_set if isinstance(p1, utils.NormalizedQuery) else set(p1.split())
+    tokens2 = p2.token_set if isinstance(p2, utils.NormalizedQuery) else set(p2.split())
 
     intersection = tokens1.intersection(tokens2)
     diff1to2 = tokens1.difference(tokens2)
@@ -175,6 +174,37 @@ def partial_token_set_ratio(s1, s2, force_ascii=True, full_process=True):
     return _token_set(s1, s2, partial=True, force_ascii=force_ascii, full_process=full_process)
 
 
+# Token Edit
+#   intern the tokens of both strings into integer ids
+#   and take the edit distance between the two id sequences
+#   much cheaper than character-level ratios on longer sentences
+def token_edit_ratio(s1, s2, force_ascii=True, full_process=True):
+    """Return a measure of the sequences' similarity between 0 and 100
+    based on the number of whole tokens inserted, deleted or substituted.
+
+    To intern the tokens of a fixed set of choices only once, use
+    token_edit.TokenEditScorer instead.
+    """
+    if full_process:
+        p1 = utils.full_process(s1, force_ascii=force_ascii)
+        p2 = utils.full_process(s2, force_ascii=force_ascii)
+    else:
+        p1 = s1
+        p2 = s2
+
+    if not utils.validate_string(p1):
+        return 0
+    if not utils.validate_string(p2):
+        return 0
+
+    tokens1 = p1.tokens if isinstance(p1, utils.NormalizedQuery) else p1.split()
+    tokens2 = p2.tokens if isinstance(p2, utils.NormalizedQuery) else p2.split()
+    ids = {}
+    ids1 = [ids.setdefault(token, len(ids)) for token in tokens1]
+    ids2 = [ids.setdefault(token, len(ids)) for token in tokens2]
+    return token_distance_ratio(ids1, ids2)
+
+
 ###################
 # Combination API #
 ###################
@@ -222,6 +252,15 @@ def UQRatio(s1, s2, full_process=True):
     return QRatio(s1, s2, force_ascii=False, full_process=full_process)
 
 
+# The scales WRatio applies to its sub-scores (see WRatio), which also
+# bound the score it can give strings of a given length ratio
+TOKEN_SCALE = .95           # Every token based sub-score
+PARTIAL_SCALE = .90         # Partial sub-scores, used from PARTIAL_LENGTH_RATIO
+FAR_PARTIAL_SCALE = .6      # Partial sub-scores past FAR_LENGTH_RATIO
+PARTIAL_LENGTH_RATIO = 1.5
+FAR_LENGTH_RATIO = 8
+
+
 # w is for weighted
 def WRatio(s1, s2, force_ascii=True, full_process=True):
     """
@@ -270,35 +309,69 @@ def WRatio(s1, s2, force_ascii=True, full_process=True):
     if not utils.validate_string(p2):
         return 0
 
+    return _wratio(p1, p2)
+
+
+def _wratio(p1, p2, record=None):
+    """WRatio of two processed, non-empty strings. See
+    _wratio_token_branch() for record."""
     # should we look at partials?
     try_partial = True
-    unbase_scale = .95
-    partial_scale = .90
+    partial_scale = PARTIAL_SCALE
 
-    base = ratio(p1, p2)
+    base = ratio(p1, p2) if record is None else record('ratio', (), ratio, p1, p2)
     len_ratio = float(max(len(p1), len(p2))) / min(len(p1), len(p2))
 
     # if strings are similar length, don't use partials
-    if len_ratio < 1.5:
+    if len_ratio < PARTIAL_LENGTH_RATIO:
         try_partial = False
 
     # if one string is much much shorter than the other
-    if len_ratio > 8:
-        partial_scale = .6
+    if len_ratio > FAR_LENGTH_RATIO:
+        partial_scale = FAR_PARTIAL_SCALE
 
     if try_partial:
-        partial = partial_ratio(p1, p2) * partial_scale
-        ptsor = partial_token_sort_ratio(p1, p2, full_process=False) \
-            * unbase_scale * partial_scale
-        ptser = partial_token_set_ratio(p1, p2, full_process=False) \
-            * unbase_scale * partial_scale
-
-        return utils.intr(max(base, partial, ptsor, ptser))
+        return _wratio_partial_branch(p1, p2, base, partial_scale, record)
     else:
-        tsor = token_sort_ratio(p1, p2, full_process=False) * unbase_scale
-        tser = token_set_ratio(p1, p2, full_process=False) * unbase_scale
+        return _wratio_token_branch(p1, p2, base, record)
 
-        return utils.intr(max(base, tsor, tser))
+
+def _wratio_token_branch(p1, p2, base, record=None):
+    """WRatio of two processed strings of similar length, given their ratio.
+
+    If record is given, every sub-score is computed by calling
+    record(name, scales, scorer, p1, p2, **kwargs) instead of scorer, scales
+    being the factors WRatio then applies to it, in order. This is how
+    trace.ScoreTrace times and explains a score.
+    """
+    sort_ratio, set_ratio = token_sort_ratio, token_set_ratio
+    if record is not None:
+        sort_ratio = functools.partial(record, 'token_sort_ratio', (TOKEN_SCALE,), token_sort_ratio)
+        set_ratio = functools.partial(record, 'token_set_ratio', (TOKEN_SCALE,), token_set_ratio)
+    tsor = sort_ratio(p1, p2, full_process=False) * TOKEN_SCALE
+    tser = set_ratio(p1, p2, full_process=False) * TOKEN_SCALE
+
+    return utils.intr(max(base, tsor, tser))
+
+
+def _wratio_partial_branch(p1, p2, base, partial_scale, record=None):
+    """WRatio of two processed strings of dissimilar length, given their
+    ratio and the scale of the partial scores. See _wratio_token_branch()
+    for record."""
+    partial_scorer, sort_ratio, set_ratio = partial_ratio, partial_token_sort_ratio, partial_token_set_ratio
+    if record is not None:
+        partial_scorer = functools.partial(record, 'partial_ratio', (partial_scale,), partial_ratio)
+        sort_ratio = functools.partial(record, 'partial_token_sort_ratio', (TOKEN_SCALE, partial_scale),
+                                       partial_token_sort_ratio)
+        set_ratio = functools.partial(record, 'partial_token_set_ratio', (TOKEN_SCALE, partial_scale),
+                                      partial_token_set_ratio)
+    partial = partial_scorer(p1, p2) * partial_scale
+    ptsor = sort_ratio(p1, p2, full_process=False) \
+        * TOKEN_SCALE * partial_scale
+    ptser = set_ratio(p1, p2, full_process=False) \
+        * TOKEN_SCALE * partial_scale
+
+    return utils.intr(max(base, partial, ptsor, ptser))
 
 
 def UWRatio(s1, s2, full_process=True):
@@ -2,8 +2,11 @@
 # encoding: utf-8
 from . import fuzz
 from . import utils
+import asyncio
+import collections.abc
 import heapq
 import logging
+import time
 from functools import partial
 
 
@@ -13,7 +16,23 @@ default_scorer = fuzz.WRatio
 default_processor = utils.full_process
 
 
-def extractWithoutOrder(query, choices, processor=default_processor, scorer=default_scorer, score_cutoff=0):
+# Number of choices whose prior extractOneWithin() estimates between two looks at the clock
+_PRIOR_CHUNK = 500
+
+
+# Scorers that run full_process on their arguments, which extractWithoutOrder
+# does once for the query instead. They all accept a utils.NormalizedQuery in
+# place of the query string. The unicode ones process with force_ascii=False.
+_full_process_scorers = (fuzz.WRatio, fuzz.QRatio,
+                         fuzz.token_set_ratio, fuzz.token_sort_ratio,
+                         fuzz.partial_token_set_ratio, fuzz.partial_token_sort_ratio,
+                         fuzz.token_edit_ratio,
+                         fuzz.UWRatio, fuzz.UQRatio)
+_unicode_scorers = (fuzz.UWRatio, fuzz.UQRatio)
+
+
+def extractWithoutOrder(query, choices, processor=default_processor, scorer=default_scorer, score_cutoff=0,
+                        trace=None):
     """Select the best match in a list or dictionary of choices.
 
     Find best matches in a list or dictionary of choices, return a
@@ -21,7 +40,9 @@ def extractWithoutOrder(query, choices, processor=default_processor, scorer=defa
     is used, also returns the key for each match.
 
     Arguments:
-        query: An object representing the thing we want to find.
+        query: An object representing the thing we want to find. A
+            utils.NormalizedQuery may be given in place of a query string;
+            its precomputed forms are used instead of processing it again.
         choices: An iterable or dictionary-like object containing choices
             to be matched against the query. Dictionary arguments of
             {key: value} pairs will attempt to match the query against
@@ -43,6 +64,8 @@ def extractWithoutOrder(query, choices, processor=default_processor, scorer=defa
             choice to be strings.
         score_cutoff: Optional argument for score threshold. No matches with
             a score less than this number will be returned. Defaults to 0.
+        trace: Optional trace.ScoreTrace recording how every choice was
+            scored. Defaults to None (no tracing, and no overhead).
 
     Returns:
         Generator of tuples containing the match and its score.
@@ -69,11 +92,20 @@ def extractWithoutOrder(query, choices, processor=default_processor, scorer=defa
     except TypeError:
         pass
 
+    # A NormalizedQuery is already processed; a custom processor gets the
+    # original string instead
+    if isinstance(query, utils.NormalizedQuery) and processor not in (None, utils.full_process):
+        query = query.raw
+
     # If the processor was removed by setting it to None
     # perform a noop as it still needs to be a function
     if processor is None:
         processor = no_process
 
+    # Don't run full_process twice
+    if scorer in _full_process_scorers and processor == utils.full_process:
+        processor = no_process
+
     # Run the processor on the input query.
     processed_query = processor(query)
 
@@ -82,26 +114,22 @@ def extractWithoutOrder(query, choices, processor=default_processor, scorer=defa
                         "all comparisons will have score 0. "
                         "[Query: \'{0}\']".format(query))
 
-    # Don't run full_process twice
-    if scorer in [fuzz.WRatio, fuzz.QRatio,
-                  fuzz.token_set_ratio, fuzz.token_sort_ratio,
-                  fuzz.partial_token_set_ratio, fuzz.partial_token_sort_ratio,
-                  fuzz.UWRatio, fuzz.UQRatio] \
-            and processor == utils.full_process:
-        processor = no_process
-
     # Only process the query once instead of for every choice
-    if scorer in [fuzz.UWRatio, fuzz.UQRatio]:
-        pre_processor = partial(utils.full_process, force_ascii=False)
-        scorer = partial(scorer, full_process=False)
-    elif scorer in [fuzz.WRatio, fuzz.QRatio,
-                    fuzz.token_set_ratio, fuzz.token_sort_ratio,
-                    fuzz.partial_token_set_ratio, fuzz.partial_token_sort_ratio]:
-        pre_processor = partial(utils.full_process, force_ascii=True)
-        scorer = partial(scorer, full_process=False)
+    force_ascii = None
+    if scorer in _full_process_scorers:
+        force_ascii = scorer not in _unicode_scorers
+        pre_processor = partial(utils.full_process, force_ascii=force_ascii)
     else:
         pre_processor = no_process
-    processed_query = pre_processor(processed_query)
+
+    # Those scorers use the precomputed forms of a NormalizedQuery
+    if not (isinstance(processed_query, utils.NormalizedQuery)
+            and processed_query.force_ascii == force_ascii):
+        processed_query = pre_processor(processed_query)
+    if force_ascii is not None:
+        scorer = partial(scorer, full_process=False)
+    if trace is not None:
+        scorer = trace.wrap(scorer)
 
     try:
         # See if choices is a dictionary-like object.
@@ -194,7 +222,36 @@ def extractBests(query, choices, processor=default_processor, scorer=default_sco
         sorted(best_list, key=lambda i: i[1], reverse=True)
 
 
-def extractOne(query, choices, processor=default_processor, scorer=default_scorer, score_cutoff=0):
+def _prior_tokens(s):
+    """Tokens compared by the default prior of extractOne()."""
+    if isinstance(s, utils.NormalizedQuery):
+        return s.token_set
+    if isinstance(s, str):
+        return set(s.lower().split())
+    return ()
+
+
+def shared_token_prior(query, choice):
+    """Cheap estimate of how well a choice matches a query: the number of
+    whitespace separated tokens they share (ignoring case)."""
+    return len(_prior_tokens(query).intersection(_prior_tokens(choice)))
+
+
+def _query_prior(query, prior):
+    """Returns prior as a function of the choice alone. The default prior
+    gets the query's tokens only once."""
+    if prior is not shared_token_prior:
+        return partial(prior, query)
+    query_tokens = frozenset(_prior_tokens(query))
+
+    def choice_prior(choice):
+        if isinstance(choice, str):     # No need for a set of the choice's tokens
+            return len(query_tokens.intersection(choice.lower().split()))
+        return len(query_tokens.intersection(_prior_tokens(choice)))
+    return choice_prior
+
+
+def extractOne(query, choices, processor=default_processor, scorer=default_scorer, score_cutoff=0, trace=None):
     """Find the single best match above a score in a list of choices.
 
     This is a convenience method which returns the single best choice.
@@ -210,18 +267,387 @@ def extractOne(query, choices, processor=default_processor, scorer=default_score
         score_cutoff: Optional argument for score threshold. If the best
             match is found, but it is not greater than this number, then
             return None anyway ("not a good enough match").  Defaults to 0.
+        trace: Optional trace.ScoreTrace recording, for every choice scored,
+            the sub-scores WRatio combined, their timings and the winning
+            branch, with running totals in trace.totals(). The result is
+            unchanged. Defaults to None (no tracing, and no overhead).
+
+        The choices may also be a PreparedChoices, in which case its own
+        processing is used: processor must then be left as the default or
+        be the one the choices were prepared with, or ValueError is raised.
 
     Returns:
         A tuple containing a single match and its score, if a match
         was found that was above score_cutoff. Otherwise, returns None.
     """
-    best_list = extractWithoutOrder(query, choices, processor, scorer, score_cutoff)
+    if isinstance(choices, PreparedChoices):
+        choices._check_processor(processor)
+        return choices.extract_one(query, scorer, score_cutoff, trace)
+
+    best_list = extractWithoutOrder(query, choices, processor, scorer, score_cutoff, trace)
     try:
         return max(best_list, key=lambda i: i[1])
     except ValueError:
         return None
 
 
+def extractOneWithin(query, choices, time_budget, processor=default_processor, scorer=default_scorer, score_cutoff=0,
+                     prior=shared_token_prior, trace=None):
+    """Find the single best match above a score, spending at most about
+    time_budget seconds on the search.
+
+    The choices are estimated by the prior and scored best-first until the
+    budget is spent, so the best choices are usually scored before it runs
+    out. Estimating the choices counts against the budget as well (the
+    clock is checked every few hundred of them): if it runs out first, only
+    the choices estimated so far are considered. At least one choice is
+    always scored.
+
+    Args:
+        query, choices, processor, scorer, score_cutoff, trace: See
+            extractOne().
+        time_budget: Number of seconds the search may take.
+        prior: Function of the form f(query, choice) -> number estimating
+            how well a choice matches the query, much more cheaply than the
+            scorer. Defaults to the number of tokens shared by the query
+            and the choice.
+
+        The choices may also be a PreparedChoices, whose length buckets are
+        then scored from the most promising down, and prior is ignored. As
+        with extractOne(), processor must then be left as the default.
+
+    Returns:
+        A (match, is_partial) tuple, where match is what extractOne() would
+        return for the choices scored, and is_partial is True if the budget
+        ran out before every choice was scored.
+    """
+    return _run_steps(_extract_one_within_steps(query, choices, time_budget, processor, scorer, score_cutoff, prior, trace))
+
+
+def _extract_one_within_steps(query, choices, time_budget, processor, scorer, score_cutoff, prior, trace,
+                              yield_every=None):
+    """Generator behind extractOneWithin(), pausing (yielding None) after
+    every yield_every choices scored and returning its result."""
+    deadline = time.perf_counter() + time_budget
+    if isinstance(choices, PreparedChoices):
+        choices._check_processor(processor)
+        return (yield from choices._extract_one_steps(query, scorer, score_cutoff, yield_every, trace, deadline))
+
+    try:
+        items = choices.items()
+        keyed = True
+    except AttributeError:
+        items = ((None, choice) for choice in choices)
+        keyed = False
+
+    # Estimate every choice, looking at the clock after every chunk of them and leaving the rest out if the budget ran out
+    choice_prior = _query_prior(query, prior)
+    keys, values, priors = [], [], []
+    estimated_all = True
+    for count, (key, choice) in enumerate(items, 1):
+        keys.append(key)
+        values.append(choice)
+        priors.append(choice_prior(choice))
+        if count % _PRIOR_CHUNK == 0 and time.perf_counter() >= deadline:
+            estimated_all = False
+            break
+
+    # Visit the choices best-first, keeping their original order among equals
+    order = sorted(range(len(priors)), key=priors.__getitem__, reverse=True)
+    ordered = dict((i, values[i]) for i in order)
+
+    best = None
+    scored = 0
+    for choice, score, i in extractWithoutOrder(query, ordered, processor, scorer, trace=trace):
+        scored += 1
+        # Ties go to the earlier choice, as with extractOne()
+        if score >= score_cutoff and (best is None or score > best[1] or (score == best[1] and i < best[2])):
+            best = (choice, score, i)
+        if time.perf_counter() >= deadline:
+            break
+        if yield_every is not None and scored % yield_every == 0:
+            yield
+
+    if best is not None:
+        best = (best[0], best[1], keys[best[2]]) if keyed else (best[0], best[1])
+    return best, not estimated_all or scored < len(values)
+
+
+class PreparedChoices(object):
+    """Choices processed once and bucketed by processed length, for
+    repeatedly finding the best match with extractOne() and WRatio.
+
+    WRatio picks its sub-scorers from the length ratio of the two strings,
+    and that ratio also bounds the score it can give. extractOne() therefore
+    scores a PreparedChoices one length bucket at a time, choosing the
+    sub-scorers once per bucket, and visits the buckets from the highest
+    bound down, stopping at the first one that can no longer beat the best
+    match found so far or the score_cutoff. The result is the same as
+    extractOne() over the original choices. extractOneWithin() visits the
+    buckets in the same order and stops wherever its budget runs out.
+
+    Subclasses may keep the buckets their own way by overriding _lengths()
+    and _bucket().
+
+    Arguments:
+        choices: A list or dictionary of choices, as for extract().
+        processor: Optional function applied to each choice (and to the
+            query) before full_process(). See extract().
+        force_ascii: Process for WRatio (True) or UWRatio (False).
+    """
+
+    def __init__(self, choices, processor=default_processor, force_ascii=True):
+        if processor == utils.full_process:     # Done below anyway
+            processor = None
+        self.processor = processor
+        self.force_ascii = force_ascii
+        self._buckets = {}      # Processed length -> [(position, choice, key, processed)]
+        self._size = 0
+
+        try:
+            items = choices.items()
+            self._keyed = True
+        except AttributeError:
+            items = ((None, choice) for choice in choices)
+            self._keyed = False
+
+        for key, choice in items:
+            processed = choice if processor is None else processor(choice)
+            processed = utils.full_process(processed, force_ascii=force_ascii)
+            self._buckets.setdefault(len(processed), []).append((self._size, choice, key, processed))
+            self._size += 1
+
+    def __len__(self):
+        return self._size
+
+    def _lengths(self):
+        """Returns the processed lengths of the choices."""
+        return self._buckets.keys()
+
+    def _bucket(self, length):
+        """Returns the (position, choice, key, processed) tuples of the choices of the given processed length, in order
+        of position. The position is the choice's place among the original choices, and the key is None for a list."""
+        return self._buckets[length]
+
+    @staticmethod
+    def _bound(query_length, length):
+        """Highest WRatio of strings of these lengths, and their length ratio."""
+        shorter, longer = min(query_length, length), max(query_length, length)
+        if shorter == 0:
+            return 0, 0
+        len_ratio = float(longer) / shorter
+        base = utils.intr(200.0 * shorter / (shorter + longer))   # ratio() can't exceed this
+        if len_ratio < fuzz.PARTIAL_LENGTH_RATIO:
+            return max(base, utils.intr(100 * fuzz.TOKEN_SCALE)), len_ratio
+        return max(base, utils.intr(100 * PreparedChoices._partial_scale(len_ratio))), len_ratio
+
+    @staticmethod
+    def _partial_scale(len_ratio):
+        """Scale WRatio gives the partial sub-scores of strings of this length ratio."""
+        return fuzz.FAR_PARTIAL_SCALE if len_ratio > fuzz.FAR_LENGTH_RATIO else fuzz.PARTIAL_SCALE
+
+    def _check_processor(self, processor):
+        """Raises ValueError if a processor other than the default was given
+        along with these choices, which were prepared with their own."""
+        if processor not in (default_processor, self.processor):
+            raise ValueError("These choices were prepared with another processor")
+
+    def extract_one(self, query, scorer=fuzz.WRatio, score_cutoff=0, trace=None):
+        """Find the single best match above a score. See extractOne()."""
+        return _run_steps(self._extract_one_steps(query, scorer, score_cutoff, trace=trace))[0]
+
+    def _extract_one_steps(self, query, scorer, score_cutoff, yield_every=None, trace=None, deadline=None):
+        """Generator behind extract_one() and extractOneWithin(), pausing
+        (yielding None) after every yield_every choices scored and stopping
+        at the deadline (a time.perf_counter() value), if any. Returns the
+        best match and whether the deadline cut the search short."""
+        expected = fuzz.WRatio if self.force_ascii else fuzz.UWRatio
+        if scorer != expected:
+            raise ValueError("These choices were prepared for {0}".format(expected.__name__))
+
+        if self.processor is not None:  # As in extractWithoutOrder(), a custom processor gets the original string
+            if isinstance(query, utils.NormalizedQuery):
+                query = query.raw
+            query = self.processor(query)
+        processed_query = query
+        if not (isinstance(query, utils.NormalizedQuery) and query.force_ascii == self.force_ascii):
+            processed_query = utils.full_process(query, force_ascii=self.force_ascii)
+
+        if len(processed_query) == 0:
+            logging.warning(u"Applied processor reduces input query to empty string, "
+                            "all comparisons will have score 0. "
+                            "[Query: \'{0}\']".format(query))
+
+        buckets = sorted(((self._bound(len(processed_query), length), length) for length in self._lengths()),
+                         key=lambda bucket: bucket[0][0], reverse=True)
+        best = None
+        scored = 0
+        is_partial = False
+        for (bound, len_ratio), length in buckets:
+            if bound < score_cutoff or (best is not None and bound < best[1]):
+                break   # Neither this bucket nor the following ones can do better
+
+            # The same branch of WRatio applies to every choice of the bucket
+            if trace is not None:
+                def score(processed):
+                    return trace.WRatio(processed_query, processed, force_ascii=self.force_ascii, full_process=False)
+            elif bound == 0:
+                def score(processed):
+                    return 0
+            elif len_ratio < fuzz.PARTIAL_LENGTH_RATIO:
+                def score(processed):
+                    return fuzz._wratio_token_branch(processed_query, processed, fuzz.ratio(processed_query, processed))
+            else:
+                partial_scale = self._partial_scale(len_ratio)
+
+                def score(processed):
+                    return fuzz._wratio_partial_branch(processed_query, processed, fuzz.ratio(processed_query, processed),
+                                                       partial_scale)
+
+            for position, choice, key, processed in self._bucket(length):
+                scored += 1
+                if yield_every is not None and scored % yield_every == 0:
+                    yield
+                choice_score = score(processed)
+                # Ties go to the earlier choice, as with extractOne() over the original choices
+                if choice_score >= score_cutoff and (best is None or choice_score > best[1]
+                                                     or (choice_score == best[1] and position < best[0])):
+                    best = (position, choice_score, choice, key)
+                if deadline is not None and time.perf_counter() >= deadline:
+                    is_partial = True
+                    break
+            if is_partial:
+                break
+
+        if best is not None:
+            best = (best[2], best[1], best[3]) if self._keyed else (best[2], best[1])
+        return best, is_partial
+
+
+def _run_steps(steps):
+    """Runs a generator of steps to completion and returns its result."""
+    while True:
+        try:
+            next(steps)
+        except StopIteration as done:
+            return done.value
+
+
+async def _run_steps_async(steps):
+    """Runs a generator of steps to completion, letting the event loop run
+    other tasks between steps, and returns its result."""
+    while True:
+        try:
+            next(steps)
+        except StopIteration as done:
+            return done.value
+        await asyncio.sleep(0)
+
+
+async def _collect(results, yield_every):
+    """Collects the results of extractWithoutOrder() into a list, letting the
+    event loop run other tasks after every yield_every results."""
+    collected = []
+    for count, result in enumerate(results, 1):
+        collected.append(result)
+        if count % yield_every == 0:
+            await asyncio.sleep(0)
+    return collected
+
+
+def _should_offload(choices, executor, offload_threshold):
+    if executor is None:
+        return False
+    try:
+        return len(choices) >= offload_threshold
+    except TypeError:   # A generator can't be sent to another process, and its size is unknown
+        return False
+
+
+def _offloaded(executor, function, query, choices, *args):
+    """Runs function(query, choices, *args) in the executor. Key and value
+    views (e.g. dict.keys()) can't be pickled for a process pool, so they
+    are sent as lists."""
+    if isinstance(choices, (collections.abc.KeysView, collections.abc.ValuesView)):
+        choices = list(choices)
+    return asyncio.get_running_loop().run_in_executor(executor, partial(function, query, choices, *args))
+
+
+async def extractAsync(query, choices, processor=default_processor, scorer=default_scorer, limit=5,
+                       yield_every=100, executor=None, offload_threshold=5000):
+    """Asynchronous version of extract() for use within an asyncio event loop.
+
+    The result is the same as extract()'s, but the event loop gets to run
+    other tasks after every yield_every choices scored, and the scan can be
+    cancelled between them.
+
+    Args:
+        query, choices, processor, scorer, limit: See extract().
+        yield_every: Number of choices scored between two yields to the
+            event loop. Defaults to 100.
+        executor: Optional concurrent.futures executor (thread or process
+            pool). Scans of at least offload_threshold choices are run by
+            extract() in the executor instead, leaving the event loop free.
+            Note that a scan running in an executor can't be interrupted.
+        offload_threshold: Defaults to 5000 choices.
+
+    Returns:
+        See extract().
+    """
+    if _should_offload(choices, executor, offload_threshold):
+        return await _offloaded(executor, extract, query, choices, processor, scorer, limit)
+
+    sl = await _collect(extractWithoutOrder(query, choices, processor, scorer), yield_every)
+    return heapq.nlargest(limit, sl, key=lambda i: i[1]) if limit is not None else \
+        sorted(sl, key=lambda i: i[1], reverse=True)
+
+
+async def extractOneAsync(query, choices, processor=default_processor, scorer=default_scorer, score_cutoff=0, trace=None,
+                          yield_every=100, executor=None, offload_threshold=5000):
+    """Asynchronous version of extractOne() for use within an asyncio event
+    loop. See extractAsync() for yield_every, executor and offload_threshold.
+
+    A traced search is never offloaded, so that the trace is recorded in
+    this process.
+
+    Returns:
+        See extractOne().
+    """
+    if trace is None and _should_offload(choices, executor, offload_threshold):
+        return await _offloaded(executor, extractOne, query, choices, processor, scorer, score_cutoff)
+    if isinstance(choices, PreparedChoices):
+        choices._check_processor(processor)
+        return (await _run_steps_async(choices._extract_one_steps(query, scorer, score_cutoff, yield_every, trace)))[0]
+
+    # Every choice is scored (and counted towards yield_every); the cutoff is applied after
+    best_list = await _collect(extractWithoutOrder(query, choices, processor, scorer, trace=trace), yield_every)
+    try:
+        return max((i for i in best_list if i[1] >= score_cutoff), key=lambda i: i[1])
+    except ValueError:
+        return None
+
+
+async def extractOneWithinAsync(query, choices, time_budget, processor=default_processor, scorer=default_scorer,
+                                score_cutoff=0, prior=shared_token_prior, trace=None,
+                                yield_every=100, executor=None, offload_threshold=5000):
+    """Asynchronous version of extractOneWithin() for use within an asyncio
+    event loop. See extractAsync() for yield_every, executor and
+    offload_threshold. The budget is wall-clock time, so the time other
+    tasks run between two yields counts against it too.
+
+    A traced search is never offloaded, so that the trace is recorded in
+    this process.
+
+    Returns:
+        See extractOneWithin().
+    """
+    if trace is None and _should_offload(choices, executor, offload_threshold):
+        return await _offloaded(executor, extractOneWithin, query, choices, time_budget, processor, scorer, score_cutoff,
+                                prior)
+    return await _run_steps_async(_extract_one_within_steps(query, choices, time_budget, processor, scorer, score_cutoff,
+                                                            prior, trace, yield_every))
+
+
 def dedupe(contains_dupes, threshold=70, scorer=fuzz.token_set_ratio):
     """This convenience function takes a list of strings containing duplicates and uses fuzzy matching to identify
     and remove duplicates. Specifically, it uses the process.extract to identify duplicates that
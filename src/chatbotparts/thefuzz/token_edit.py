@@ -0,0 +1,201 @@
+#!/usr/bin/env python
+# encoding: utf-8
+"""Token-level edit distance.
+
+Strings are split into whitespace tokens and every token is interned into a
+small integer id, so the edit distance is computed over short integer arrays
+instead of character sequences. A known set of strings (e.g. the chatbot's
+known queries) can be interned once up front with TokenVocabulary, and
+TokenEditScorer can then be passed as the scorer of the process.extract*
+functions.
+"""
+from __future__ import unicode_literals
+import threading
+from array import array
+
+from . import utils
+
+
+def token_distance(a, b):
+    """Return the Levenshtein distance between two sequences of token ids.
+
+    Every insertion, deletion and substitution of a whole token costs 1.
+    """
+    if len(a) < len(b):
+        a, b = b, a
+    if len(b) == 0:
+        return len(a)
+
+    previous = list(range(len(b) + 1))
+    for i, x in enumerate(a, 1):
+        current = [i]
+        for j, y in enumerate(b, 1):
+            current.append(min(previous[j] + 1,
+                               current[j - 1] + 1,
+                               previous[j - 1] + (x != y)))
+        previous = current
+    return previous[-1]
+
+
+def token_distance_ratio(a, b):
+    """Return the similarity of two sequences of token ids as a number between 0 and 100."""
+    longest = max(len(a), len(b))
+    if longest == 0:
+        return 0
+    return utils.intr(100 * (1 - float(token_distance(a, b)) / longest))
+
+
+class TokenVocabulary(object):
+    """Interns the tokens of a set of strings into integer ids.
+
+    Strings passed to add() (or to the constructor) have all of their tokens
+    interned and their encoding cached, under both the original and the
+    processed form of the string. Any other string is encoded on demand;
+    tokens that were never interned are given negative ids from the
+    caller-supplied ``unknown`` table so that they can only match each other.
+    """
+
+    def __init__(self, strings=(), force_ascii=True):
+        self.force_ascii = force_ascii
+        self._ids = {}
+        self._encoded = {}
+        for s in strings:
+            self.add(s)
+
+    @classmethod
+    def from_encodings(cls, tokens, encodings, force_ascii=True):
+        """Return a vocabulary of strings that were already tokenized.
+
+        ``tokens`` lists the interned tokens in id order and ``encodings``
+        yields the (string, processed string, encoding) of every added
+        string, so that nothing is processed or tokenized again.
+        """
+        vocabulary = cls(force_ascii=force_ascii)
+        vocabulary._ids = {token: token_id for token_id, token in enumerate(tokens)}
+        for s, processed, encoded in encodings:
+            vocabulary._encoded[s] = encoded
+            vocabulary._encoded[processed] = encoded
+        return vocabulary
+
+    def __len__(self):
+        """Number of distinct interned tokens."""
+        return len(self._ids)
+
+    def __contains__(self, s):
+        return self.lookup(s) is not None
+
+    def process(self, s):
+        return utils.full_process(s, force_ascii=self.force_ascii)
+
+    def copy(self):
+        """Return a new vocabulary with the same interned tokens, which can
+        be added to without changing this one."""
+        new = TokenVocabulary(force_ascii=self.force_ascii)
+        new._ids = dict(self._ids)
+        new._encoded = dict(self._encoded)     # Encodings are never modified, so they can be shared
+        return new
+
+    def add(self, s):
+        """Intern every token of s and cache its encoding. Returns the encoding."""
+        processed = self.process(s)
+        ids = self._ids
+        for token in processed.split():
+            if token not in ids:
+                ids[token] = len(ids)
+        encoded = array('i', [ids[token] for token in processed.split()])
+        self._encoded[s] = encoded
+        self._encoded[processed] = encoded
+        return encoded
+
+    def lookup(self, s):
+        """Return the cached encoding of an added string, or None if s was never added."""
+        try:
+            return self._encoded[s]
+        except KeyError:
+            return self._encoded.get(self.process(s))
+        except TypeError:   # Unhashable input
+            return None
+
+    def encode(self, s, unknown=None):
+        """Encode s without interning it.
+
+        Tokens missing from the vocabulary are looked up in (and added to) the
+        ``unknown`` dict, which maps them to negative ids. Share one ``unknown``
+        dict between two strings that are going to be compared with each other.
+        """
+        encoded = self._encoded.get(s)
+        if encoded is not None:
+            return encoded
+        processed = self.process(s)
+        encoded = self._encoded.get(processed)
+        if encoded is not None:
+            return encoded
+
+        if unknown is None:
+            unknown = {}
+        ids = self._ids
+        encoded = array('i')
+        for token in processed.split():
+            token_id = ids.get(token)
+            if token_id is None:
+                token_id = unknown.get(token)
+                if token_id is None:
+                    token_id = unknown[token] = -len(unknown) - 1
+            encoded.append(token_id)
+        return encoded
+
+
+class TokenEditScorer(object):
+    """Scorer computing the token-level edit distance ratio between two strings.
+
+    Instances follow the fuzz scorer signature f(s1, s2) -> int and can be
+    passed as ``scorer=`` to process.extract, extractBests and extractOne.
+    Strings that were added to the vocabulary are never re-tokenized; the
+    encoding of the last non-interned string (usually the query) is kept so
+    it is only computed once per extract call. That cache is per thread, so
+    one scorer can be shared by extract calls running in different threads.
+    """
+
+    def __init__(self, vocabulary=None):
+        self.vocabulary = vocabulary if vocabulary is not None else TokenVocabulary()
+        self._last = threading.local()
+
+    def __getstate__(self):
+        # The per-thread cache is neither picklable nor worth sending along
+        return {'vocabulary': self.vocabulary}
+
+    def __setstate__(self, state):
+        self.__init__(state['vocabulary'])
+
+    def _lookup(self, s):
+        """Return the encoding of s and whether it is interned in the vocabulary."""
+        last = self._last
+        if s == getattr(last, 'string', None):
+            return last.encoded, False
+        encoded = self.vocabulary.lookup(s)
+        return encoded, encoded is not None
+
+    def _encode_transient(self, s):
+        last = self._last
+        if s != getattr(last, 'string', None):
+            # Only ever compared against interned strings, whose ids are never
+            # negative, so a private unknown table cannot produce false matches
+            last.encoded = self.vocabulary.encode(s)
+            last.string = s
+        return last.encoded
+
+    def __call__(self, s1, s2):
+        if s1 is None or s2 is None:
+            return 0
+
+        e1, interned1 = self._lookup(s1)
+        e2, interned2 = self._lookup(s2)
+        if not interned1 and not interned2:
+            unknown = {}
+            e1 = self.vocabulary.encode(s1, unknown)
+            e2 = self.vocabulary.encode(s2, unknown)
+        elif not interned1:
+            e1 = self._encode_transient(s1)
+        elif not interned2:
+            e2 = self._encode_transient(s2)
+        return token_distance_ratio(e1, e2)
@@ -0,0 +1,142 @@
+#!/usr/bin/env python
+# encoding: utf-8
+"""Explain mode for WRatio: which sub-scorer decided each score, and what it cost.
+
+A ScoreTrace passed as the trace argument of process.extractOne() (or
+extractWithoutOrder(), or prog4fuzzy.map_intent()) scores every candidate
+through WRatio's own branches, recording for each sub-scorer its raw score,
+the scale applied to it and the time it took, along with the branch WRatio
+took and the sub-scorer which won. Without a trace, WRatio only checks that
+no recorder was given.
+
+Scores computed with a trace are identical to those without.
+"""
+from __future__ import unicode_literals
+import time
+from collections import namedtuple
+from functools import partial
+
+from . import fuzz
+from . import utils
+
+SubScore = namedtuple('SubScore', 'name raw scale seconds')
+CandidateTrace = namedtuple('CandidateTrace', 'query choice score branch len_ratio winner subscores seconds')
+
+
+class ScoreTrace(object):
+    """Collects a CandidateTrace for every candidate scored with it, and
+    running totals over all of them.
+
+    Arguments:
+        keep_candidates: Whether to keep every CandidateTrace (in
+            candidates) or only update the totals. Defaults to True.
+    """
+
+    def __init__(self, keep_candidates=True):
+        self.keep_candidates = keep_candidates
+        self.candidates = []
+        self._count = 0
+        self._seconds = 0.0
+        self._branches = {}
+        self._winners = {}
+        self._subscorers = {}   # Name -> [calls, seconds]
+
+    def __len__(self):
+        return self._count
+
+    def _record(self, candidate):
+        self._count += 1
+        self._seconds += candidate.seconds
+        self._branches[candidate.branch] = self._branches.get(candidate.branch, 0) + 1
+        self._winners[candidate.winner] = self._winners.get(candidate.winner, 0) + 1
+        for subscore in candidate.subscores:
+            totals = self._subscorers.setdefault(subscore.name, [0, 0.0])
+            totals[0] += 1
+            totals[1] += subscore.seconds
+        if self.keep_candidates:
+            self.candidates.append(candidate)
+
+    def WRatio(self, s1, s2, force_ascii=True, full_process=True):
+        """fuzz.WRatio(), recording how the score was obtained."""
+        start = time.perf_counter()
+        subscores = []
+        values = []     # The sub-scores once scaled, which WRatio takes the highest of
+
+        def record(name, scales, scorer, *args, **kwargs):
+            sub_start = time.perf_counter()
+            raw = scorer(*args, **kwargs)
+            seconds = time.perf_counter() - sub_start
+            value = raw
+            scale = 1.0
+            for factor in scales:   # Applied one at a time, exactly as WRatio does
+                value *= factor
+                scale *= factor
+            subscores.append(SubScore(name, raw, scale, seconds))
+            values.append(value)
+            return raw
+
+        if full_process:
+            p1 = utils.full_process(s1, force_ascii=force_ascii)
+            p2 = utils.full_process(s2, force_ascii=force_ascii)
+        else:
+            p1 = s1
+            p2 = s2
+
+        if not utils.validate_string(p1) or not utils.validate_string(p2):
+            self._record(CandidateTrace(str(p1), s2, 0, 'empty', None, None, [], time.perf_counter() - start))
+            return 0
+
+        score = fuzz._wratio(p1, p2, record)
+        len_ratio = float(max(len(p1), len(p2))) / min(len(p1), len(p2))
+        branch = 'token' if len_ratio < fuzz.PARTIAL_LENGTH_RATIO else 'partial'
+        winner = subscores[values.index(max(values))].name
+        self._record(CandidateTrace(str(p1), s2, score, branch, len_ratio, winner, subscores,
+                                    time.perf_counter() - start))
+        return score
+
+    def UWRatio(self, s1, s2, full_process=True):
+        """fuzz.UWRatio(), recording how the score was obtained."""
+        return self.WRatio(s1, s2, force_ascii=False, full_process=full_process)
+
+    def wrap(self, scorer):
+        """Return a version of scorer recording into this trace.
+
+        WRatio and UWRatio (possibly wrapped in a functools.partial) are
+        replaced by their traced copies; any other scorer is recorded as a
+        single sub-scorer.
+        """
+        func = getattr(scorer, 'func', scorer)
+        keywords = getattr(scorer, 'keywords', None) or {}
+        if func is fuzz.WRatio or func is fuzz.UWRatio:
+            return partial(self.WRatio,
+                           force_ascii=keywords.get('force_ascii', func is fuzz.WRatio),
+                           full_process=keywords.get('full_process', True))
+
+        name = getattr(func, '__name__', repr(func))
+
+        def traced(s1, s2):
+            start = time.perf_counter()
+            score = scorer(s1, s2)
+            seconds = time.perf_counter() - start
+            self._record(CandidateTrace(str(s1), s2, score, None, None, name,
+                                        [SubScore(name, score, 1.0, seconds)], seconds))
+            return score
+        return traced
+
+    def totals(self):
+        """Return the totals over every candidate traced so far.
+
+        Returns:
+            Dictionary with the number of candidates and the seconds spent
+            scoring them, the number of candidates per branch ('token',
+            'partial' or 'empty'), the number of scores decided by each
+            sub-scorer, and the number of calls and seconds per sub-scorer.
+        """
+        return {
+            'candidates': self._count,
+            'seconds': self._seconds,
+            'branches': dict(self._branches),
+            'winners': dict(self._winners),
+            'subscorers': dict((name, {'calls': calls, 'seconds': seconds})
+                               for name, (calls, seconds) in self._subscorers.items()),
+        }
@@ -0,0 +1,109 @@
+#!/usr/bin/env python
+# encoding: utf-8
+"""Character trie of choices supporting bounded edit distance lookups.
+
+The choices are stored in a trie of their processed forms and a lookup walks
+the trie computing one row of the Levenshtein DP table per node, the same
+way a Levenshtein automaton would. Shared prefixes are therefore only
+computed once, and a whole subtree is pruned as soon as the smallest value
+of its row exceeds the edit budget.
+"""
+from __future__ import unicode_literals
+from functools import partial
+
+from . import utils
+
+
+class _TrieNode(object):
+    __slots__ = ('children', 'choices')
+
+    def __init__(self):
+        self.children = {}
+        self.choices = None   # Choices whose processed form ends at this node
+
+
+class TrieIndex(object):
+    """Index of choices answering "every choice within k edits of the query".
+
+    Arguments:
+        choices: Optional iterable of strings to index.
+        processor: Optional function of the form f(a) -> b applied to the
+            choices and to every query before they are compared. Defaults
+            to thefuzz.utils.full_process() forcing ascii, the same processing
+            WRatio compares (and a utils.NormalizedQuery carries); set it to
+            None to compare the strings as they are.
+    """
+
+    def __init__(self, choices=(), processor=partial(utils.full_process, force_ascii=True)):
+        self.processor = processor
+        self._root = _TrieNode()
+        self._size = 0
+        for choice in choices:
+            self.add(choice)
+
+    def __len__(self):
+        return self._size
+
+    def __contains__(self, choice):
+        node = self._find(self._process(choice))
+        return node is not None and node.choices is not None and choice in node.choices
+
+    def _process(self, s):
+        return self.processor(s) if self.processor is not None else s
+
+    def _find(self, key):
+        node = self._root
+        for char in key:
+            node = node.children.get(char)
+            if node is None:
+                return None
+        return node
+
+    def add(self, choice):
+        """Add a choice to the index. Adding the same choice twice has no effect."""
+        node = self._root
+        for char in self._process(choice):
+            child = node.children.get(char)
+            if child is None:
+                child = node.children[char] = _TrieNode()
+            node = child
+
+        if node.choices is None:
+            node.choices = []
+        if choice not in node.choices:
+            node.choices.append(choice)
+            self._size += 1
+
+    def search(self, query, max_edits=2):
+        """Return every choice within max_edits edits of the query.
+
+        Returns:
+            List of (choice, distance) tuples sorted by increasing distance.
+        """
+        key = self._process(query)
+        first_row = list(range(len(key) + 1))
+        results = []
+        if first_row[-1] <= max_edits and self._root.choices:
+            results.extend((choice, first_row[-1]) for choice in self._root.choices)
+
+        stack = [(child, char, first_row) for char, child in self._root.children.items()]
+        while stack:
+            node, char, previous = stack.pop()
+
+            # Compute this node's DP row from its parent's
+            current = [previous[0] + 1]
+            for i, key_char in enumerate(key, 1):
+                current.append(min(current[i - 1] + 1,
+                                   previous[i] + 1,
+                                   previous[i - 1] + (key_char != char)))
+
+            if node.choices and current[-1] <= max_edits:
+                results.extend((choice, current[-1]) for choice in node.choices)
+
+            # No continuation of this prefix can get back under the budget
+            if min(current) > max_edits:
+                continue
+            stack.extend((child, child_char, current) for child_char, child in node.children.items())
+
+        results.sort(key=lambda result: result[1])
+        return results
@@ -1,6 +1,7 @@
 from __future__ import unicode_literals
 import sys
 import functools
+from string import punctuation
 
 from .string_processing import StringProcessor
 
@@ -87,8 +88,14 @@ def full_process(s, force_ascii=False):
         -- removing all but letters and numbers
         -- trim whitespace
         -- force to lower case
-        if force_ascii == True, force convert to ascii"""
+        if force_ascii == True, force convert to ascii
 
+    A NormalizedQuery returns the form it already computed."""
+
+    if isinstance(s, NormalizedQuery):
+        if force_ascii == s.force_ascii:
+            return s.processed
+        s = s.canonical
     if force_ascii:
         s = asciidammit(s)
     # Keep only Letters and Numbers (see Unicode docs).
@@ -103,3 +110,47 @@ def full_process(s, force_ascii=False):
 def intr(n):
     '''Returns a correctly rounded integer'''
     return int(round(n))
+
+
+class NormalizedQuery(object):
+    """A query normalized once, carrying every form the scorers need.
+
+    Build one per request and pass it instead of the query string to the
+    process.extract* functions and the fuzz scorers; they use the forms
+    computed here instead of processing and tokenizing the query again.
+
+    Attributes:
+        raw: The query as given.
+        lowered: raw in lower case.
+        stripped: lowered without leading and trailing punctuation.
+        canonical: stripped after the optional canonicalize function (e.g.
+            a synonym rewrite) was applied to it.
+        processed: canonical after full_process().
+        tokens: The tokens of processed.
+        sorted_tokens: The tokens sorted and joined, as compared by the
+            token sort scorers.
+        token_set: The set of tokens, as compared by the token set scorers.
+    """
+
+    __slots__ = ('raw', 'lowered', 'stripped', 'canonical', 'force_ascii',
+                 'processed', 'tokens', 'sorted_tokens', 'token_set')
+
+    def __init__(self, raw, canonicalize=None, force_ascii=True):
+        self.raw = raw
+        self.lowered = raw.lower()
+        self.stripped = self.lowered.strip(punctuation)
+        self.canonical = canonicalize(self.stripped) if canonicalize is not None else self.stripped
+        self.force_ascii = force_ascii
+        self.processed = full_process(self.canonical, force_ascii=force_ascii)
+        self.tokens = tuple(self.processed.split())
+        self.sorted_tokens = u" ".join(sorted(self.tokens)).strip()
+        self.token_set = frozenset(self.tokens)
+
+    def __str__(self):
+        return self.processed
+
+    def __len__(self):
+        return len(self.processed)
+
+    def __repr__(self):
+        return "NormalizedQuery({0!r})".format(self.raw)
@@ -17,10 +17,12 @@ import subprocess
 def main():
     # First, determine the district to obtain information from and extract info from the webpage
     district_name = input("Please enter the name of the district you would like information on: ")
-    prog1.extract_info_93(district_name, update_info=True, pickle_info=True)    # Extract info from website if possible; output location can be changed in config
+    local_data = prog2.load_district(district_name)     # Answer from the profile store in 'data' if it holds the district
+    if local_data is None:
+        prog1.extract_info_93(district_name, update_info=True, pickle_info=True)    # Extract info from website if possible; output location can be changed in config
+        local_data = prog2.load_data('district93_local.pkl')
 
     # Then run the UI for the chatbot, passing in the local data
-    local_data = prog2.load_data('district93_local.pkl')
     print("~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~ DISTRICT CHATBOT ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~")
     prog3ui.run_ui(local_data)
 
@@ -0,0 +1,88 @@
+#----------------------------------------------------------------------------
+# Created By  : Zt572
+# Created Date: Oct 2026
+# version ='1.0'
+# Copyright Oct 2026
+# ---------------------------------------------------------------------------
+""" Tests for thefuzz's scoring backend registry. Run them from the repository root with: python -m pytest test"""
+# ---------------------------------------------------------------------------
+import os
+import sys
+import unittest
+# ---------------------------------------------------------------------------
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+from chatbotparts.thefuzz import backends, fuzz
+from chatbotparts.thefuzz.difflib import SequenceMatcher as VendoredSequenceMatcher
+# ---------------------------------------------------------------------------
+
+
+class _WrongMatcher(VendoredSequenceMatcher):
+    """Fast, but gives every pair the same ratio."""
+
+    def ratio(self):
+        return 1.0
+
+
+def _load_missing():
+    raise ImportError("not installed")
+
+
+class BackendsTest(unittest.TestCase):
+
+    def setUp(self):
+        self.active = backends.get_active_backend()
+        self.registered = dict(backends._backends)
+
+    def tearDown(self):
+        backends._backends.clear()
+        backends._backends.update(self.registered)
+        backends.use_backend(self.active)
+
+    def test_registry(self):
+        self.assertIn(self.active, backends.available_backends())
+        self.assertEqual(backends.default_backend(), backends.available_backends()[0])
+        self.assertIs(fuzz.SequenceMatcher, backends.get_backend(self.active))
+        self.assertEqual(backends.describe_backend('difflib'), "difflib (pure python)")
+
+        backends.register_backend('missing', _load_missing)
+        self.assertNotIn('missing', backends.available_backends())
+        with self.assertRaises(ImportError):
+            backends.get_backend('missing')
+        with self.assertRaises(KeyError):
+            backends.get_backend('unregistered')
+
+    def test_use_backend(self):
+        ratio = fuzz.ratio("where does the representative live", "where does he live")
+        for name in ('difflib', 'vendored-difflib'):
+            backends.use_backend(name)
+            self.assertEqual(backends.get_active_backend(), name)
+            self.assertEqual(fuzz.ratio("where does the representative live", "where does he live"), ratio)
+
+    def test_pure_python_fallback_warns(self):
+        backends._backends.clear()
+        backends.register_backend('missing', _load_missing)
+        backends.register_backend('difflib', self.registered['difflib'][0], pure_python=True)
+        with self.assertLogs(backends.logger, 'WARNING') as logs:
+            self.assertEqual(backends.use_default_backend(), 'difflib')
+        self.assertIn("falling back to the much slower difflib (pure python)", logs.output[0])
+
+    def test_calibrate(self):
+        backends.register_backend('wrong', lambda: _WrongMatcher)
+        backends.use_backend('difflib')
+        results = backends.calibrate(repeat=2, apply=False)
+        self.assertEqual(sorted(name for name, _, _ in results), sorted(backends.available_backends()))
+        self.assertEqual([seconds for _, seconds, _ in results], sorted(seconds for _, seconds, _ in results))
+        agreement = dict((name, agrees) for name, _, agrees in results)
+        self.assertFalse(agreement['wrong'])
+        self.assertTrue(agreement['difflib'] and agreement['vendored-difflib'])
+        self.assertEqual(backends.get_active_backend(), 'difflib')     # Not applied
+        self.assertIs(fuzz.SequenceMatcher, backends.get_backend('difflib'))
+
+        results = backends.calibrate(repeat=2)
+        chosen = next(name for name, _, agrees in results if agrees)
+        self.assertEqual(backends.get_active_backend(), chosen)
+        self.assertNotEqual(chosen, 'wrong')
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,124 @@
+#----------------------------------------------------------------------------
+# Created By  : Zt572
+# Created Date: Oct 2026
+# version ='1.0'
+# Copyright Oct 2026
+# ---------------------------------------------------------------------------
+""" Tests for the compiled intent-index artifact. Run them from the repository root with: python -m pytest test"""
+# ---------------------------------------------------------------------------
+import json
+import os
+import shutil
+import sys
+import tempfile
+import unittest
+from unittest import mock
+# ---------------------------------------------------------------------------
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+from chatbotparts.intentstore import compiled
+from chatbotparts.intentstore.compiled import CONFIG_PATH, CompiledIntentIndex, compile_intent_index, load_intent_index
+from chatbotparts.prog4fuzzy import DEFAULT_SYNONYMS, map_intent
+# ---------------------------------------------------------------------------
+
+
+class CompiledIntentIndexTest(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.config_path = os.path.join(self.directory, 'config.json')
+        shutil.copy(CONFIG_PATH, self.config_path)
+        with open(self.config_path, 'r') as f:
+            self.known_queries = json.load(f)
+
+    def tearDown(self):
+        shutil.rmtree(self.directory)
+
+    def load_counting_compiles(self, synonym_dict=None):
+        """Loads the index of the test config, returning it along with how many times it was compiled."""
+        with mock.patch.object(compiled, 'compile_intent_index', wraps=compile_intent_index) as compile_mock:
+            index = load_intent_index(self.config_path, synonym_dict)
+        return index, compile_mock.call_count
+
+    def test_round_trip(self):
+        built = compile_intent_index(self.config_path)
+        loaded, compiles = self.load_counting_compiles()
+        self.assertEqual(compiles, 0)
+        self.assertEqual(list(loaded.items()), list(self.known_queries.items()))
+        for forms in ("get_normalized_choices", "get_canonical_forms"):
+            self.assertEqual(list(getattr(loaded, forms)().items()), list(getattr(built, forms)().items()))
+        self.assertEqual(loaded.get_length_buckets(), built.get_length_buckets())
+        self.assertEqual(loaded.get_prescorer().vocabulary._encoded, built.get_prescorer().vocabulary._encoded)
+        for response in ("where does he live", "what is the reps phone numbr", "xyz"):
+            self.assertEqual(tuple(map_intent(response, loaded)), tuple(map_intent(response, self.known_queries)))
+
+    def test_artifact_holds_plain_data(self):
+        compile_intent_index(self.config_path)
+        with open(self.config_path + compiled.ARTIFACT_EXTENSION, 'rb') as f:
+            payload = f.read()[compiled._HEADER.size:]
+        (size,) = compiled._SECTION_SIZE.unpack_from(payload)     # The first section is the known queries' text
+        text = payload[compiled._SECTION_SIZE.size:compiled._SECTION_SIZE.size + size].decode('utf-8')
+        self.assertEqual(text, "".join(self.known_queries))
+
+    def test_invalidation(self):
+        compile_intent_index(self.config_path)
+        os.utime(self.config_path, ns=(0, 0))     # Touched but unchanged: its new mtime is recorded instead
+        self.assertEqual(self.load_counting_compiles()[1], 0)
+        with open(self.config_path + compiled.ARTIFACT_EXTENSION, 'rb') as f:
+            self.assertEqual(compiled._HEADER.unpack(f.read(compiled._HEADER.size))[2], 0)
+
+        self.known_queries["who is the speaker"] = "Name"
+        with open(self.config_path, 'w') as f:
+            json.dump(self.known_queries, f)
+        index, compiles = self.load_counting_compiles()
+        self.assertEqual(compiles, 1)
+        self.assertEqual(index["who is the speaker"], "Name")
+
+        synonym_dict = dict(DEFAULT_SYNONYMS, speaker="representative")
+        self.assertEqual(self.load_counting_compiles(synonym_dict)[1], 1)
+        self.assertEqual(self.load_counting_compiles(synonym_dict)[1], 0)
+
+    def test_corrupted_artifact_is_rebuilt(self):
+        compile_intent_index(self.config_path)
+        artifact_path = self.config_path + compiled.ARTIFACT_EXTENSION
+        with open(artifact_path, 'rb') as f:
+            data = f.read()
+        for corrupted in (data[:len(data) // 2], data[:compiled._HEADER.size] + b'\x01' * 40, data[:10]):
+            with open(artifact_path, 'wb') as f:
+                f.write(corrupted)
+            index, compiles = self.load_counting_compiles()
+            self.assertEqual(compiles, 1)
+            self.assertEqual(dict(index), self.known_queries)
+
+    def test_missing_config_uses_the_artifact(self):
+        compile_intent_index(self.config_path)
+        os.remove(self.config_path)
+        with mock.patch('builtins.print'):
+            index, compiles = self.load_counting_compiles()
+        self.assertEqual(compiles, 0)
+        self.assertEqual(dict(index), self.known_queries)
+
+    def test_unwritable_artifact(self):
+        with mock.patch('builtins.print') as print_mock, mock.patch.object(compiled.os, 'replace', side_effect=PermissionError):
+            index = compile_intent_index(self.config_path)
+        self.assertEqual(dict(index), self.known_queries)
+        self.assertIn("~~Warning", print_mock.call_args[0][0])
+
+    def test_changes_keep_the_derived_forms(self):
+        index = CompiledIntentIndex(self.known_queries, DEFAULT_SYNONYMS)
+        removed = next(iter(self.known_queries))
+        changed = {"where does the congressman live": "Contact Info:home address"}
+        new = index.with_changes(changed, [removed])
+        expected = dict(self.known_queries, **changed)
+        del expected[removed]
+        fresh = CompiledIntentIndex(expected, DEFAULT_SYNONYMS)
+        self.assertEqual(dict(new.get_canonical_forms().items()), dict(fresh.get_canonical_forms().items()))
+        self.assertEqual(new.get_canonical_forms()["where does the congressman live"], "where does the representative live")
+        scorer, fresh_scorer = new.get_prescorer(), fresh.get_prescorer()
+        for query in expected:
+            self.assertEqual(scorer("where does he live", query), fresh_scorer("where does he live", query))
+        self.assertNotIn(removed, new)
+        self.assertIn(removed, index)
+
+
+if __name__ == "__main__":
+    unittest.main()
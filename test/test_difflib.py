@@ -0,0 +1,69 @@
+#----------------------------------------------------------------------------
+# Created By  : Zt572
+# Created Date: Oct 2026
+# version ='1.0'
+# Copyright Oct 2026
+# ---------------------------------------------------------------------------
+""" Tests for thefuzz's vendored SequenceMatcher. Run them from the repository root with: python -m pytest test"""
+# ---------------------------------------------------------------------------
+import difflib
+import os
+import random
+import sys
+import unittest
+# ---------------------------------------------------------------------------
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+from chatbotparts.thefuzz.difflib import SequenceMatcher
+# ---------------------------------------------------------------------------
+
+
+def random_string(rng, alphabet, length):
+    return ''.join(rng.choice(alphabet) for _ in range(length))
+
+
+class SequenceMatcherTest(unittest.TestCase):
+
+    def assert_matches_stdlib(self, a, b):
+        expected = difflib.SequenceMatcher(None, a, b)
+        matcher = SequenceMatcher(None, a, b)
+        self.assertEqual([tuple(block) for block in matcher.get_matching_blocks()],
+                         [tuple(block) for block in expected.get_matching_blocks()], (a, b))
+        self.assertEqual(matcher.ratio(), expected.ratio(), (a, b))
+        self.assertEqual(matcher.quick_ratio(), expected.quick_ratio(), (a, b))
+        self.assertEqual(matcher.real_quick_ratio(), expected.real_quick_ratio(), (a, b))
+
+    def test_random_pairs(self):
+        rng = random.Random(0)
+        for alphabet in ("ab", "abc ", "abcdefghijklmnopqrstuvwxyz '"):
+            for _ in range(400):
+                self.assert_matches_stdlib(random_string(rng, alphabet, rng.randint(0, 80)),
+                                           random_string(rng, alphabet, rng.randint(0, 80)))
+
+    def test_popular_elements_of_long_sequences(self):
+        rng = random.Random(1)
+        for length in (199, 200, 500):
+            for _ in range(20):
+                a = random_string(rng, "ab c", rng.randint(length // 2, length))
+                self.assert_matches_stdlib(a, random_string(rng, "abcde", length))
+                self.assert_matches_stdlib(random_string(rng, "abcde", length), a)
+
+    def test_sentences(self):
+        rng = random.Random(2)
+        words = ["where", "does", "the", "representative", "live", "work", "what", "is", "phone", "number", "tell", "me"]
+        for _ in range(300):
+            self.assert_matches_stdlib(' '.join(rng.choice(words) for _ in range(rng.randint(1, 8))),
+                                       ' '.join(rng.choice(words) for _ in range(rng.randint(1, 8))))
+
+    def test_reuse_and_junk(self):
+        matcher = SequenceMatcher(None, "abxcd", "abcd")
+        self.assertEqual(matcher.get_matching_blocks(), [(0, 0, 2), (3, 2, 2), (5, 4, 0)])
+        matcher.set_seqs("where", "there")
+        self.assertEqual(matcher.ratio(), difflib.SequenceMatcher(None, "where", "there").ratio())
+        matcher.set_seq2("here")
+        self.assertEqual(matcher.ratio(), difflib.SequenceMatcher(None, "where", "here").ratio())
+        with self.assertRaises(ValueError):
+            SequenceMatcher(lambda x: x == " ", "a b", "b a")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,228 @@
+#----------------------------------------------------------------------------
+# Created By  : Zt572
+# Created Date: Oct 2026
+# version ='1.0'
+# Copyright Oct 2026
+# ---------------------------------------------------------------------------
+""" Tests for the InfoContainers and the extraction of profile fields. Run them from the repository root with: python -m pytest test"""
+# ---------------------------------------------------------------------------
+import os
+import pickle
+import re
+import sys
+import unittest
+from unittest import mock
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+# ---------------------------------------------------------------------------
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+from chatbotparts.infocontainer import infocontainer as ic
+from chatbotparts import prog2
+from test_prog2 import stored_page_text
+# ---------------------------------------------------------------------------
+
+PAGE = ("# Representative Jane Q. Doe\n"
+        "District 12 - Aiken & Barnwell Counties - Map\n"
+        "## Columbia Address\n"
+        "310C Blatt Bldg.\n"
+        "Columbia 29201\n"
+        "Business Phone (803) 555-0100\n"
+        "## Home Address\n"
+        "12 Oak Lane\n"
+        "Aiken 29801\n"
+        "## Personal Information\n"
+        "- Born June 4\n"
+        "- Daughter of John and Mary Doe\n"
+        "- Clemson University, B.S., 1999\n"
+        "- Furman University, J.D., 2003\n"
+        "- 3 children, Ann, Bob and Cal\n"
+        "- Former teacher\n"
+        "- Member, First Baptist Church\n"
+        "## Committee Assignments\n"
+        "- Ways and Means\n"
+        "## Service In Public Office\n"
+        "- House of Representatives, 2010 - Present\n"
+        "- Aiken City Council, 2004-2010\n")
+
+
+def span(text, start_marker, end_marker=None):
+    return text.index(start_marker), len(text) if end_marker is None else text.index(end_marker)
+
+
+def profile_records(text):
+    """Returns the record of every section of the page."""
+    return {category: container.get_record() for category, container in prog2.make_containers(text).items()}
+
+
+class SpanExtractionTest(unittest.TestCase):
+
+    def test_containers_share_the_page(self):
+        start, end = span(PAGE, "## Personal Information", "## Committee Assignments")
+        container = ic.PersonalInfoContainer(PAGE, start, end)
+        self.assertIs(container._data, PAGE)    # A reference to the page, not a copy of the span
+        self.assertEqual(container.get_span(), (start, end))
+        self.assertEqual(container.get_raw_data(), PAGE[start:end])
+        self.assertIs(ic.InfoContainer(PAGE).get_raw_data(), PAGE)
+
+    def test_fields_are_only_taken_from_the_span(self):
+        start, end = span(PAGE, "## Personal Information", "## Committee Assignments")
+        self.assertEqual(ic.PersonalInfoContainer(PAGE, start, end).birthday, "Born June 4")
+        self.assertIsNone(ic.PersonalInfoContainer(PAGE, 0, start).birthday)
+        # A match running past the end of the span doesn't count
+        cut = PAGE.index("June") + 2
+        self.assertIsNone(ic.PersonalInfoContainer(PAGE, start, cut).birthday)
+        self.assertEqual(ic.extract_fields(PAGE, {'personal': (start, cut)}, fields=['birthday']), {'birthday': []})
+
+    def test_first_match_of_each_field(self):
+        start, end = span(PAGE, "# Representative", "## Personal Information")
+        contact = ic.ContactInfoContainer(PAGE, start, end)
+        self.assertEqual(contact.name, "Representative Jane Q. Doe")
+        self.assertEqual(contact.phone, "(803) 555-0100")
+        self.assertEqual(str(contact.columbia_address), "310C Blatt Bldg, Columbia 29201 ")
+        self.assertEqual(str(contact.home_address), "12 Oak Lane, Aiken 29801 ")
+        start, end = span(PAGE, "District 12", "## Columbia Address")
+        district = ic.DistrictInfoContainer(PAGE, start, end)
+        self.assertEqual((district.district_name, district.region), ("District 12", "Aiken & Barnwell "))
+
+    def test_data_and_dictionary_types(self):
+        with self.assertRaises(TypeError):
+            ic.InfoContainer(b"bytes")
+        with self.assertRaises(TypeError):
+            ic.InfoContainer(PAGE, ["not", "a", "dictionary"])
+        container = ic.InfoContainer(PAGE, {"motto": "Dum spiro spero", "number": 12})
+        self.assertEqual(container.search("Motto"), "Dum spiro spero")
+        self.assertEqual(container.search("number"), "12")
+        self.assertEqual(container.search("hobbies"), ic.UNRETRIEVED)
+        with self.assertRaises(TypeError):
+            container.search(12)
+
+        # New data forgets what was extracted from the old
+        service = ic.ServiceInfoContainer(PAGE, *span(PAGE, "## Service In Public Office"))
+        self.assertIn("Aiken City Council", service.service)
+        service.set_data("## Service In Public Office\n- Senate, 2020 - Present\n")
+        self.assertEqual(service.service, "Senate, 2020 - Present")
+
+
+class ExtractFieldsTest(unittest.TestCase):
+
+    def assert_matches_findall(self, text):
+        found = ic.extract_fields(text)
+        self.assertEqual(list(found), [field for field, _, _, _ in ic._PROFILE_FIELDS])
+        for field, _, pattern, limit in ic._PROFILE_FIELDS:
+            self.assertEqual(found[field], re.findall(pattern, text, re.MULTILINE)[:limit], field)
+
+    def test_same_matches_as_findall(self):
+        self.assert_matches_findall(PAGE)
+        self.assert_matches_findall(stored_page_text())
+        self.assert_matches_findall(PAGE.replace("\n", "\n- "))
+        self.assert_matches_findall("")
+
+    def test_sections_and_fields(self):
+        personal = span(PAGE, "## Personal Information", "## Committee Assignments")
+        service = span(PAGE, "## Service In Public Office")
+        found = ic.extract_fields(PAGE, {'personal': personal, 'service': service})
+        self.assertEqual(set(found), set(ic._FIELD_LIMITS))
+        self.assertEqual(found['phone'], [])    # Its section wasn't given
+        self.assertEqual(ic.extract_fields(PAGE, {'personal': (5, 5)}, fields=['birthday']), {'birthday': []})
+        self.assertEqual(found['education'], ["Clemson University, B.S., 1999", "Furman University, J.D., 2003"])
+        self.assertEqual(found['service'], ["House of Representatives, 2010 - Present", "Aiken City Council, 2004-2010"])
+        self.assertEqual(ic.extract_fields(PAGE, fields=['phone', 'district']),
+                         {'phone': ["(803) 555-0100"], 'district': ["District 12"]})
+
+    def test_one_scanner_per_set_of_fields(self):
+        ic.extract_fields(PAGE, fields=['phone', 'name'])
+        scanner = ic._get_scanner(frozenset(['phone', 'name']))
+        self.assertIs(ic._get_scanner(frozenset(['name', 'phone'])), scanner)
+        self.assertEqual(set(scanner.groupindex), {'phone', 'name'})
+        self.assertEqual(ic.extract_fields(PAGE, fields=['name', 'phone']), {'name': ["Representative Jane Q. Doe"],
+                                                                            'phone': ["(803) 555-0100"]})
+
+
+class RecordTest(unittest.TestCase):
+
+    def test_records_are_immutable_and_slotted(self):
+        record = ic.ContactInfoContainer(PAGE, *span(PAGE, "# Representative", "## Personal")).get_record()
+        for value in (record, record.home_address, ic.PersonalInfoContainer(PAGE).education):
+            self.assertFalse(hasattr(value, '__dict__'))
+            with self.assertRaises(AttributeError):
+                value.extra = 1
+        with self.assertRaises(AttributeError):
+            record.phone = "(803) 555-0199"
+        with self.assertRaises(AttributeError):
+            del record.name
+        with self.assertRaises(TypeError):
+            record["phone"] = "(803) 555-0199"
+        self.assertEqual(record["phone"], "(803) 555-0100")
+        self.assertEqual(dict(record), dict(ic.ContactInfoContainer(PAGE, *span(PAGE, "# Representative", "## Personal")).get_dict()))
+        self.assertFalse(hasattr(ic.ContactInfoContainer(PAGE), '__dict__'))
+
+    def test_records_compare_hash_and_pickle_by_value(self):
+        records = profile_records(PAGE)
+        self.assertEqual(records, profile_records(PAGE))
+        self.assertEqual(len({records["personal info"], profile_records(PAGE)["personal info"]}), 1)
+        self.assertEqual(pickle.loads(pickle.dumps(records)), records)
+        self.assertNotEqual(records["district"], profile_records(PAGE.replace("District 12", "District 13"))["district"])
+
+    def test_profiles_dont_share_state(self):
+        other_page = PAGE.replace("Jane Q. Doe", "John R. Roe").replace("12 Oak Lane", "71 Elm Road")
+        first = prog2.make_containers(PAGE)
+        second = prog2.make_containers(other_page)
+        self.assertEqual(str(second["contact info"].home_address), "71 Elm Road, Aiken 29801 ")
+        self.assertEqual(str(first["contact info"].home_address), "12 Oak Lane, Aiken 29801 ")
+        self.assertEqual(first["contact info"].name, "Representative Jane Q. Doe")
+
+    def test_concurrent_parsing(self):
+        pages = [PAGE.replace("District 12", f"District {number}").replace("June 4", f"June {number % 28 + 1}")
+                 for number in range(40)]
+        expected = [profile_records(page) for page in pages]
+        with ThreadPoolExecutor(8) as executor:
+            self.assertEqual(list(executor.map(profile_records, pages)), expected)
+        with ProcessPoolExecutor(2) as executor:
+            self.assertEqual(list(executor.map(profile_records, pages[:4])), expected[:4])
+
+
+class LazyFieldTest(unittest.TestCase):
+
+    def setUp(self):
+        self.personal = span(PAGE, "## Personal Information", "## Committee Assignments")
+
+    def test_only_the_field_searched_for_is_extracted(self):
+        container = ic.PersonalInfoContainer(PAGE, *self.personal)
+        with mock.patch.object(ic, 'extract_fields', wraps=ic.extract_fields) as extract:
+            self.assertEqual(container.search("birthday"), "Born June 4")
+            self.assertEqual(container.search("Birthday"), "Born June 4")     # Memoized
+            self.assertEqual(extract.call_count, 1)
+            self.assertEqual(extract.call_args[0][3], ['birthday'])
+            self.assertEqual(set(container._fields), {'birthday'})
+
+            info = container.format_dict_info()     # The rest, in a single pass
+            self.assertEqual(extract.call_count, 2)
+            self.assertEqual(set(extract.call_args[0][3]), set(ic._SECTION_FIELDS['personal']) - {'birthday'})
+            self.assertIn("Religion: Member, First Baptist Church\n", info)
+            self.assertEqual(container.format_dict_info(), info)
+            self.assertEqual(extract.call_count, 2)
+
+    def test_given_fields_arent_extracted_again(self):
+        fields = ic.extract_fields(PAGE, prog2.split_sections(PAGE))
+        with mock.patch.object(ic, 'extract_fields') as extract:
+            containers = prog2.make_containers(PAGE, fields)
+            self.assertEqual(containers["service"].search("service").splitlines()[1], "Aiken City Council, 2004-2010")
+            prog2.render_answer(containers, "all", None)
+        extract.assert_not_called()
+
+    def test_unretrieved_fields_are_retried(self):
+        container = ic.PersonalInfoContainer(PAGE, *self.personal)
+        out_of_time = {'education': None, 'birthday': None}
+        with mock.patch.object(ic, 'extract_fields', return_value=out_of_time):
+            self.assertEqual(container.education, ic.UNRETRIEVED)
+            self.assertEqual(container.birthday, ic.UNRETRIEVED)
+        self.assertEqual(str(container.education), "Clemson University, B.S., 1999; Furman University, J.D., 2003")
+        self.assertEqual(container.birthday, "Born June 4")
+
+        contact = ic.ContactInfoContainer(PAGE, time_budget=0)
+        self.assertEqual(contact.home_address, ic.UNRETRIEVED)
+        contact._time_budget = None
+        self.assertEqual(str(contact.home_address), "12 Oak Lane, Aiken 29801 ")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,68 @@
+#----------------------------------------------------------------------------
+# Created By  : Zt572
+# Created Date: Oct 2026
+# version ='1.0'
+# Copyright Oct 2026
+# ---------------------------------------------------------------------------
+""" Tests for the compact intent store. Run them from the repository root with: python -m pytest test"""
+# ---------------------------------------------------------------------------
+import json
+import os
+import random
+import sys
+import unittest
+# ---------------------------------------------------------------------------
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+from chatbotparts.config.definitions import ROOT_DIR
+from chatbotparts.intentstore.intentstore import IntentStore
+from chatbotparts.prog4fuzzy import map_intent
+# ---------------------------------------------------------------------------
+
+
+class IntentStoreTest(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        with open(os.path.join(ROOT_DIR, 'src', 'chatbotparts', 'config', 'config.json'), 'r') as f:
+            cls.known_queries = json.load(f)
+
+    def test_behaves_like_the_dictionary(self):
+        store = IntentStore(self.known_queries)
+        self.assertEqual(dict(store), self.known_queries)
+        self.assertEqual(list(store), list(self.known_queries))     # In the order given
+        self.assertEqual(len(store), len(self.known_queries))
+        for query, info_type in self.known_queries.items():
+            self.assertEqual(store[query], info_type)
+            self.assertIn(query, store)
+            self.assertEqual(store.get_query(store.index_of(query)), query)
+        self.assertNotIn("who is the speaker", store)
+        self.assertNotIn(None, store)
+        self.assertEqual(store.index_of("who is the speaker"), -1)
+        with self.assertRaises(KeyError):
+            store["who is the speaker"]
+        with self.assertRaises(IndexError):
+            store.get_query(len(store))
+
+    def test_lookups_among_many_queries(self):
+        rng = random.Random(0)
+        queries = {f"query {rng.random()} {i}": f"Type {i % 7}" for i in range(5000)}
+        store = IntentStore(queries.items())
+        self.assertEqual(store.get_info_types(), [f"Type {i}" for i in range(7)])
+        for query in rng.sample(list(queries), 500):
+            self.assertEqual(store[query], queries[query])
+        self.assertNotIn("query", store)
+
+    def test_duplicates_and_types(self):
+        store = IntentStore([("a", "X"), ("b", "Y"), ("a", "Z")])
+        self.assertEqual(dict(store), {"a": "Z", "b": "Y"})
+        with self.assertRaises(TypeError):
+            IntentStore({"a": 1})
+
+    def test_matches_like_the_dictionary(self):
+        store = IntentStore(self.known_queries)
+        for response in ("where does he live", "what is the reps phone numbr", "tell me everything", "xyz"):
+            self.assertEqual(tuple(map_intent(response, store)), tuple(map_intent(response, self.known_queries)))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,74 @@
+#----------------------------------------------------------------------------
+# Created By  : Zt572
+# Created Date: Oct 2026
+# version ='1.0'
+# Copyright Oct 2026
+# ---------------------------------------------------------------------------
+""" Tests for the conversion of pages to structured text. Run them from the repository root with: python -m pytest test"""
+# ---------------------------------------------------------------------------
+import os
+import sys
+import unittest
+# ---------------------------------------------------------------------------
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+from chatbotparts import prog1, prog2
+from chatbotparts.config.definitions import ROOT_DIR
+from chatbotparts.infocontainer import pagetext
+# ---------------------------------------------------------------------------
+
+HTML = ('<div class="mainwidepanel"><h2 class="barheader">Representative  Jane&nbsp;Q. Doe</h2>'
+        '<style>.x { list-style-type:square; }</style><script>var phone = "(803) 555-0199";</script>'
+        '<p>District 12 - Aiken &amp; Barnwell Counties</p><p>310C Blatt Bldg.<br>Columbia 29201</p>'
+        '<h2>Personal Information</h2><ul><li style="list-style-type:square;" >Born June 4</li>'
+        '<li>Member, St. Mary&#8217;s Church</li></ul><!-- mainwidepanel --></div>')
+
+
+class PageTextTest(unittest.TestCase):
+
+    def test_structure(self):
+        self.assertEqual(pagetext.page_text(HTML).split('\n'), [
+            "# Representative Jane Q. Doe",
+            "District 12 - Aiken & Barnwell Counties",
+            "310C Blatt Bldg.",
+            "Columbia 29201",
+            "## Personal Information",
+            "- Born June 4",
+            "- Member, St. Mary’s Church",
+        ])
+        self.assertEqual(pagetext.page_text(""), "")
+
+    def test_fed_in_pieces(self):
+        for size in (1, 7, 64):
+            parser = pagetext.PageTextParser()
+            for start in range(0, len(HTML), size):
+                parser.feed(HTML[start:start + size])
+            parser.close()
+            self.assertEqual('\n'.join(parser.lines), pagetext.page_text(HTML), size)
+
+    def test_is_html(self):
+        self.assertTrue(pagetext.is_html(HTML))
+        self.assertTrue(pagetext.is_html("text <!-- a comment -->"))
+        self.assertTrue(pagetext.is_html("<br/>"))
+        self.assertFalse(pagetext.is_html(pagetext.page_text(HTML)))
+        self.assertFalse(pagetext.is_html("- 2 < 3 and 4 > 3"))
+
+    def test_stored_page_is_much_smaller(self):
+        with open(os.path.join(ROOT_DIR, 'data', prog2.RAW_PAGE), 'r', newline='') as f:
+            html = f.read()
+        panel = html[html.find(prog1.PANEL_START):html.find(prog1.PANEL_END)]
+        self.assertLess(len(pagetext.page_text(panel)) * 5, len(panel))
+
+
+class RawHtmlTest(unittest.TestCase):
+
+    def test_containers_convert_raw_html(self):
+        text = pagetext.page_text(HTML)
+        for info_type in ("All", "Contact Info", "Personal Info:birthday", "Personal Info:religion", "District:region"):
+            self.assertEqual(prog2.parse_info(HTML, info_type), prog2.parse_info(text, info_type), info_type)
+        self.assertEqual(prog2.parse_info(HTML, "Personal Info:birthday"), "Born June 4")
+        self.assertNotIn("555-0199", prog2.parse_info(HTML, "All"))     # Scripts aren't text
+        self.assertEqual(prog2.make_containers(HTML)["district"].get_raw_data(), prog2.make_containers(text)["district"].get_raw_data())
+
+
+if __name__ == "__main__":
+    unittest.main()
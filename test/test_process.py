@@ -0,0 +1,186 @@
+#----------------------------------------------------------------------------
+# Created By  : Zt572
+# Created Date: Oct 2026
+# version ='1.0'
+# Copyright Oct 2026
+# ---------------------------------------------------------------------------
+""" Tests for thefuzz's process module. Run them from the repository root with: python -m pytest test"""
+# ---------------------------------------------------------------------------
+import asyncio
+import os
+import random
+import sys
+import time
+import unittest
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from functools import partial
+# ---------------------------------------------------------------------------
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+from chatbotparts.thefuzz import fuzz, process, utils
+# ---------------------------------------------------------------------------
+
+CHOICES = [
+    "where does the representative live",
+    "where does the representative work",
+    "what is the representative's phone number",
+    "tell me everything",
+    "what committees is the representative on",
+    "who are the representative's parents",
+]
+
+
+def random_choices(count, seed=0):
+    """Returns count random sentences of made up words."""
+    rng = random.Random(seed)
+    words = [''.join(rng.choice('abcdefghijklmnopqrstuvwxyz') for _ in range(rng.randint(2, 8))) for _ in range(500)]
+    return [' '.join(rng.choice(words) for _ in range(rng.randint(2, 8))) for _ in range(count)]
+
+
+class NormalizedQueryTest(unittest.TestCase):
+
+    def test_forms(self):
+        query = utils.NormalizedQuery("Where does my Rep live?!", canonicalize=lambda s: s.replace("rep", "representative"))
+        self.assertEqual((query.lowered, query.stripped, query.canonical), ("where does my rep live?!", "where does my rep live",
+                                                                           "where does my representative live"))
+        self.assertEqual(query.processed, "where does my representative live")
+        self.assertEqual(query.tokens, ("where", "does", "my", "representative", "live"))
+        self.assertEqual(query.sorted_tokens, "does live my representative where")
+        self.assertEqual(utils.full_process(query, force_ascii=True), query.processed)
+
+    def test_scores_like_the_string(self):
+        for scorer in process._full_process_scorers:
+            force_ascii = scorer not in process._unicode_scorers
+            for text in ("Where does the Representative LIVE?", "phone number", "caf\u00e9 au lait", "!!"):
+                query = utils.NormalizedQuery(text, force_ascii=force_ascii)
+                for choice in CHOICES + ["cafe au lait"]:
+                    self.assertEqual(scorer(query, choice), scorer(text, choice), (scorer.__name__, text, choice))
+                self.assertEqual(process.extract(query, CHOICES, scorer=scorer, limit=None),
+                                 process.extract(text, CHOICES, scorer=scorer, limit=None))
+
+    def test_custom_processor_gets_the_raw_query(self):
+        seen = []
+        def processor(s):
+            seen.append(s)
+            return s
+        process.extractOne(utils.NormalizedQuery("Tell me EVERYTHING"), CHOICES, processor=processor)
+        self.assertEqual(seen[0], "Tell me EVERYTHING")
+
+
+class PreparedChoicesTest(unittest.TestCase):
+
+    def test_matches_extract_one(self):
+        choices = random_choices(300)
+        rng = random.Random(1)
+        for keyed in (False, True):
+            source = dict(enumerate(choices)) if keyed else choices
+            prepared = process.PreparedChoices(source)
+            for query in rng.sample(choices, 6) + [choices[0].split()[0], ' '.join(choices[:3]), '!!']:
+                for score_cutoff in (0, 70):
+                    self.assertEqual(process.extractOne(query, prepared, score_cutoff=score_cutoff),
+                                     process.extractOne(query, source, score_cutoff=score_cutoff), query)
+                self.assertEqual(process.extractOneWithin(query, prepared, 10), (process.extractOne(query, source), False))
+
+    def test_unicode_and_processor(self):
+        choices = [("id", "caf\u00e9 au lait"), ("id2", "tea")]
+        prepared = process.PreparedChoices(choices, processor=lambda choice: choice[1], force_ascii=False)
+        self.assertEqual(prepared.extract_one(("query", "CAF\u00c9"), fuzz.UWRatio),
+                         process.extractOne(("query", "CAF\u00c9"), choices, processor=lambda choice: choice[1], scorer=fuzz.UWRatio))
+        with self.assertRaises(ValueError):
+            prepared.extract_one("cafe", fuzz.WRatio)
+
+    def test_other_processor_is_refused(self):
+        prepared = process.PreparedChoices(CHOICES)
+        self.assertEqual(process.extractOne("tell me", prepared, processor=None), process.extractOne("tell me", CHOICES))
+        for search in (process.extractOne, partial(process.extractOneWithin, time_budget=1)):
+            with self.assertRaises(ValueError):
+                search("tell me", prepared, processor=str.upper)
+
+    def test_bound_is_a_ceiling(self):
+        rng = random.Random(2)
+        choices = random_choices(300, seed=3)
+        for _ in range(500):
+            s1, s2 = rng.choice(choices), rng.choice(choices)[:rng.randint(1, 60)]
+            p1, p2 = utils.full_process(s1, force_ascii=True), utils.full_process(s2, force_ascii=True)
+            self.assertLessEqual(fuzz.WRatio(p1, p2), process.PreparedChoices._bound(len(p1), len(p2))[0], (p1, p2))
+
+
+class ExtractOneWithinTest(unittest.TestCase):
+
+    def test_complete_within_budget(self):
+        for choices in (CHOICES, dict(enumerate(CHOICES))):
+            for query in ("where does he live", "phone number", "tell me everything", "xyz"):
+                match, is_partial = process.extractOneWithin(query, choices, 10)
+                self.assertFalse(is_partial)
+                self.assertEqual(match, process.extractOne(query, choices))
+
+    def test_partial_result_scores_the_best_estimate_first(self):
+        match, is_partial = process.extractOneWithin("what is the representative's phone number", CHOICES, 0)
+        self.assertTrue(is_partial)
+        self.assertEqual(match, ("what is the representative's phone number", 100))
+
+    def test_custom_prior(self):
+        def prior(query, choice):
+            return choice == "tell me everything"
+        match, is_partial = process.extractOneWithin("where does he live", CHOICES, 0, prior=prior)
+        self.assertTrue(is_partial)
+        self.assertEqual(match[0], "tell me everything")
+
+    def test_score_cutoff(self):
+        match, is_partial = process.extractOneWithin("xyz", CHOICES, 10, score_cutoff=50)
+        self.assertEqual((match, is_partial), (None, False))
+
+    def test_budget_is_a_ceiling(self):
+        choices = random_choices(50000)
+        start = time.perf_counter()
+        match, is_partial = process.extractOneWithin(choices[-1], choices, 0.05)
+        self.assertLess(time.perf_counter() - start, 0.5)
+        self.assertTrue(is_partial)
+        self.assertIsNotNone(match)
+
+
+class ExtractAsyncTest(unittest.TestCase):
+
+    def test_same_results_as_the_sync_versions(self):
+        choices = random_choices(300)
+        keyed = dict(enumerate(choices))
+        query = choices[7][:20]
+        self.assertEqual(asyncio.run(process.extractAsync(query, choices, limit=10)), process.extract(query, choices, limit=10))
+        self.assertEqual(asyncio.run(process.extractAsync(query, keyed, limit=None)), process.extract(query, keyed, limit=None))
+        for score_cutoff in (0, 60, 101):
+            self.assertEqual(asyncio.run(process.extractOneAsync(query, keyed, score_cutoff=score_cutoff)),
+                             process.extractOne(query, keyed, score_cutoff=score_cutoff))
+        prepared = process.PreparedChoices(choices)
+        self.assertEqual(asyncio.run(process.extractOneAsync(query, prepared)), process.extractOne(query, choices))
+        self.assertEqual(asyncio.run(process.extractOneWithinAsync(query, choices, 10)), (process.extractOne(query, choices), False))
+
+    def test_other_tasks_run_during_a_scan(self):
+        choices = random_choices(1000)
+        ticks = []
+
+        async def ticker(scan):
+            while not scan.done():
+                ticks.append(None)
+                await asyncio.sleep(0)
+
+        async def main():
+            scan = asyncio.ensure_future(process.extractOneAsync(choices[0], choices, yield_every=50))
+            await asyncio.gather(scan, ticker(scan))
+            return scan.result()
+        self.assertEqual(asyncio.run(main()), process.extractOne(choices[0], choices))
+        self.assertGreaterEqual(len(ticks), 1000 // 50)
+
+    def test_offload(self):
+        known_queries = dict((choice, str(i)) for i, choice in enumerate(CHOICES))
+        async def main(executor):
+            return (await process.extractAsync("where does he live", known_queries.keys(), executor=executor, offload_threshold=1),
+                    await process.extractOneAsync("phone number", CHOICES, executor=executor, offload_threshold=1),
+                    await process.extractOneWithinAsync("phone number", CHOICES, 10, executor=executor, offload_threshold=1))
+        expected = (process.extract("where does he live", list(known_queries)), process.extractOne("phone number", CHOICES),
+                    (process.extractOne("phone number", CHOICES), False))
+        for executor_type in (ThreadPoolExecutor, ProcessPoolExecutor):
+            with executor_type(max_workers=1) as executor:
+                self.assertEqual(asyncio.run(main(executor)), expected)
+
+
+if __name__ == "__main__":
+    unittest.main()
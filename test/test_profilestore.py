@@ -0,0 +1,150 @@
+#----------------------------------------------------------------------------
+# Created By  : Zt572
+# Created Date: Oct 2026
+# version ='1.0'
+# Copyright Oct 2026
+# ---------------------------------------------------------------------------
+""" Tests for the memory-mapped store of many representatives' profiles. Run them from the repository root with: python -m pytest test"""
+# ---------------------------------------------------------------------------
+import os
+import shutil
+import struct
+import sys
+import tempfile
+import unittest
+from concurrent.futures import ProcessPoolExecutor
+from unittest import mock
+# ---------------------------------------------------------------------------
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+from chatbotparts import prog2
+from chatbotparts.infocontainer import infocontainer as ic
+from chatbotparts.infocontainer import profilestore
+from test_infocontainer import PAGE
+# ---------------------------------------------------------------------------
+
+NAMES = ["Jane Q. Doe", "John R. Roe", "Ann B. Lee", "Carl D. Fox"]
+
+
+def representative_page(district):
+    """Returns the structured text of a made-up representative's page, whose name is unique to the district."""
+    name = NAMES[district % len(NAMES)] + str(district)
+    return (PAGE.replace("Jane Q. Doe", name).replace("District 12", f"District {district}")
+            .replace("555-0100", f"555-{district:04d}"))
+
+
+def representative_snapshot(district, keep_text=True):
+    text = representative_page(district)
+    fields = None if keep_text else ic.extract_fields(text, prog2.split_sections(text))
+    return prog2.take_snapshot(fields, f"district_{district}.txt", prog2.source_hash(text), text if keep_text else None)
+
+
+def phone_of(path, district):
+    with profilestore.ProfileStore(path) as store:
+        return prog2.parse_info(store.get_district(district), "Contact Info:phone")
+
+
+class ProfileStoreTest(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.directory = tempfile.mkdtemp()
+        cls.path = os.path.join(cls.directory, 'profiles.store')
+        cls.districts = list(range(124, 0, -1))     # Written out of order
+        cls.snapshots = {district: representative_snapshot(district, keep_text=district % 2 == 0) for district in cls.districts}
+        profilestore.write_store(cls.path, (cls.snapshots[district] for district in cls.districts))
+
+    @classmethod
+    def tearDownClass(cls):
+        shutil.rmtree(cls.directory)
+
+    def test_lookup_by_district(self):
+        with profilestore.ProfileStore(self.path) as store:
+            self.assertEqual(len(store), len(self.districts))
+            self.assertEqual(store.get_districts(), sorted(self.districts))
+            for district in (1, 12, 93, 124):
+                profile = store.get_district(district)
+                snapshot = self.snapshots[district]
+                self.assertEqual((profile.source, profile.source_hash, profile.text),
+                                 (snapshot.source, snapshot.source_hash, snapshot.text))
+                self.assertEqual(dict(profile.answers), snapshot.answers)
+                self.assertEqual(prog2.parse_info(profile, "Contact Info:phone"), f"(803) 555-{district:04d}")
+            self.assertIsNone(store.get_district(0))
+            self.assertIsNone(store.get_district(125))
+            self.assertEqual(store.find_district(500), -1)
+            with self.assertRaises(IndexError):
+                store.get_profile(len(self.districts))
+
+    def test_lookup_by_name(self):
+        with profilestore.ProfileStore(self.path) as store:
+            profile = store.get_representative("  representative  JOHN R. roe5 ")
+            self.assertEqual(prog2.parse_info(profile, "District:district name"), "District 5")
+            self.assertIsNone(store.get_representative("Nobody X. Here"))
+        self.assertEqual(profilestore.name_key("Representative Jane  Q. Doe"), "jane q. doe")
+
+    def test_answers_are_decoded_when_looked_up(self):
+        with profilestore.ProfileStore(self.path) as store:
+            profile = store.get_district(7)
+            with mock.patch.object(store, '_string', wraps=store._string) as decoded:
+                self.assertEqual(profile.answers["contact info:phone"], "(803) 555-0007")
+            self.assertEqual(decoded.call_count, 1)
+            # Types of information not answered in advance are extracted from the text, or not at all without it
+            self.assertEqual(prog2.parse_info(store.get_district(8), "Personal Info:education"),
+                             "Clemson University, B.S., 1999; Furman University, J.D., 2003")
+            self.assertIsNone(profile.text)
+
+    def test_shared_between_processes(self):
+        with ProcessPoolExecutor(2) as executor:
+            phones = list(executor.map(phone_of, [self.path] * 4, [5, 50, 100, 124]))
+        self.assertEqual(phones, [f"(803) 555-{district:04d}" for district in (5, 50, 100, 124)])
+
+    def test_invalid_stores(self):
+        path = os.path.join(self.directory, 'invalid.store')
+        for contents in (b'', b'MRPS', b'not a profile store at all, not even close' * 2):
+            with open(path, 'wb') as f:
+                f.write(contents)
+            with self.assertRaises(ValueError):
+                profilestore.ProfileStore(path)
+        with open(self.path, 'rb') as f:
+            data = bytearray(f.read())
+        struct.pack_into('<H', data, 6, prog2.SNAPSHOT_VERSION + 1)     # Of snapshots of another version
+        with open(path, 'wb') as f:
+            f.write(data)
+        with self.assertRaisesRegex(ValueError, "of version"):
+            profilestore.ProfileStore(path)
+
+        with self.assertRaises(ValueError):
+            profilestore.write_store(path, [self.snapshots[1]._replace(version=prog2.SNAPSHOT_VERSION - 1)])
+        self.assertFalse(os.path.exists(path + '.tmp'))
+
+
+class LoadDistrictTest(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        os.mkdir(os.path.join(self.directory, 'data'))
+        patcher = mock.patch.object(prog2, 'ROOT_DIR', self.directory)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def tearDown(self):
+        shutil.rmtree(self.directory)
+
+    def test_load_district(self):
+        self.assertIsNone(prog2.load_district("District 12"))   # No store
+        profilestore.write_store(os.path.join(self.directory, 'data', prog2.PROFILE_STORE),
+                                 [representative_snapshot(district) for district in (12, 93)])
+        profile = prog2.load_district("District 93")
+        self.assertEqual(prog2.parse_info(profile, "Contact Info:phone"), "(803) 555-0093")
+        self.assertEqual(prog2.parse_info(prog2.load_district("12"), "District"), prog2.parse_info(representative_page(12), "District"))
+        self.assertIsNone(prog2.load_district("District 4"))
+        self.assertIsNone(prog2.load_district("the speaker's district"))
+
+        with open(os.path.join(self.directory, 'data', prog2.PROFILE_STORE), 'wb') as f:
+            f.write(b'broken')
+        with mock.patch('builtins.print') as print_mock:
+            self.assertIsNone(prog2.load_district("District 93"))
+        self.assertIn("~~Warning: could not open the profile store", print_mock.call_args[0][0])
+
+
+if __name__ == "__main__":
+    unittest.main()
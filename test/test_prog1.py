@@ -0,0 +1,96 @@
+#----------------------------------------------------------------------------
+# Created By  : Zt572
+# Created Date: Oct 2026
+# version ='1.0'
+# Copyright Oct 2026
+# ---------------------------------------------------------------------------
+""" Tests for prog1's streaming extraction of a representative's page. Run them from the repository root with: python -m pytest test"""
+# ---------------------------------------------------------------------------
+import io
+import os
+import sys
+import unittest
+from unittest import mock
+# ---------------------------------------------------------------------------
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+from chatbotparts import prog1, prog2
+from chatbotparts.config.definitions import ROOT_DIR
+from chatbotparts.infocontainer import infocontainer as ic
+from chatbotparts.infocontainer import pagetext
+# ---------------------------------------------------------------------------
+
+
+def in_chunks(text, size):
+    return (text[start:start + size] for start in range(0, len(text), size))
+
+
+class StreamingTest(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        with open(os.path.join(ROOT_DIR, 'data', prog2.RAW_PAGE), 'r', newline='') as f:
+            cls.html = f.read()
+        cls.panel = cls.html[cls.html.find(prog1.PANEL_START):cls.html.find(prog1.PANEL_END)]
+        cls.text = pagetext.page_text(cls.panel)
+
+    def test_panel_chunks(self):
+        for size in (1, 5, 100, prog1.CHUNK_SIZE, len(self.html)):
+            self.assertEqual(''.join(prog1.panel_chunks(in_chunks(self.html, size))), self.panel, size)
+            self.assertLessEqual(max(len(piece) for piece in prog1.panel_chunks(in_chunks(self.html, size))),
+                                 size + len(prog1.PANEL_START), size)
+        self.assertEqual(list(prog1.panel_chunks(in_chunks("<html>no panel here</html>", 4))), [])
+        unclosed = "<p>" + prog1.PANEL_START + "<p>text</p>"
+        self.assertEqual(''.join(prog1.panel_chunks(in_chunks(unclosed, 3))), unclosed[3:])
+
+    def test_same_fields_as_the_whole_page(self):
+        expected = ic.extract_fields(self.text, prog2.split_sections(self.text))
+        for size in (7, prog1.CHUNK_SIZE):
+            fields, page_hash, panel = prog1.read_panel(in_chunks(self.html, size))
+            self.assertEqual(fields, expected, size)
+            self.assertEqual(page_hash, prog2.source_hash(self.html))
+            self.assertIsNone(panel)
+        self.assertEqual(list(fields), list(ic.PROFILE_FIELD_NAMES))
+        with mock.patch('builtins.print'):
+            self.assertEqual(prog1.read_panel(in_chunks(self.html, 100), verbose=True)[2], self.panel)
+
+    def test_sections_are_emitted_as_soon_as_they_end(self):
+        parser = prog1.ProfileStreamParser()
+        sections_done = []
+        largest_held = 0
+        for piece in prog1.panel_chunks(in_chunks(self.html, 64)):
+            parser.feed(piece)
+            largest_held = max(largest_held, len(parser._text))
+            sections_done.extend(event.section for event in parser.take_events() if event.section not in sections_done)
+            if "## Personal Information" in parser._text and "## Committee Assignments" not in parser._text:
+                self.assertIn("contact", sections_done)     # Ended by the personal heading
+                self.assertIn("district", sections_done)
+        parser.close()
+        sections_done.extend(event.section for event in parser.take_events() if event.section not in sections_done)
+        self.assertEqual(sorted(sections_done), sorted(prog2.SECTION_ENDS))
+        self.assertLess(largest_held, len(self.text) * 2 // 3)    # Never the whole profile at once
+
+    def test_time_budget(self):
+        fields, _, _ = prog1.read_panel(in_chunks(self.html, prog1.CHUNK_SIZE), time_budget=0)
+        self.assertEqual(set(fields.values()), {None})
+        snapshot = prog2.take_snapshot(fields, prog2.RAW_PAGE, None)
+        self.assertEqual(prog2.parse_info(snapshot, "Contact Info:phone"), ic.UNRETRIEVED)
+        self.assertEqual(prog2.parse_info(snapshot, "Personal Info:education"), ic.UNRETRIEVED)
+        with mock.patch.object(ic, 'extract_fields', wraps=ic.extract_fields) as extract:
+            prog1.read_panel(in_chunks(self.html, prog1.CHUNK_SIZE))
+        self.assertEqual({call.args[2] for call in extract.call_args_list}, {prog1.INGESTION_TIME_BUDGET})
+
+    def test_snapshot_of_the_local_copy(self):
+        snapshot = prog1.snapshot_local_copy(os.path.join(ROOT_DIR, 'data', prog2.RAW_PAGE), prog2.RAW_PAGE)
+        self.assertEqual(snapshot.source_hash, prog2.source_hash(self.html))
+        self.assertEqual(snapshot.answers["all"], prog2.parse_info(self.text, "All"))
+        self.assertEqual(prog2.parse_info(snapshot, "Contact Info:phone"), "(803) 212-6945")
+
+    def test_response_chunks(self):
+        body = "Représentant ".encode('utf-8') * 2000     # Multi-byte characters split across reads
+        copy = io.StringIO()
+        self.assertEqual(''.join(prog1.response_chunks(io.BytesIO(body), copy_to=copy)), body.decode('utf-8'))
+        self.assertEqual(copy.getvalue(), body.decode('utf-8'))
+
+
+if __name__ == "__main__":
+    unittest.main()
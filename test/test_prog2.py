@@ -0,0 +1,157 @@
+#----------------------------------------------------------------------------
+# Created By  : Zt572
+# Created Date: Oct 2026
+# version ='1.0'
+# Copyright Oct 2026
+# ---------------------------------------------------------------------------
+""" Tests for prog2's processing of a representative's page. Run them from the repository root with: python -m pytest test"""
+# ---------------------------------------------------------------------------
+import os
+import pickle
+import shutil
+import sys
+import tempfile
+import unittest
+from unittest import mock
+# ---------------------------------------------------------------------------
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+from chatbotparts import prog1, prog2
+from chatbotparts.config.definitions import ROOT_DIR
+from chatbotparts.infocontainer import pagetext
+# ---------------------------------------------------------------------------
+
+
+def stored_page_text():
+    """Returns the structured text of the mainwidepanel region of the stored page."""
+    with open(os.path.join(ROOT_DIR, 'data', prog2.RAW_PAGE), 'r', newline='') as f:
+        html = f.read()
+    return pagetext.page_text(html[html.find(prog1.PANEL_START):html.find(prog1.PANEL_END)])
+
+
+class SplitSectionsTest(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.text = stored_page_text()
+
+    def test_sections_of_the_stored_page(self):
+        sections = prog2.split_sections(self.text)
+        self.assertEqual(set(sections), set(prog2.SECTION_ENDS))
+        contact_start, contact_end = sections["contact"]
+        self.assertTrue(self.text.startswith("# Representative Russell L. Ott", contact_start))
+        self.assertTrue(self.text.startswith("## Personal Information", contact_end))
+        self.assertEqual(sections["personal"][0], contact_end)
+        self.assertTrue(self.text.startswith("## Committee Assignments", sections["personal"][1]))
+        self.assertTrue(self.text.startswith("## Service In Public Office", sections["service"][0]))
+        self.assertEqual(sections["service"][1], len(self.text))
+        self.assertTrue(self.text.startswith("District 93", sections["district"][0]))
+        self.assertEqual(sections["district"][1], contact_end)
+
+    def test_only_the_first_heading_counts(self):
+        text = "# Rep\nDistrict 1\n## Personal Information\n- Born May 1\n## Personal Information\nDistrict 2\n"
+        sections = prog2.split_sections(text)
+        self.assertEqual(sections["personal"], (text.index("## Personal"), len(text)))
+        self.assertEqual(sections["district"], (text.index("District 1"), text.index("## Personal")))
+
+    def test_failsafes(self):
+        text = "## Personal Information\n- Born May 1\n# Rep\n"
+        sections = prog2.split_sections(text)
+        self.assertEqual(sections["service"], (0, len(text)))     # No heading: the whole page
+        self.assertEqual(sections["district"], (0, len(text)))
+        self.assertEqual(sections["personal"], (0, len(text)))    # No end heading: runs to the end of the page
+        self.assertEqual(sections["contact"], (text.index("# Rep"), len(text)))    # Ends before it starts
+        self.assertEqual(prog2.split_sections(""), dict.fromkeys(prog2.SECTION_ENDS, (0, 0)))
+
+    def test_containers_only_scan_their_own_section(self):
+        containers = prog2.make_containers(self.text)
+        sections = prog2.split_sections(self.text)
+        for category, section in (("contact info", "contact"), ("personal info", "personal"),
+                                  ("service", "service"), ("district", "district")):
+            self.assertEqual(containers[category].get_span(), sections[section])
+        # "Born March 26" is only in the personal section, so only its container finds it
+        self.assertEqual(containers["personal info"].search("birthday"), "Born March 26")
+        self.assertEqual(prog2.parse_info(self.text, "Personal Info:birthday"), "Born March 26")
+        self.assertEqual(prog2.parse_info(self.text, "District:district name"), "District 93")
+        self.assertIsNone(prog2.parse_info(self.text, "Hobbies"))
+
+
+class SnapshotTest(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        os.mkdir(os.path.join(self.directory, 'data'))
+        shutil.copy(os.path.join(ROOT_DIR, 'data', prog2.RAW_PAGE), os.path.join(self.directory, 'data', prog2.RAW_PAGE))
+        self.source_path = os.path.join(self.directory, 'data', prog2.RAW_PAGE)
+        self.snapshot_path = os.path.join(self.directory, 'data', 'profile.pkl')
+        patcher = mock.patch.object(prog2, 'ROOT_DIR', self.directory)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def tearDown(self):
+        shutil.rmtree(self.directory)
+
+    def load(self):
+        """Loads the test snapshot, returning it and the number of times a page was hashed and a snapshot taken."""
+        with mock.patch.object(prog2, 'source_hash', wraps=prog2.source_hash) as hashed, \
+             mock.patch.object(prog1, 'snapshot_local_copy', wraps=prog1.snapshot_local_copy) as taken:
+            snapshot = prog2.load_snapshot('profile.pkl')
+        return snapshot, hashed.call_count, taken.call_count
+
+    def test_round_trip(self):
+        snapshot = prog1.snapshot_local_copy(self.source_path, prog2.RAW_PAGE)
+        self.assertEqual(snapshot.version, prog2.SNAPSHOT_VERSION)
+        self.assertEqual(snapshot.source_stamp, prog2.source_stamp(self.source_path))
+        prog2.save_snapshot(snapshot, self.snapshot_path)
+        self.assertEqual(prog2.read_snapshot(self.snapshot_path), snapshot)
+        self.assertEqual(prog2.parse_info(snapshot, "Contact Info:phone"), "(803) 212-6945")
+        self.assertEqual(prog2.parse_info(snapshot, "personal info:birthday"), snapshot.answers["personal info:birthday"])
+
+        for stored in (dict(snapshot._asdict(), version=prog2.SNAPSHOT_VERSION - 1), "<html>raw page</html>"):
+            with open(self.snapshot_path, 'wb') as f:
+                pickle.dump(stored, f)
+            self.assertIsNone(prog2.read_snapshot(self.snapshot_path))
+
+    def test_unchanged_source_isnt_hashed(self):
+        snapshot, hashed, taken = self.load()
+        self.assertEqual((hashed, taken), (0, 1))   # Built (hashing the page as it's read), as it's missing
+        self.assertEqual(self.load(), (snapshot, 0, 0))
+
+        os.utime(self.source_path, ns=(1, 1))      # Touched, with the same page
+        touched, hashed, taken = self.load()
+        self.assertEqual((hashed, taken), (1, 0))
+        self.assertEqual(touched.source_stamp, prog2.source_stamp(self.source_path))
+        self.assertEqual(touched.answers, snapshot.answers)
+        self.assertEqual(self.load(), (touched, 0, 0))     # The new stamp was stored
+
+    def test_changed_source_is_rebuilt(self):
+        snapshot, _, _ = self.load()
+        with open(self.source_path, 'r', newline='') as f:
+            html = f.read()
+        with open(self.source_path, 'w', newline='') as f:
+            f.write(html.replace("(803) 212-6945", "(803) 212-7000"))
+        rebuilt, hashed, taken = self.load()
+        self.assertEqual((hashed, taken), (1, 1))   # Checked, then rebuilt
+        self.assertNotEqual(rebuilt.source_hash, snapshot.source_hash)
+        self.assertEqual(prog2.parse_info(rebuilt, "Contact Info:phone"), "(803) 212-7000")
+
+    def test_missing_source(self):
+        snapshot, _, _ = self.load()
+        os.remove(self.source_path)
+        self.assertEqual(self.load(), (snapshot, 0, 0))     # Used as it is
+
+        with open(self.snapshot_path, 'wb') as f:
+            pickle.dump("<html>a raw page, as stored by older versions</html>", f)
+        with self.assertRaisesRegex(ValueError, "stale snapshot of an older format"):
+            prog2.load_snapshot('profile.pkl')
+        with mock.patch('builtins.print') as print_mock, self.assertRaises(SystemExit):
+            prog2.load_data('profile.pkl')
+        self.assertNotIn("could not be found in 'data'. Place", print_mock.call_args[0][0])
+        self.assertIn(prog2.RAW_PAGE, print_mock.call_args[0][0])
+
+        os.remove(self.snapshot_path)
+        with self.assertRaises(FileNotFoundError):
+            prog2.load_snapshot('profile.pkl')
+
+
+if __name__ == "__main__":
+    unittest.main()
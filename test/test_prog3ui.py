@@ -0,0 +1,49 @@
+#----------------------------------------------------------------------------
+# Created By  : Zt572
+# Created Date: Oct 2026
+# version ='1.0'
+# Copyright Oct 2026
+# ---------------------------------------------------------------------------
+""" Tests for the chatbot UI's intent matching. Run them from the repository root with: python -m pytest test
+They need the pandas package the UI logs chats with, and are skipped without it."""
+# ---------------------------------------------------------------------------
+import json
+import os
+import sys
+import unittest
+# ---------------------------------------------------------------------------
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+from chatbotparts.config.definitions import ROOT_DIR
+from chatbotparts.prog4fuzzy import normalize_response
+try:
+    from chatbotparts import prog3ui
+except ImportError:     # pandas isn't installed
+    prog3ui = None
+# ---------------------------------------------------------------------------
+
+
+@unittest.skipIf(prog3ui is None, "the chatbot UI needs pandas")
+class ExtractInfoTypeTest(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        with open(os.path.join(ROOT_DIR, 'src', 'chatbotparts', 'config', 'config.json'), 'r') as f:
+            cls.known_queries = json.load(f)
+
+    def test_match_options_follow_the_config(self):
+        options = prog3ui.build_match_options(self.known_queries, 0.25)
+        self.assertEqual(options.time_budget, 0.25)
+        self.assertEqual(options.index is not None, prog3ui.MATCH_WITH_TRIE_INDEX)
+        self.assertEqual(options.hierarchy is not None, prog3ui.MATCH_WITH_HIERARCHY)
+
+    def test_answers_match_unoptimized_matching(self):
+        options = prog3ui.build_match_options(self.known_queries)
+        for response in ("where does he live", "what is the reps phone numbr", "tell me everything", "hello"):
+            self.assertEqual(prog3ui.extract_info_type(normalize_response(response), self.known_queries, options)[:3],
+                             prog3ui.extract_info_type(response, self.known_queries)[:3])
+        self.assertEqual(prog3ui.extract_info_type("where does he live", self.known_queries, options)[:2],
+                         ("Contact Info:home address", True))
+
+
+if __name__ == "__main__":
+    unittest.main()
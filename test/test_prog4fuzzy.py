@@ -0,0 +1,211 @@
+#----------------------------------------------------------------------------
+# Created By  : Zt572
+# Created Date: Oct 2026
+# version ='1.0'
+# Copyright Oct 2026
+# ---------------------------------------------------------------------------
+""" Tests for prog4fuzzy's intent matching. Run them from the repository root with: python -m pytest test"""
+# ---------------------------------------------------------------------------
+import asyncio
+import json
+import os
+import random
+import sys
+import unittest
+from concurrent.futures import ProcessPoolExecutor
+# ---------------------------------------------------------------------------
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+from chatbotparts.config.definitions import ROOT_DIR
+from chatbotparts.intentstore.compiled import CompiledIntentIndex
+from chatbotparts.prog4fuzzy import (DEFAULT_SYNONYMS, FULL_TIER, INDEX_ONLY_TIER, MATCH_TIERS, QRATIO_TIER, TOKEN_SORT_TIER,
+                                     IntentHierarchy, IntentSuggestionSession, MatchingLoadPolicy, MatchOptions, map_intent,
+                                     map_intent_async, normalize_response)
+# ---------------------------------------------------------------------------
+
+
+def load_known_queries():
+    with open(os.path.join(ROOT_DIR, 'src', 'chatbotparts', 'config', 'config.json'), 'r') as f:
+        return json.load(f)
+
+
+class MapIntentTest(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.known_queries = load_known_queries()
+
+    def test_matches(self):
+        self.assertEqual(tuple(map_intent("where does he live", self.known_queries)),
+                         ('where does the representative live', True))
+        self.assertEqual(tuple(map_intent("who is my congressman", self.known_queries)),
+                         ('who is the representative', True))
+        self.assertEqual(tuple(map_intent("xyz", self.known_queries)), (None, False))
+
+    def test_time_budget(self):
+        for response in ("what is his phone numbr", "tell me everything", "xyz"):
+            match = map_intent(response, self.known_queries, options=MatchOptions(time_budget=10))
+            self.assertFalse(match.partial)
+            self.assertEqual(tuple(match), tuple(map_intent(response, self.known_queries)))
+        match = map_intent("tell me everything", self.known_queries, options=MatchOptions(time_budget=0))
+        self.assertTrue(match.partial)
+        self.assertEqual(tuple(match), ("tell me everything", True))
+
+
+class MatchingLoadPolicyTest(unittest.TestCase):
+
+    def test_concurrency_moves_down_a_tier_per_threshold(self):
+        policy = MatchingLoadPolicy(latency_thresholds=(1, 2, 3), concurrency_thresholds=(1, 2, 3))
+        self.assertEqual([policy.acquire() for _ in range(4)], [FULL_TIER, TOKEN_SORT_TIER, QRATIO_TIER, INDEX_ONLY_TIER])
+        self.assertEqual(policy.get_tier(), INDEX_ONLY_TIER)
+
+    def test_latency_and_recovery(self):
+        policy = MatchingLoadPolicy(latency_thresholds=(0.1, 0.2, 0.3), concurrency_thresholds=(100, 100, 100),
+                                    recovery_ratio=0.5, window=1)
+        policy.acquire()
+        policy.release(0.25)
+        self.assertEqual(policy.acquire(), QRATIO_TIER)
+        policy.release(0.12)    # Under the thresholds, but not under half of them: no flapping back up
+        self.assertEqual(policy.acquire(), QRATIO_TIER)
+        policy.release(0.06)
+        self.assertEqual(policy.acquire(), TOKEN_SORT_TIER)
+        policy.release(0.01)
+        self.assertEqual(policy.acquire(), FULL_TIER)
+
+    def test_map_intent_reports_the_tier(self):
+        known_queries = load_known_queries()
+        policy = MatchingLoadPolicy(concurrency_thresholds=(0, 0, 0))   # Any match at all is too many
+        match = policy.map_intent("where does the representative live", known_queries)
+        self.assertEqual((tuple(match), match.tier), (("where does the representative live", True), INDEX_ONLY_TIER))
+        self.assertEqual(policy.map_intent("xyz", known_queries).tier, INDEX_ONLY_TIER)
+        for tier in MATCH_TIERS[:-1]:
+            self.assertEqual(tuple(map_intent("where does he live", known_queries, options=MatchOptions(tier=tier))),
+                             ("where does the representative live", True), tier)
+
+
+class IndexOnlyTierTest(unittest.TestCase):
+
+    def test_dictionary_matches_the_compiled_index(self):
+        known_queries = load_known_queries()
+        index = CompiledIntentIndex(known_queries, DEFAULT_SYNONYMS)
+        options = MatchOptions(tier=INDEX_ONLY_TIER)
+        for query in known_queries:
+            for response in (query, query.upper() + "?!"):
+                self.assertEqual(tuple(map_intent(response, known_queries, options=options)),
+                                 tuple(map_intent(response, index, options=options)), response)
+        self.assertEqual(tuple(map_intent("ALL INFORMATION on the representative", known_queries, options=options)),
+                         ("All information on the representative", True))
+        self.assertEqual(tuple(map_intent("where does he sleep?", known_queries, options=options)), (None, False))
+
+    def test_edited_dictionary(self):
+        known_queries = load_known_queries()
+        options = MatchOptions(tier=INDEX_ONLY_TIER)
+        self.assertEqual(tuple(map_intent("Who is the SPEAKER", known_queries, options=options)), (None, False))
+        known_queries["Who is the Speaker?"] = "Name"   # The lookup of the previous call must not be reused
+        self.assertEqual(tuple(map_intent("Who is the SPEAKER", known_queries, options=options)), ("Who is the Speaker?", True))
+
+
+class IntentHierarchyTest(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.known_queries = load_known_queries()
+        cls.hierarchy = IntentHierarchy(cls.known_queries)
+
+    def test_categories_and_candidates(self):
+        self.assertEqual(set(self.hierarchy.get_categories()),
+                         {info_type.split(':')[0] for info_type in self.known_queries.values()})
+        candidates = IntentHierarchy(self.known_queries, margin=0).candidates(normalize_response("what is his phone number"), 1)
+        self.assertEqual({self.known_queries[query].split(':')[0] for query in candidates}, {"Contact Info"})
+
+    def test_too_close_to_call(self):
+        hierarchy = IntentHierarchy(self.known_queries, margin=100)
+        self.assertIsNone(hierarchy.candidates(normalize_response("what is his phone number"), 1))
+
+    def test_falls_back_to_the_flat_scan(self):
+        # A hierarchy kept to a single category can't find the others' queries without the flat scan
+        options = MatchOptions(hierarchy=IntentHierarchy(self.known_queries, margin=-1), top_categories=1)
+        for response in ("tell me everything", "what committees is he on", "when was he born"):
+            self.assertEqual(tuple(map_intent(response, self.known_queries, options=options)),
+                             tuple(map_intent(response, self.known_queries)))
+
+    def test_typos_match_the_flat_scan(self):
+        rng = random.Random(7)
+        options = MatchOptions(hierarchy=self.hierarchy)
+        for query in list(self.known_queries) * 2:
+            typo = list(query.lower())
+            for _ in range(4):
+                typo[rng.randrange(len(typo))] = rng.choice("abcdefghijklmnop ")
+            typo = ''.join(typo)
+            self.assertEqual(tuple(map_intent(typo, self.known_queries, options=options)),
+                             tuple(map_intent(typo, self.known_queries)), typo)
+
+
+def prefix_distance(text, query):
+    """The edit distance between text and the closest prefix of query, computed from scratch."""
+    previous = list(range(len(query) + 1))
+    for i, char in enumerate(text.lower(), 1):
+        current = [i]
+        for j, query_char in enumerate(query.lower(), 1):
+            current.append(min(current[j - 1] + 1, previous[j] + 1, previous[j - 1] + (query_char != char)))
+        previous = current
+    return min(previous)
+
+
+class IntentSuggestionSessionTest(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.known_queries = load_known_queries()
+
+    def expected_suggestions(self, text, max_edits=3):
+        distances = [(prefix_distance(text, query), query) for query in self.known_queries]
+        return sorted(distance for distance in distances if distance[0] <= max_edits)
+
+    def test_suggestions_as_you_type(self):
+        session = IntentSuggestionSession(self.known_queries, limit=100)
+        self.assertEqual(session.suggestions(), [])
+        for text in ("w", "wh", "whe", "wher", "where d", "where does the rep", "where does the repx"):
+            suggestions = session.set_text(text)
+            self.assertEqual(sorted((distance, query) for query, distance in suggestions), self.expected_suggestions(text))
+        self.assertEqual(session.get_text(), "where does the repx")
+
+    def test_delete_restores_dropped_queries(self):
+        session = IntentSuggestionSession(self.known_queries, max_edits=1, limit=3)
+        session.append("tell me")
+        self.assertEqual(session.append("xxxx"), [])
+        self.assertEqual(session.delete(4), IntentSuggestionSession(self.known_queries, max_edits=1, limit=3).append("tell me"))
+        self.assertEqual(session.get_text(), "tell me")
+
+    def test_limit_and_order(self):
+        session = IntentSuggestionSession(self.known_queries, limit=2)
+        suggestions = session.append("where does the representative l")
+        self.assertEqual(suggestions[0], ("where does the representative live", 0))
+        self.assertEqual(len(suggestions), 2)
+
+    def test_submit_matches_map_intent(self):
+        session = IntentSuggestionSession(self.known_queries)
+        session.set_text("Where does he live")
+        self.assertEqual(tuple(session.submit()), tuple(map_intent("where does he live", self.known_queries)))
+
+
+class MapIntentAsyncTest(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.known_queries = load_known_queries()
+        cls.responses = ["what is his phone numbr", "tell me everything", "where does he live?", "xyz"]
+
+    def test_process_pool_offload(self):
+        """Every scan is offloaded to a process pool (offload_threshold=1) with a plain known_queries dictionary."""
+        async def match_all(executor, options):
+            return [tuple(await map_intent_async(response, self.known_queries, options=options, executor=executor,
+                                                 offload_threshold=1)) for response in self.responses]
+
+        with ProcessPoolExecutor(max_workers=2) as executor:
+            for options in (MatchOptions(), MatchOptions(time_budget=10)):
+                expected = [tuple(map_intent(response, self.known_queries, options=options)) for response in self.responses]
+                self.assertEqual(asyncio.run(match_all(executor, options)), expected)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,97 @@
+#----------------------------------------------------------------------------
+# Created By  : Zt572
+# Created Date: Oct 2026
+# version ='1.0'
+# Copyright Oct 2026
+# ---------------------------------------------------------------------------
+""" Tests for the hot reloading of config.json. Run them from the repository root with: python -m pytest test"""
+# ---------------------------------------------------------------------------
+import json
+import os
+import shutil
+import sys
+import tempfile
+import unittest
+from unittest import mock
+# ---------------------------------------------------------------------------
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+from chatbotparts.intentstore.compiled import CONFIG_PATH
+from chatbotparts.intentstore.reloader import IntentIndexReloader
+from chatbotparts.prog4fuzzy import map_intent
+# ---------------------------------------------------------------------------
+
+
+class IntentIndexReloaderTest(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.config_path = os.path.join(self.directory, 'config.json')
+        shutil.copy(CONFIG_PATH, self.config_path)
+        with open(self.config_path, 'r') as f:
+            self.known_queries = json.load(f)
+
+    def tearDown(self):
+        shutil.rmtree(self.directory)
+
+    def write_config(self, known_queries, mtime_ns):
+        """Rewrites the test config, giving it a distinct mtime so the reloader notices even within a clock tick."""
+        with open(self.config_path, 'w') as f:
+            f.write(known_queries if isinstance(known_queries, str) else json.dumps(known_queries))
+        os.utime(self.config_path, ns=(mtime_ns, mtime_ns))
+
+    def test_unchanged_file_is_not_reloaded(self):
+        reloader = IntentIndexReloader(self.config_path)
+        index = reloader.get_index()
+        self.assertFalse(reloader.check())
+        self.write_config(self.known_queries, 1)    # Touched with the same known queries
+        self.assertFalse(reloader.check())
+        self.assertIs(reloader.get_index(), index)
+
+    def test_small_changes_go_to_the_overlay(self):
+        reloader = IntentIndexReloader(self.config_path)
+        old_index = reloader.get_index()
+        old_index.get_prescorer()   # Built before the change, so with_changes must copy its vocabulary
+        removed = next(iter(self.known_queries))
+        known_queries = dict(self.known_queries, **{"where does the speaker live": "Contact Info:home address"})
+        del known_queries[removed]
+        self.write_config(known_queries, 1)
+        self.assertTrue(reloader.check())
+
+        index = reloader.get_index()
+        self.assertEqual(dict(index), known_queries)
+        self.assertEqual(index.get_overlay_size(), 2)
+        self.assertIs(index.get_store(), old_index.get_store())
+        self.assertEqual(dict(old_index), self.known_queries)   # The old version is left as it was
+        self.assertIn("where does the speaker live", index.get_prescorer().vocabulary)
+        self.assertNotIn("where does the speaker live", old_index.get_prescorer().vocabulary)
+        self.assertEqual(tuple(map_intent("where does the speaker live", index)), ("where does the speaker live", True))
+
+    def test_many_changes_compact_the_index(self):
+        reloader = IntentIndexReloader(self.config_path, compaction_ratio=0.25)
+        old_store = reloader.get_index().get_store()
+        known_queries = {query: "All" for query in self.known_queries}      # Every known query retyped
+        self.write_config(known_queries, 1)
+        self.assertTrue(reloader.check())
+        index = reloader.get_index()
+        self.assertEqual(dict(index), known_queries)
+        self.assertEqual(index.get_overlay_size(), 0)
+        self.assertIsNot(index.get_store(), old_store)
+
+    def test_broken_file_keeps_the_index(self):
+        reloader = IntentIndexReloader(self.config_path)
+        index = reloader.get_index()
+        for mtime_ns, contents in enumerate(('{"where does he live": ', '["a list"]', '{"where does he live": 1}'), 1):
+            self.write_config(contents, mtime_ns)
+            with mock.patch('builtins.print') as print_mock:
+                self.assertFalse(reloader.check())
+                self.assertFalse(reloader.check())      # Only reported once per edit
+            self.assertEqual(print_mock.call_count, 1)
+            self.assertIs(reloader.get_index(), index)
+
+        self.write_config(dict(self.known_queries, speaker="Name"), 10)     # Fixed, so it is picked up again
+        self.assertTrue(reloader.check())
+        self.assertEqual(reloader.get_index()["speaker"], "Name")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,66 @@
+#----------------------------------------------------------------------------
+# Created By  : Zt572
+# Created Date: Oct 2026
+# version ='1.0'
+# Copyright Oct 2026
+# ---------------------------------------------------------------------------
+""" Tests that profile field extraction stays linear and within its time budget. Run them from the repository root with: python -m pytest test"""
+# ---------------------------------------------------------------------------
+import os
+import sys
+import time
+import unittest
+from unittest import mock
+# ---------------------------------------------------------------------------
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+from chatbotparts import prog2
+from chatbotparts.infocontainer import infocontainer as ic
+from chatbotparts.infocontainer import stress
+from test_prog2 import stored_page_text
+# ---------------------------------------------------------------------------
+
+
+def best_time(page, repeat=3):
+    return min(stress.time_extraction(page)[0] for _ in range(repeat))
+
+
+class LinearExtractionTest(unittest.TestCase):
+
+    def test_adversarial_pages_are_linear(self):
+        # Four times the page should take about four times as long; a quadratic pattern would take sixteen
+        for name, filler in stress._FILLERS.items():
+            small = best_time(stress.adversarial_page(filler, 50000))
+            large = best_time(stress.adversarial_page(filler, 200000))
+            self.assertLess(large / small, 8, name)
+
+    def test_fuzzed_pages(self):
+        with mock.patch('builtins.print') as print_mock:
+            self.assertEqual(stress.run_fuzz(stored_page_text(), 100, prog2.EXTRACTION_TIME_BUDGET), 0)
+        self.assertIn("0 failures", print_mock.call_args[0][0])
+
+
+class TimeBudgetTest(unittest.TestCase):
+
+    def test_out_of_time_fields_are_unretrieved(self):
+        page = stress.adversarial_page(stress._FILLERS["digit runs"], 4000000)
+        start = time.perf_counter()
+        fields = ic.extract_fields(page, prog2.split_sections(page), time_budget=0.01)
+        self.assertLess(time.perf_counter() - start, 0.5)
+        self.assertIn(None, fields.values())
+
+        fields = ic.extract_fields(page, time_budget=0)
+        self.assertEqual(set(fields.values()), {None})
+        with mock.patch.object(prog2, 'EXTRACTION_TIME_BUDGET', 0):
+            containers = prog2.make_containers(page)
+        self.assertEqual(containers["contact info"].search("phone"), ic.UNRETRIEVED)
+        self.assertEqual(containers["personal info"].search("education"), ic.UNRETRIEVED)
+        self.assertEqual(containers["service"].search("service"), ic.UNRETRIEVED)
+
+    def test_budget_doesnt_change_what_is_found(self):
+        text = stored_page_text()
+        self.assertEqual(ic.extract_fields(text, prog2.split_sections(text), time_budget=prog2.EXTRACTION_TIME_BUDGET),
+                         ic.extract_fields(text, prog2.split_sections(text)))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,81 @@
+#----------------------------------------------------------------------------
+# Created By  : Zt572
+# Created Date: Oct 2026
+# version ='1.0'
+# Copyright Oct 2026
+# ---------------------------------------------------------------------------
+""" Tests for thefuzz's token-level edit distance. Run them from the repository root with: python -m pytest test"""
+# ---------------------------------------------------------------------------
+import os
+import sys
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+# ---------------------------------------------------------------------------
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+from chatbotparts.thefuzz import fuzz, process
+from chatbotparts.thefuzz.token_edit import TokenEditScorer, TokenVocabulary, token_distance
+# ---------------------------------------------------------------------------
+
+KNOWN_QUERIES = [
+    "what is the representative's phone number",
+    "where does the representative live",
+    "where does the representative work",
+    "tell me everything",
+    "what committees is the representative on",
+]
+
+
+class TokenEditRatioTest(unittest.TestCase):
+
+    def test_token_distance(self):
+        self.assertEqual(token_distance([1, 2, 3], [1, 2, 3]), 0)
+        self.assertEqual(token_distance([1, 2, 3], [1, 4, 3]), 1)
+        self.assertEqual(token_distance([1, 2, 3], [2, 3]), 1)
+        self.assertEqual(token_distance([], [5, 6]), 2)
+
+    def test_ratio_counts_whole_tokens(self):
+        self.assertEqual(fuzz.token_edit_ratio("tell me everything", "Tell me EVERYTHING!"), 100)
+        self.assertEqual(fuzz.token_edit_ratio("where does he live", "where does she live"), 75)
+        self.assertEqual(fuzz.token_edit_ratio("where does he live", "where does he"), 75)
+        self.assertEqual(fuzz.token_edit_ratio("tell me everything", ""), 0)
+
+
+class TokenEditScorerTest(unittest.TestCase):
+
+    def setUp(self):
+        self.scorer = TokenEditScorer(TokenVocabulary(KNOWN_QUERIES))
+
+    def test_scores_match_token_edit_ratio(self):
+        for query in ("where does he live", "what is his phone number", "committees", "tell me everything please"):
+            for known in KNOWN_QUERIES:
+                self.assertEqual(self.scorer(query, known), fuzz.token_edit_ratio(query, known), (query, known))
+
+    def test_ranking(self):
+        best = process.extractOne("where does the representative live now", KNOWN_QUERIES, scorer=self.scorer)
+        self.assertEqual(best, ("where does the representative live", 83))
+        ranked = [choice for choice, _ in process.extract("where does the representative work", KNOWN_QUERIES,
+                                                            scorer=self.scorer, limit=2)]
+        self.assertEqual(ranked, ["where does the representative work", "where does the representative live"])
+
+    def test_unknown_tokens_only_match_each_other(self):
+        self.assertEqual(self.scorer("foo bar", "foo bar"), 100)
+        self.assertEqual(self.scorer("foo bar", "baz qux"), 0)
+
+    def test_shared_between_threads(self):
+        queries = ["where does he live", "what is his phone number", "tell me everything", "what committees"] * 50
+        expected = [[fuzz.token_edit_ratio(query, known) for known in KNOWN_QUERIES] for query in queries]
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            scored = list(executor.map(lambda query: [self.scorer(query, known) for known in KNOWN_QUERIES], queries))
+        self.assertEqual(scored, expected)
+
+    def test_vocabulary_copy_is_independent(self):
+        vocabulary = TokenVocabulary(KNOWN_QUERIES)
+        copy = vocabulary.copy()
+        copy.add("who is the speaker")
+        self.assertIn("who is the speaker", copy)
+        self.assertNotIn("who is the speaker", vocabulary)
+        self.assertEqual(len(vocabulary) + 2, len(copy))
+
+
+if __name__ == "__main__":
+    unittest.main()
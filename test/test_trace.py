@@ -0,0 +1,101 @@
+#----------------------------------------------------------------------------
+# Created By  : Zt572
+# Created Date: Oct 2026
+# version ='1.0'
+# Copyright Oct 2026
+# ---------------------------------------------------------------------------
+""" Tests for thefuzz's WRatio trace mode. Run them from the repository root with: python -m pytest test"""
+# ---------------------------------------------------------------------------
+import json
+import os
+import random
+import sys
+import unittest
+# ---------------------------------------------------------------------------
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+from chatbotparts.config.definitions import ROOT_DIR
+from chatbotparts.prog4fuzzy import MatchOptions, map_intent
+from chatbotparts.thefuzz import fuzz, process, utils
+from chatbotparts.thefuzz.trace import ScoreTrace
+# ---------------------------------------------------------------------------
+
+
+class ScoreTraceTest(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        with open(os.path.join(ROOT_DIR, 'src', 'chatbotparts', 'config', 'config.json'), 'r') as f:
+            cls.known_queries = json.load(f)
+
+    def test_scores_are_unchanged(self):
+        rng = random.Random(0)
+        queries = list(self.known_queries)
+        trace = ScoreTrace()
+        for _ in range(300):
+            s1 = rng.choice(queries)
+            s2 = ' '.join(rng.sample(rng.choice(queries).split(), rng.randint(1, 3)))
+            self.assertEqual(trace.WRatio(s1, s2), fuzz.WRatio(s1, s2), (s1, s2))
+            self.assertEqual(trace.UWRatio(s2, s1), fuzz.UWRatio(s2, s1), (s2, s1))
+
+        for candidate in trace.candidates:
+            if candidate.branch == 'empty':
+                continue
+            self.assertEqual(candidate.subscores[0].name, 'ratio')
+            self.assertEqual(len(candidate.subscores), 3 if candidate.branch == 'token' else 4)
+            winner = next(subscore for subscore in candidate.subscores if subscore.name == candidate.winner)
+            self.assertEqual(utils.intr(winner.raw * winner.scale), candidate.score)
+
+    def test_branches_and_scales(self):
+        trace = ScoreTrace()
+        trace.WRatio("where does the representative live", "where does the representative work")
+        trace.WRatio("phone number", "what is the representative's phone number")
+        trace.WRatio("live", "where does the representative live")
+        trace.WRatio("!!", "where does the representative live")
+        token, partial, far, empty = trace.candidates
+        self.assertEqual((token.branch, partial.branch, far.branch, empty.branch), ('token', 'partial', 'partial', 'empty'))
+        self.assertEqual([subscore.scale for subscore in token.subscores], [1.0, fuzz.TOKEN_SCALE, fuzz.TOKEN_SCALE])
+        self.assertEqual([subscore.name for subscore in partial.subscores],
+                         ['ratio', 'partial_ratio', 'partial_token_sort_ratio', 'partial_token_set_ratio'])
+        self.assertEqual(partial.subscores[1].scale, fuzz.PARTIAL_SCALE)
+        self.assertEqual(far.subscores[1].scale, fuzz.FAR_PARTIAL_SCALE)
+        self.assertAlmostEqual(far.subscores[2].scale, fuzz.TOKEN_SCALE * fuzz.FAR_PARTIAL_SCALE)
+        self.assertEqual((far.score, far.winner), (fuzz.WRatio("live", "where does the representative live"), 'partial_ratio'))
+
+    def test_totals(self):
+        trace = ScoreTrace(keep_candidates=False)
+        match = process.extractOne("what is the reps phone numbr", self.known_queries, trace=trace)
+        self.assertEqual(match, process.extractOne("what is the reps phone numbr", self.known_queries))
+        self.assertEqual(trace.candidates, [])
+        totals = trace.totals()
+        self.assertEqual(totals['candidates'], len(self.known_queries))
+        self.assertEqual(len(trace), len(self.known_queries))
+        self.assertEqual(sum(totals['branches'].values()), len(self.known_queries))
+        self.assertEqual(sum(totals['winners'].values()), len(self.known_queries))
+        self.assertEqual(totals['subscorers']['ratio']['calls'], len(self.known_queries))
+        self.assertEqual(totals['subscorers']['token_sort_ratio']['calls'], totals['branches'].get('token', 0))
+        subscorer_seconds = sum(subscorer['seconds'] for subscorer in totals['subscorers'].values())
+        self.assertLessEqual(subscorer_seconds, totals['seconds'])
+
+    def test_prepared_choices_and_map_intent(self):
+        prepared = process.PreparedChoices(self.known_queries)
+        trace = ScoreTrace()
+        self.assertEqual(process.extractOne("where does he live", prepared, trace=trace),
+                         process.extractOne("where does he live", self.known_queries))
+        self.assertGreater(len(trace), 0)
+        self.assertTrue(all(candidate.query == "where does he live" for candidate in trace.candidates))
+
+        trace = ScoreTrace()
+        match = map_intent("where does he live", self.known_queries, options=MatchOptions(trace=trace))
+        self.assertEqual(tuple(match), tuple(map_intent("where does he live", self.known_queries)))
+        self.assertIs(match.trace, trace)
+        self.assertEqual(len(trace), len(self.known_queries))
+
+    def test_other_scorers(self):
+        trace = ScoreTrace()
+        self.assertEqual(process.extract("phone", list(self.known_queries), scorer=fuzz.token_set_ratio),
+                         process.extract("phone", list(self.known_queries), scorer=trace.wrap(fuzz.token_set_ratio)))
+        self.assertEqual(trace.totals()['winners'], {'token_set_ratio': len(self.known_queries)})
+
+
+if __name__ == "__main__":
+    unittest.main()
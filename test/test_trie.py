@@ -0,0 +1,91 @@
+#----------------------------------------------------------------------------
+# Created By  : Zt572
+# Created Date: Oct 2026
+# version ='1.0'
+# Copyright Oct 2026
+# ---------------------------------------------------------------------------
+""" Tests for thefuzz's trie index of bounded-edit lookups. Run them from the repository root with: python -m pytest test"""
+# ---------------------------------------------------------------------------
+import os
+import random
+import sys
+import unittest
+# ---------------------------------------------------------------------------
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+from chatbotparts.prog4fuzzy import INDEX_ONLY_TIER, MatchOptions, map_intent
+from chatbotparts.thefuzz import utils
+from chatbotparts.thefuzz.trie import TrieIndex
+# ---------------------------------------------------------------------------
+
+KNOWN_QUERIES = {
+    "where does the representative live": "Contact Info:home address",
+    "where does the representative work": "Contact Info:columbia address",
+    "what is the representative's phone number": "Contact Info:phone",
+    "tell me everything": "All",
+}
+
+
+def levenshtein(a, b):
+    previous = list(range(len(b) + 1))
+    for i, x in enumerate(a, 1):
+        current = [i]
+        for j, y in enumerate(b, 1):
+            current.append(min(previous[j] + 1, current[j - 1] + 1, previous[j - 1] + (x != y)))
+        previous = current
+    return previous[-1]
+
+
+class TrieIndexTest(unittest.TestCase):
+
+    def test_hits_within_max_edits(self):
+        index = TrieIndex(KNOWN_QUERIES)
+        self.assertEqual(index.search("tell me everythin"), [("tell me everything", 1)])
+        self.assertEqual(index.search("Where does the representative LIVE?"), [("where does the representative live", 0)])
+        self.assertEqual(index.search("where does the representative wirk", 3),
+                         [("where does the representative work", 1), ("where does the representative live", 3)])
+        self.assertEqual(index.search("tell me everything about him"), [])
+
+    def test_matches_brute_force(self):
+        rng = random.Random(0)
+        words = ["cat", "cart", "care", "dog", "dig", "do", "a", "ab", "abc", "bca"]
+        choices = {' '.join(rng.choice(words) for _ in range(rng.randint(1, 3))) for _ in range(200)}
+        index = TrieIndex(choices, processor=None)
+        for _ in range(100):
+            query = ' '.join(rng.choice(words) for _ in range(rng.randint(1, 3)))
+            for max_edits in (0, 1, 2):
+                expected = sorted((choice, levenshtein(query, choice)) for choice in choices
+                                  if levenshtein(query, choice) <= max_edits)
+                hits = index.search(query, max_edits)
+                self.assertEqual(sorted(hits), expected)
+                self.assertEqual([hit[1] for hit in hits], sorted(hit[1] for hit in hits))
+
+    def test_add_and_contains(self):
+        index = TrieIndex()
+        index.add("Tell me everything!")
+        index.add("Tell me everything!")
+        index.add("tell me everything")
+        self.assertEqual(len(index), 2)
+        self.assertIn("tell me everything", index)
+        self.assertNotIn("tell me", index)
+        self.assertEqual(index.search(utils.NormalizedQuery("TELL ME EVERYTHING"), 0),
+                         [("Tell me everything!", 0), ("tell me everything", 0)])
+
+
+class MapIntentIndexTest(unittest.TestCase):
+
+    def test_index_narrows_scoring(self):
+        options = MatchOptions(index=TrieIndex(KNOWN_QUERIES))
+        for response in ("where does the representative liv", "what is the representatives phone numbr", "xyz"):
+            self.assertEqual(tuple(map_intent(response, KNOWN_QUERIES, options=options)),
+                             tuple(map_intent(response, KNOWN_QUERIES)))
+
+    def test_index_only_tier(self):
+        options = MatchOptions(index=TrieIndex(KNOWN_QUERIES), tier=INDEX_ONLY_TIER)
+        self.assertEqual(tuple(map_intent("tell me everythin", KNOWN_QUERIES, options=options)), ("tell me everything", True))
+        self.assertEqual(tuple(map_intent("where does he live", KNOWN_QUERIES, options=options)),
+                         ("where does the representative live", True))    # The synonyms make it an exact hit
+        self.assertEqual(tuple(map_intent("tell me about his phone", KNOWN_QUERIES, options=options)), (None, False))
+
+
+if __name__ == "__main__":
+    unittest.main()